@@ -0,0 +1,20 @@
+"""Signals for the collections application."""
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from my_game_list.collections.models import CollectionItem
+from my_game_list.my_game_list.pagination import invalidate_cached_counts
+
+
+@receiver(post_save, sender=CollectionItem)
+@receiver(post_delete, sender=CollectionItem)
+def invalidate_collection_item_counts(
+    sender: type[CollectionItem],
+    instance: CollectionItem,
+    **kwargs: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Invalidate the cached counts of the item lists of the collection when an item is changed."""
+    invalidate_cached_counts(sender, instance.collection_id)
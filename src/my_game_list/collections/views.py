@@ -32,6 +32,7 @@
     CollectionSerializer,
 )
 from my_game_list.friendships.models import Friendship
+from my_game_list.my_game_list.pagination import CachedCountPagination
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -581,6 +582,12 @@ class CollectionItemViewSet(ModelViewSet[CollectionItem]):
     serializer_class = CollectionItemSerializer
     permission_classes = (IsAuthenticated, CollectionItemPermission)
     filterset_class = CollectionItemFilterSet
+    pagination_class = CachedCountPagination
+
+    def get_count_owner_id(self: Self) -> int | None:
+        """Get the ID of the collection the listed items are filtered by, None if they are not."""
+        owner_id = self.request.query_params.get("collection", "")
+        return int(owner_id) if owner_id.isdigit() else None
 
     def get_queryset(self: Self) -> QuerySet[CollectionItem]:
         """Get the queryset filtered by collection visibility.
@@ -7,6 +7,7 @@
 
 from my_game_list.games.models import (
     Company,
+    ExportJob,
     ExternalGameSource,
     Game,
     GameEngine,
@@ -18,6 +19,7 @@
     GameStatus,
     GameType,
     Genre,
+    IGDBImportCheckpoint,
     Platform,
     PlayerPerspective,
 )
@@ -65,6 +67,27 @@ class GameReviewAdmin(admin.ModelAdmin[GameReview]):
     list_display = (*readonly_fields, *list_filter, *raw_id_fields)
 
 
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin[ExportJob]):
+    """Admin model for the export job model."""
+
+    readonly_fields = ("id",)
+    search_fields = (*readonly_fields, "user__username")
+    raw_id_fields = ("user",)
+    list_filter = ("kind", "status", "created_at")
+    list_display = (*readonly_fields, *list_filter, *raw_id_fields, "entries_count", "finished_at")
+
+
+@admin.register(IGDBImportCheckpoint)
+class IGDBImportCheckpointAdmin(admin.ModelAdmin[IGDBImportCheckpoint]):
+    """Admin model for the IGDB import checkpoint model."""
+
+    readonly_fields = ("id",)
+    search_fields = (*readonly_fields, "endpoint")
+    list_filter = ("endpoint", "status", "started_at")
+    list_display = (*readonly_fields, *list_filter, "last_igdb_id", "imported_count", "finished_at")
+
+
 @admin.register(Game)
 class GameAdmin(TabbedTranslationAdmin[Game]):
     """Admin model for the game model."""
@@ -0,0 +1,90 @@
+"""Cache namespaces of the games application."""
+
+from typing import TYPE_CHECKING
+
+from my_game_list.games.models import (
+    ExternalGameSource,
+    Game,
+    GameCard,
+    GameEngine,
+    GameMedia,
+    GameMode,
+    GameStatus,
+    GameType,
+    Genre,
+    Platform,
+    PlayerPerspective,
+)
+from my_game_list.my_game_list.cache import build_cache_key, bump_cache_version, get_cache_version
+from my_game_list.my_game_list.filters import invalidate_dictionary_caches
+from my_game_list.my_game_list.pagination import invalidate_cached_counts
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+GAME_TITLE_SEARCH_CACHE_NAMESPACE = "games_title_search"
+"""The ranked game IDs matching a title search."""
+
+GAME_DETAIL_CACHE_NAMESPACE = "game_detail"
+"""The rendered game details, every game has also its own version bumped by the changes of its stats."""
+
+DICTIONARY_MODELS = (
+    Genre,
+    Platform,
+    GameMode,
+    PlayerPerspective,
+    GameEngine,
+    GameType,
+    GameStatus,
+    ExternalGameSource,
+    GameMedia,
+)
+"""The dictionaries of the games, the filter lookups and API responses derived from them are cached."""
+
+
+def invalidate_game_caches() -> None:
+    """Invalidate the caches derived from the game catalogue, e.g. after an IGDB import."""
+    bump_cache_version(GAME_TITLE_SEARCH_CACHE_NAMESPACE)
+    invalidate_cached_counts(Game)
+    invalidate_cached_counts(GameCard)
+    invalidate_game_details()
+
+
+def invalidate_dictionaries_caches() -> None:
+    """Invalidate the caches derived from all the game dictionaries, e.g. after an IGDB import."""
+    for model in DICTIONARY_MODELS:
+        invalidate_dictionary_caches(model)
+
+
+def get_game_detail_stats_namespace(game_id: int) -> str:
+    """Get the namespace of the stats version of the game details."""
+    return f"{GAME_DETAIL_CACHE_NAMESPACE}:stats:{game_id}"
+
+
+def get_game_detail_cache_key(game_id: int, language: str, media_type: str) -> str:
+    """Get the cache key of the rendered game details.
+
+    The key changes with the stats version of the game and the version of all the game details,
+    bumped by the signals of the saved games, so it is built without querying the game.
+    """
+    return build_cache_key(
+        GAME_DETAIL_CACHE_NAMESPACE,
+        get_cache_version(GAME_DETAIL_CACHE_NAMESPACE),
+        game_id,
+        get_cache_version(get_game_detail_stats_namespace(game_id)),
+        language,
+        media_type,
+    )
+
+
+def invalidate_game_details(game_ids: Iterable[int] | None = None) -> None:
+    """Invalidate the cached details of the games with changed stats, or of all games when no IDs are given.
+
+    All the details are invalidated by the changes shown in the details of many games, like
+    the IGDB import, the ranks recalculation or the changes of the dictionaries.
+    """
+    if game_ids is None:
+        bump_cache_version(GAME_DETAIL_CACHE_NAMESPACE)
+        return
+    for game_id in game_ids:
+        bump_cache_version(get_game_detail_stats_namespace(game_id))
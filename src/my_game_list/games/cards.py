@@ -0,0 +1,84 @@
+"""Maintenance of the denormalized game cards (GameCard) read by the games list."""
+
+from typing import TYPE_CHECKING
+
+from django.db import connection
+
+from my_game_list.games.models import Game, GameCard, GameStats, GameStatus, GameType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+GAME_CARD_SOURCES = {
+    "title": "game.title",
+    "title_en": "game.title_en",
+    "title_pl": "game.title_pl",
+    "slug": "game.slug",
+    "release_date": "game.release_date",
+    "created_at": "game.created_at",
+    "cover_image_id": "game.cover_image_id",
+    "average_score": "COALESCE(stats.average_score, 0)",
+    "scores_count": "COALESCE(stats.score_count, 0)",
+    "rank_position": "COALESCE(stats.rank_position, 0)",
+    "members_count": "COALESCE(stats.members_count, 0)",
+    "popularity": "COALESCE(stats.popularity, 0)",
+    "game_status": "game_status.status",
+    "game_status_en": "game_status.status_en",
+    "game_status_pl": "game_status.status_pl",
+    "game_type": "game_type.type",
+    "game_type_en": "game_type.type_en",
+    "game_type_pl": "game_type.type_pl",
+}
+"""The SQL expressions of the card columns, the nulls of the ranks are stored as 0 like the Game properties."""
+
+# Missing cards are created and unchanged cards are left untouched.
+UPSERT_GAME_CARDS_SQL = """
+    INSERT INTO {card_table} AS card (game_id, {columns})
+    SELECT game.id, {sources}
+    FROM {game_table} AS game
+    LEFT JOIN {stats_table} AS stats ON stats.game_id = game.id
+    LEFT JOIN {game_status_table} AS game_status ON game_status.id = game.game_status_id
+    LEFT JOIN {game_type_table} AS game_type ON game_type.id = game.game_type_id
+    {where}
+    ON CONFLICT (game_id) DO UPDATE SET {updates}
+    WHERE ({card_columns}) IS DISTINCT FROM ({excluded_columns})
+"""
+
+
+def refresh_game_cards(game_ids: Iterable[int] | None = None) -> int:
+    """Create or update the cards of the given games, or of all games, with a single set-based statement.
+
+    Args:
+        game_ids (Iterable[int] | None): The IDs of the games to refresh, None to refresh all games.
+
+    Returns:
+        int: The number of created or updated cards.
+    """
+    params: list[list[int]] = []
+    where = ""
+    if game_ids is not None:
+        game_ids = list(game_ids)
+        if not game_ids:
+            return 0
+        where = "WHERE game.id = ANY(%s)"
+        params.append(game_ids)
+
+    quote_name = connection.ops.quote_name
+    columns = [quote_name(column) for column in GAME_CARD_SOURCES]
+    sql = UPSERT_GAME_CARDS_SQL.format(
+        card_table=quote_name(GameCard._meta.db_table),  # noqa: SLF001
+        game_table=quote_name(Game._meta.db_table),  # noqa: SLF001
+        stats_table=quote_name(GameStats._meta.db_table),  # noqa: SLF001
+        game_status_table=quote_name(GameStatus._meta.db_table),  # noqa: SLF001
+        game_type_table=quote_name(GameType._meta.db_table),  # noqa: SLF001
+        columns=", ".join(columns),
+        sources=", ".join(GAME_CARD_SOURCES.values()),
+        where=where,
+        updates=", ".join(f"{column} = EXCLUDED.{column}" for column in columns),
+        card_columns=", ".join(f"card.{column}" for column in columns),
+        excluded_columns=", ".join(f"EXCLUDED.{column}" for column in columns),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        updated_count: int = cursor.rowcount
+    return updated_count
@@ -0,0 +1,185 @@
+"""Exports of the user's data, streamed in the responses or written to the artifacts of the export jobs."""
+
+import csv
+import gzip
+import itertools
+import json
+import tempfile
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Self
+
+from django.conf import settings
+from django.core.files import File
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.utils import timezone, translation
+from rest_framework.utils.encoders import JSONEncoder
+
+from my_game_list.collections.models import Collection, CollectionItem
+from my_game_list.collections.serializers import CollectionDetailSerializer
+from my_game_list.games.models import ExportJobKind, GameList, GameListExportFormat, GameReview
+from my_game_list.games.serializers import GameListSerializer, GameReviewSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from django.db.models import QuerySet
+    from rest_framework.serializers import BaseSerializer
+
+    from my_game_list.games.models import ExportJob
+
+EXPORT_CHUNK_SIZE = 1000
+"""The number of entries fetched, together with their related objects, and written at once."""
+
+EXPORT_CONTENT_TYPES = {
+    GameListExportFormat.JSON: "application/json",
+    GameListExportFormat.NDJSON: "application/x-ndjson",
+    GameListExportFormat.CSV: "text/csv",
+}
+
+EXPORT_FILE_EXTENSIONS = {
+    GameListExportFormat.JSON: "json",
+    GameListExportFormat.NDJSON: "jsonl",
+    GameListExportFormat.CSV: "csv",
+}
+
+
+class Echo:
+    """A file-like object returning the written value, so the CSV writer formats the rows without buffering them."""
+
+    def write(self: Self, value: str) -> str:
+        """Return the written value."""
+        return value
+
+
+def get_stale_export_job_cutoff() -> datetime:
+    """Get the creation time before which the pending and running export jobs are stale."""
+    return timezone.now() - timedelta(minutes=settings.EXPORT_JOB_TIMEOUT_MINUTES)
+
+
+def get_game_list_export_queryset(user_id: int) -> QuerySet[GameList]:
+    """Get the game list entries of the user with the related objects of the export, in a stable order."""
+    return GameList.objects.filter(user_id=user_id).select_related("game").prefetch_related("owned_on").order_by("id")
+
+
+def get_review_export_queryset(user_id: int) -> QuerySet[GameReview]:
+    """Get the reviews of the user with their scores from the game list, in a stable order."""
+    scores = GameList.objects.filter(user_id=OuterRef("user_id"), game_id=OuterRef("game_id")).values("score")
+    return (
+        GameReview.objects.filter(user_id=user_id)
+        .select_related("user")
+        .annotate(user_score=Subquery(scores[:1]))
+        .order_by("id")
+    )
+
+
+def get_collection_export_queryset(user_id: int) -> QuerySet[Collection]:
+    """Get the collections of the user with their items and the related objects of the export, in a stable order."""
+    items = CollectionItem.objects.select_related("game", "added_by").order_by("order", "id")
+    return (
+        Collection.objects.filter(user_id=user_id)
+        .select_related("user")
+        .prefetch_related("collaborators", Prefetch("items", queryset=items))
+        .order_by("id")
+    )
+
+
+EXPORT_JOB_SOURCES: dict[ExportJobKind, tuple[Callable[[int], QuerySet[Any]], type[BaseSerializer[Any]]]] = {
+    ExportJobKind.GAME_LIST: (get_game_list_export_queryset, GameListSerializer),
+    ExportJobKind.COLLECTIONS: (get_collection_export_queryset, CollectionDetailSerializer),
+    ExportJobKind.REVIEWS: (get_review_export_queryset, GameReviewSerializer),
+}
+"""The querysets and the serializers of the exported entries of every kind of the export jobs."""
+
+
+def iter_entries(
+    queryset: QuerySet[Any],
+    serializer_class: type[BaseSerializer[Any]],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Serialize the entries with a server-side cursor, the related objects are prefetched per chunk."""
+    serializer = serializer_class()
+    for entry in queryset.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(entry)
+
+
+def dump_json(entry: dict[str, Any]) -> str:
+    """Dump the serialized entry to compact JSON, like the JSON renderer."""
+    return json.dumps(entry, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+
+
+def iter_json(entries: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Write the entries as a JSON array."""
+    yield "["
+    for index, entry in enumerate(entries):
+        yield f",{dump_json(entry)}" if index else dump_json(entry)
+    yield "]"
+
+
+def iter_ndjson(entries: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Write the entries as JSON Lines."""
+    for entry in entries:
+        yield f"{dump_json(entry)}\n"
+
+
+def iter_csv(entries: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Write the entries as CSV rows with a header, the owned on media are joined into a single column."""
+    writer = csv.writer(Echo())
+    fields = GameListSerializer.Meta.fields
+    yield writer.writerow(fields)
+    for entry in entries:
+        entry["owned_on"] = ", ".join(media["name"] for media in entry["owned_on"])
+        yield writer.writerow(entry[field] for field in fields)
+
+
+EXPORT_WRITERS = {
+    GameListExportFormat.JSON: iter_json,
+    GameListExportFormat.NDJSON: iter_ndjson,
+    GameListExportFormat.CSV: iter_csv,
+}
+
+
+def iter_game_list_export(
+    queryset: QuerySet[GameList],
+    export_format: GameListExportFormat,
+    language: str,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Write the export of the entries incrementally, one chunk of entries at a time.
+
+    The chunks are written in the given language, as the export is consumed after the request is handled.
+    The memory use is bounded by the chunk size regardless of the number of entries.
+    """
+    parts = EXPORT_WRITERS[export_format](iter_entries(queryset, GameListSerializer, chunk_size))
+    return iter_chunks(parts, language, chunk_size)
+
+
+def iter_chunks(parts: Iterable[str], language: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """Join the written parts into chunks, every chunk is written in the given language."""
+    parts = iter(parts)
+    while True:
+        with translation.override(language):
+            chunk = "".join(itertools.islice(parts, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_export_job_artifact(job: ExportJob, chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """Write the entries of the export job as gzip compressed JSON Lines to the file of the job.
+
+    The artifact is compressed into a temporary file first, so the memory use is bounded by the chunk size
+    and the storage only receives the finished artifact. Returns the number of written entries.
+    """
+    get_queryset, serializer_class = EXPORT_JOB_SOURCES[ExportJobKind(job.kind)]
+    parts = iter_ndjson(iter_entries(get_queryset(job.user_id), serializer_class, chunk_size))
+    entries_count = 0
+
+    with tempfile.TemporaryFile() as artifact:
+        with gzip.GzipFile(fileobj=artifact, mode="wb") as compressed_artifact:
+            for chunk in iter_chunks(parts, job.language, chunk_size):
+                # Every entry is a single line, the new lines inside the values are escaped by the JSON encoder.
+                entries_count += chunk.count("\n")
+                compressed_artifact.write(chunk.encode())
+        job.file.save(f"{job.kind}.jsonl.gz", File(artifact), save=False)
+
+    return entries_count
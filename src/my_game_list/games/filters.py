@@ -1,15 +1,21 @@
 """Filters for game related data."""
 
-from typing import Any
+from typing import Any, ClassVar
 
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
-from django.db.models import ExpressionWrapper, FloatField, Q, QuerySet, Value
+from django.core.cache import cache
+from django.db.models import ExpressionWrapper, F, FloatField, Func, IntegerField, Q, QuerySet, Value
+from django.db.models.functions import Collate
 from django_filters import rest_framework as filters
 
+from my_game_list.games.cache import GAME_TITLE_SEARCH_CACHE_NAMESPACE
 from my_game_list.games.models import (
     Company,
     ExternalGameSource,
     Game,
+    GameCard,
     GameEngine,
     GameFollow,
     GameList,
@@ -24,8 +30,93 @@
     PlayerPerspective,
 )
 from my_game_list.games.utils import normalize_title
+from my_game_list.my_game_list.cache import build_cache_key, get_cache_version
 from my_game_list.my_game_list.filters import BaseDictionaryFilterSet, BilingualModelMultipleChoiceFilter
 
+TITLE_SEARCH_MIN_RANK = 0.2
+"""The minimal weighted similarity of a title matching the search."""
+
+
+def search_by_title(queryset: QuerySet[Any], normalized_title: str, search_title_field: str) -> QuerySet[Any]:
+    """Filter the queryset by the normalized title and order it by relevance.
+
+    The search runs in two stages. The word similarity operator (`%>`) selects the candidates
+    using the trigram GIN index on the search title, then only the candidates are ranked with
+    the weighted blend of word similarity and similarity. The similarity of a title is at most its
+    word similarity, so every title reaching the minimal rank is among the candidates as long as
+    `pg_trgm.word_similarity_threshold` is not above `TITLE_SEARCH_MIN_RANK`.
+
+    Args:
+        queryset (QuerySet[Any]): The queryset to search.
+        normalized_title (str): The searched title, normalized with `normalize_title`.
+        search_title_field (str): The lookup path of the game search title field.
+
+    Returns:
+        QuerySet[Any]: The matching objects ordered by the descending rank.
+    """
+    result: QuerySet[Any] = (
+        queryset.filter(**{f"{search_title_field}__trigram_word_similar": normalized_title})
+        .annotate(
+            rank=ExpressionWrapper(
+                TrigramWordSimilarity(normalized_title, search_title_field) * Value(0.7)
+                + TrigramSimilarity(search_title_field, normalized_title) * Value(0.3),
+                output_field=FloatField(),
+            ),
+        )
+        .filter(rank__gte=TITLE_SEARCH_MIN_RANK)
+        .order_by("-rank")
+    )
+    return result
+
+
+def autocomplete_by_title(queryset: QuerySet[Game], normalized_title: str, limit: int) -> list[Game]:
+    """Get the first games whose title starts with the normalized title.
+
+    Games whose search title starts with the query come first, served by a range scan of the
+    `games_game_search_title_prefix` index in the index order. If there are not enough of them,
+    games with any word starting with the query are added, prefiltered by the trigram GIN index.
+
+    Args:
+        queryset (QuerySet[Game]): The games to search in.
+        normalized_title (str): The typed title, normalized with `normalize_title`.
+        limit (int): The maximal number of returned games.
+
+    Returns:
+        list[Game]: The matching games.
+    """
+    if not normalized_title:
+        return []
+
+    queryset = queryset.alias(search_title_c=Collate("search_title", "C")).order_by("search_title_c")
+    games: list[Game] = list(queryset.filter(search_title_c__startswith=normalized_title)[:limit])
+    if len(games) < limit:
+        games.extend(
+            queryset.filter(search_title__contains=f" {normalized_title}").exclude(
+                pk__in=[game.pk for game in games],
+            )[: limit - len(games)],
+        )
+    return games
+
+
+class ArrayPosition(Func):
+    """The position of the expression in the array, used to keep the order of a list of IDs."""
+
+    function = "array_position"
+    output_field = IntegerField()
+
+
+def order_by_ids(queryset: QuerySet[Any], ids: list[int]) -> QuerySet[Any]:
+    """Filter the queryset to the given IDs, keeping their order."""
+    if not ids:
+        return queryset.none()
+    # Annotated rather than ordered by directly, so the queryset stays valid with distinct().
+    result: QuerySet[Any] = (
+        queryset.filter(pk__in=ids)
+        .annotate(ids_position=ArrayPosition(Value(ids, output_field=ArrayField(IntegerField())), F("pk")))
+        .order_by("ids_position")
+    )
+    return result
+
 
 class CompanyFilterSet(BaseDictionaryFilterSet):
     """Filter set for company model."""
@@ -104,19 +195,7 @@ class GameListFilterSet(filters.FilterSet):
 
     def filter_title(self, queryset: QuerySet[Any], _name: str, value: str) -> QuerySet[Any]:
         """Filter by game title using pg_trgm word similarity."""
-        normalized = normalize_title(value)
-        result: QuerySet[Any] = (
-            queryset.annotate(
-                rank=ExpressionWrapper(
-                    TrigramWordSimilarity(normalized, "game__search_title") * Value(0.7)
-                    + TrigramSimilarity("game__search_title", normalized) * Value(0.3),
-                    output_field=FloatField(),
-                ),
-            )
-            .filter(rank__gte=0.2)
-            .order_by("-rank")
-        )
-        return result
+        return search_by_title(queryset, normalize_title(value), "game__search_title")
 
     def filter_publisher(self, queryset: QuerySet[Any], _name: str, value: str) -> QuerySet[Any]:
         """Filter by publisher name in English or Polish."""
@@ -216,29 +295,59 @@ class GameFilterSet(filters.FilterSet):
         queryset=ExternalGameSource.objects.all(),
     )
 
+    TITLE_SEARCH_CACHE_IGNORED_PARAMS: ClassVar[frozenset[str]] = frozenset({"title", "ordering"})
+    """Query parameters that do not change the set of games matching a title search."""
+
+    game_lookup_prefix: ClassVar[str] = ""
+    """The lookup path of the game from the filtered model, prefixing the lookups of the filter methods."""
+
     def filter_title(self, queryset: QuerySet[Any], _name: str, value: str) -> QuerySet[Any]:
-        """Filter by normalized title using pg_trgm word similarity."""
+        """Filter by normalized title using pg_trgm word similarity.
+
+        The ranked IDs of the matching games are cached, so repeated searches only select the games by ID.
+        Searches matching more than `GAME_TITLE_SEARCH_CACHE_MAX_RESULTS` games are not cached.
+        """
         normalized = normalize_title(value)
-        result: QuerySet[Any] = (
-            queryset.annotate(
-                rank=ExpressionWrapper(
-                    TrigramWordSimilarity(normalized, "search_title") * Value(0.7)
-                    + TrigramSimilarity("search_title", normalized) * Value(0.3),
-                    output_field=FloatField(),
-                ),
-            )
-            .filter(rank__gte=0.2)
-            .order_by("-rank")
+        result = search_by_title(queryset, normalized, f"{self.game_lookup_prefix}search_title")
+
+        cache_key = self._get_title_search_cache_key(normalized)
+        cache_version = get_cache_version(GAME_TITLE_SEARCH_CACHE_NAMESPACE)
+        game_ids: list[int] | bool | None = cache.get(cache_key, version=cache_version)
+        if game_ids is None:
+            max_results = settings.GAME_TITLE_SEARCH_CACHE_MAX_RESULTS
+            game_ids = list(result.values_list("pk", flat=True)[: max_results + 1])
+            if len(game_ids) > max_results:
+                # Remember that the search is too broad to be cached.
+                game_ids = False
+            cache.set(cache_key, game_ids, settings.GAME_TITLE_SEARCH_CACHE_TIMEOUT, version=cache_version)
+
+        if not isinstance(game_ids, list):
+            return result
+        return order_by_ids(queryset, game_ids)
+
+    def _get_title_search_cache_key(self, normalized_title: str) -> str:
+        """Build the cache key of a title search from the normalized title and the other active filters."""
+        active_filters = sorted(
+            (name, self.data.getlist(name) if hasattr(self.data, "getlist") else self.data[name])
+            for name in self.filters
+            if name in self.data and name not in self.TITLE_SEARCH_CACHE_IGNORED_PARAMS
         )
-        return result
+        return build_cache_key(GAME_TITLE_SEARCH_CACHE_NAMESPACE, normalized_title, active_filters)
 
     def filter_publisher(self, queryset: QuerySet[Any], _name: str, value: str) -> QuerySet[Any]:
         """Filter by publisher name in English or Polish."""
-        return queryset.filter(Q(publisher__name_en__icontains=value) | Q(publisher__name_pl__icontains=value))
+        return self._filter_company(queryset, "publisher", value)
 
     def filter_developer(self, queryset: QuerySet[Any], _name: str, value: str) -> QuerySet[Any]:
         """Filter by developer name in English or Polish."""
-        return queryset.filter(Q(developer__name_en__icontains=value) | Q(developer__name_pl__icontains=value))
+        return self._filter_company(queryset, "developer", value)
+
+    def _filter_company(self, queryset: QuerySet[Any], field_name: str, value: str) -> QuerySet[Any]:
+        """Filter by the name of the company in the given field of the game, in English or Polish."""
+        lookup = f"{self.game_lookup_prefix}{field_name}"
+        return queryset.filter(
+            Q(**{f"{lookup}__name_en__icontains": value}) | Q(**{f"{lookup}__name_pl__icontains": value}),
+        )
 
     ordering = filters.OrderingFilter(
         fields=(
@@ -269,6 +378,70 @@ class Meta:
         )
 
 
+class GameCardFilterSet(GameFilterSet):
+    """FilterSet for the game cards of the games list.
+
+    The title, the release date and the ordering are read from the cards, the filters by the relations
+    missing from the cards, e.g. the genres, platforms and companies, join the games.
+    """
+
+    id = filters.NumberFilter(field_name="game_id")
+    genres = BilingualModelMultipleChoiceFilter(
+        field_name="game__genres",
+        queryset=Genre.objects.all(),
+    )
+    platforms = BilingualModelMultipleChoiceFilter(
+        field_name="game__platforms",
+        queryset=Platform.objects.all(),
+    )
+    game_type = BilingualModelMultipleChoiceFilter(
+        field_name="game__game_type",
+        queryset=GameType.objects.all(),
+        en_field="type_en",
+        pl_field="type_pl",
+    )
+    game_status = BilingualModelMultipleChoiceFilter(
+        field_name="game__game_status",
+        queryset=GameStatus.objects.all(),
+        en_field="status_en",
+        pl_field="status_pl",
+    )
+    game_engines = BilingualModelMultipleChoiceFilter(
+        field_name="game__game_engines",
+        queryset=GameEngine.objects.all(),
+    )
+    game_modes = BilingualModelMultipleChoiceFilter(
+        field_name="game__game_modes",
+        queryset=GameMode.objects.all(),
+    )
+    player_perspectives = BilingualModelMultipleChoiceFilter(
+        field_name="game__player_perspectives",
+        queryset=PlayerPerspective.objects.all(),
+    )
+    external_games = BilingualModelMultipleChoiceFilter(
+        field_name="game__external_games__external_game_source",
+        queryset=ExternalGameSource.objects.all(),
+    )
+
+    game_lookup_prefix = "game__"
+
+    # The ranks of the cards are ordered with the nulls of the games not ranked yet, see `with_nullable_ranks`.
+    ordering = filters.OrderingFilter(
+        fields=(
+            ("created_at", "created_at"),
+            ("rank_position_or_null", "rank_position"),
+            ("popularity_or_null", "popularity"),
+            ("release_date", "release_date"),
+        ),
+    )
+
+    class Meta:
+        """Meta class for GameCardFilterSet."""
+
+        model = GameCard
+        fields = GameFilterSet.Meta.fields
+
+
 class GenreFilterSet(BaseDictionaryFilterSet):
     """Filter set for genre model."""
 
@@ -1,17 +1,25 @@
 """Module with the logic regarding the IGDB interaction."""
 
+import secrets
+import threading
 import time
 from abc import ABC
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import StrEnum
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Self
 
 import requests
 from django.conf import settings
 from requests_futures.sessions import FuturesSession
 
+from my_game_list.my_game_list.metrics import Metrics
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
 
 type IGDBObject = (
     IGDBPlatformResponse
@@ -261,8 +269,82 @@ class IGDBInteractionError(Exception):
     """IGDB interaction error."""
 
 
+class IGDBPermanentError(IGDBInteractionError):
+    """IGDB error not resolved by retrying the request, e.g. an invalid query or an expired access token."""
+
+
+@dataclass
+class IGDBDeadLetter:
+    """Class representing the request of a page which failed after all the retries, kept to be replayed later."""
+
+    endpoint: str
+    """The name of the endpoint."""
+    query: str
+    """The full query of the page."""
+    error: str
+    """The error of the last attempt."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    The bucket is refilled with `rate` tokens per second up to its `capacity`, every request takes one token
+    and waits for it when the bucket is empty.
+    """
+
+    def __init__(
+        self: Self,
+        rate: float,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            rate (float): The number of tokens added every second.
+            capacity (int): The maximum number of tokens, i.e. the largest burst of requests.
+            clock (Callable[[], float]): The monotonic clock measuring the refill.
+            sleep (Callable[[float], None]): The function waiting for the next token.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._refilled_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self: Self) -> None:
+        """Take a token from the bucket, waiting until one is available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1
+            # The token is reserved while holding the lock, so the waiting callers are released in order.
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_time:
+            self._sleep(wait_time)
+
+    def pause(self: Self, seconds: float) -> None:
+        """Make the next request wait at least the given number of seconds, e.g. after being rate limited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
 class IGDBWrapper:
-    """IGDB wrapper class."""
+    """IGDB wrapper class.
+
+    The requests share a long-lived session keeping the connections to IGDB alive. They are paced by a token bucket
+    to the requests per second allowed by IGDB and run in a thread pool of the allowed number of open requests.
+    The rate limited, failed and timed out requests are retried with an exponential backoff, honouring
+    the `Retry-After` header up to `RETRY_AFTER_MAX` seconds. The pages failing after all the retries, or asked
+    to wait longer, are moved to the dead-letter list. The permanent errors fail the paging at once.
+    """
 
     IGDB_AUTHENTICATION_URL = (
         "https://id.twitch.tv/oauth2/token"
@@ -271,6 +353,21 @@ class IGDBWrapper:
     IGDB_BASE_URL = "https://api.igdb.com/v4/"
     QUERY_ITEM_LIMIT = 500
     MAX_REQUESTS_TO_IGDB = 4
+    REQUESTS_PER_SECOND = 4
+    MAX_CONCURRENT_REQUESTS = 8
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 30.0
+    RETRY_AFTER_MAX = 60.0
+    RETRY_STATUSES = frozenset(
+        (
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        ),
+    )
 
     def __init__(self: Self) -> None:
         """Initialize the IGDB wrapper."""
@@ -279,6 +376,16 @@ def __init__(self: Self) -> None:
             "Client-ID": settings.IGDB_CLIENT_ID,
             "Authorization": f"Bearer {_access_token}",
         }
+        self._session = FuturesSession(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        # A single token spaces the requests evenly, so no second holds more requests than allowed.
+        self._rate_limiter = TokenBucket(rate=self.REQUESTS_PER_SECOND)
+        self._random = secrets.SystemRandom()
+        self._dead_letters: list[IGDBDeadLetter] = []
+        self._dead_letters_lock = threading.Lock()
+
+    def close(self: Self) -> None:
+        """Close the connections and shut down the thread pool of the session."""
+        self._session.close()
 
     @property
     def basic_auth_headers(self: Self) -> dict[str, str]:
@@ -318,6 +425,95 @@ def _cast_response(self: Self, endpoint: IGDBEndpoints, response_json: list[dict
 
         return [response_type(**response) for response in response_json]
 
+    def _post(self: Self, endpoint: str, query: str, timeout: int) -> Future[requests.Response]:
+        """Send the request to the IGDB API in the thread pool of the session, once the rate limiter allows it."""
+        self._rate_limiter.acquire()
+        return self._session.post(
+            url=f"{self.IGDB_BASE_URL}{endpoint}",
+            data=query,
+            headers=self.basic_auth_headers,
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float | None:
+        """Get the number of seconds to wait from the `Retry-After` header, given in seconds or as a date."""
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except ValueError:
+            return None
+        return max((retry_at - datetime.now(tz=UTC)).total_seconds(), 0.0)
+
+    def _get_backoff(self: Self, attempt: int) -> float:
+        """Get the exponential backoff of the retry, with a random jitter spreading the retries of the pages."""
+        return min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2.0**attempt) * self._random.uniform(0.5, 1.0)
+
+    def _get_response(
+        self: Self,
+        endpoint: str,
+        query: str,
+        future: Future[requests.Response],
+        timeout: int,
+    ) -> requests.Response:
+        """Get the successful response of the request, retrying the transient errors.
+
+        Raises:
+            IGDBPermanentError: If the request failed with a permanent error.
+            IGDBInteractionError: If the request failed after all the retries, or IGDB asked to wait longer than
+                `RETRY_AFTER_MAX` seconds before retrying it.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                response = future.result()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                Metrics.igdb_requests_total.labels(endpoint=endpoint, status="error").inc()
+                error = str(e)
+            else:
+                Metrics.igdb_requests_total.labels(endpoint=endpoint, status=response.status_code).inc()
+                if response.ok:
+                    return response
+                error = f"{response.status_code} {response.reason}"
+                if response.status_code not in self.RETRY_STATUSES:
+                    error_message = f"Unable to get the {endpoint}. Error: {error}"
+                    raise IGDBPermanentError(error_message)
+                retry_after = self._get_retry_after(response)
+                if retry_after is not None and retry_after > self.RETRY_AFTER_MAX:
+                    # Waiting this long would stall the whole import, the page is replayed later instead.
+                    error_message = (
+                        f"Unable to get the {endpoint}, IGDB asked to retry after {retry_after:.0f} seconds. "
+                        f"Error: {error}"
+                    )
+                    raise IGDBInteractionError(error_message)
+                if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                    # The other requests are held back as well, as they would be rate limited too.
+                    self._rate_limiter.pause(retry_after or self._get_backoff(attempt))
+
+            if attempt == self.MAX_RETRIES:
+                break
+            Metrics.igdb_request_retries_total.labels(endpoint=endpoint).inc()
+            time.sleep(retry_after if retry_after is not None else self._get_backoff(attempt))
+            future = self._post(endpoint, query, timeout)
+
+        error_message = f"Unable to get the {endpoint} after {self.MAX_RETRIES} retries. Error: {error}"
+        raise IGDBInteractionError(error_message)
+
+    def _request(self: Self, endpoint: str, query: str, timeout: int = 10) -> list[dict[str, Any]]:
+        """Run the request to the IGDB API with the retries and get the data of the response."""
+        if not query:
+            error_message = "No query provided."
+            raise IGDBInteractionError(error_message)
+        response = self._get_response(endpoint, query, self._post(endpoint, query, timeout), timeout)
+        response_json: list[dict[str, Any]] = response.json()
+        return response_json
+
     def api_request(self: Self, endpoint: IGDBEndpoints, query: str) -> IGDBApiResponse:
         """Run request to the IGDB API.
 
@@ -325,58 +521,94 @@ def api_request(self: Self, endpoint: IGDBEndpoints, query: str) -> IGDBApiRespo
             endpoint (IGDBEndpoints): The name of the endpoint.
             query (str): The query for the endpoint.
         """
-        if not query:
-            error_message = "No query provided."
-            raise IGDBInteractionError(error_message)
-        try:
-            response = requests.post(
-                f"{self.IGDB_BASE_URL}{endpoint.value}",
-                data=query,
-                headers=self.basic_auth_headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-        except requests.HTTPError as e:
-            error_message = f"Unable to get the {endpoint.value}. Error: {e}"
-            raise IGDBInteractionError(error_message) from e
-
-        return self._cast_response(endpoint, response.json())
+        return self._cast_response(endpoint, self._request(endpoint.value, query))
 
-    def iter_all_objects(self: Self, endpoint: IGDBEndpoints, query: str) -> Iterator[IGDBApiResponse]:
-        """Get all objects from the IGDB database.
+    @property
+    def dead_letters(self: Self) -> list[IGDBDeadLetter]:
+        """The requests of the pages which failed after all the retries."""
+        with self._dead_letters_lock:
+            return list(self._dead_letters)
+
+    def take_dead_letters(self: Self, endpoint: str) -> list[IGDBDeadLetter]:
+        """Take the requests of the failed pages of the endpoint out of the dead-letter list, e.g. to persist them."""
+        with self._dead_letters_lock:
+            dead_letters = [letter for letter in self._dead_letters if letter.endpoint == endpoint]
+            self._dead_letters = [letter for letter in self._dead_letters if letter.endpoint != endpoint]
+        return dead_letters
+
+    def replay_dead_letter(self: Self, dead_letter: IGDBDeadLetter) -> IGDBApiResponse:
+        """Run the request of the failed page again.
+
+        Raises:
+            IGDBInteractionError: If the request failed again.
+        """
+        try:
+            response_json = self._request(dead_letter.endpoint, dead_letter.query, timeout=60)
+        except IGDBInteractionError:
+            Metrics.igdb_dead_letters_replayed_total.labels(endpoint=dead_letter.endpoint, result="failed").inc()
+            raise
+        Metrics.igdb_dead_letters_replayed_total.labels(endpoint=dead_letter.endpoint, result="succeeded").inc()
+        return self._cast_response(IGDBEndpoints(dead_letter.endpoint), response_json)
+
+    def iter_all_objects(
+        self: Self,
+        endpoint: IGDBEndpoints,
+        query: str,
+        where: str = "",
+        after_id: int = 0,
+    ) -> Iterator[IGDBApiResponse]:
+        """Get all objects from the IGDB database, in the order of their IDs.
+
+        The objects are paged by their IDs, every batch of pages starts after the last ID of the previous batch,
+        so the offsets stay within a batch and an interrupted import is resumed cheaply after its last ID.
+        The paging ends on the first page with fewer objects than the limit, the pages which failed after all
+        the retries are moved to the dead-letter list and do not end the paging.
 
         Args:
             endpoint (IGDBEndpoints): The name of the endpoint.
             query (str): The query for the endpoint.
+            where (str): The conditions of the objects, e.g. their update times.
+            after_id (int): The ID after which the objects are fetched.
 
         Yields:
             Iterator[IGDBApiResponse]: A generator yielding batches of IGDB objects.
+
+        Raises:
+            IGDBInteractionError: If all the pages of a batch failed.
         """
-        offset = 0
-        query = f"{query}limit {self.QUERY_ITEM_LIMIT};"
         while True:
-            items_in_response = 0
+            conditions = " & ".join(condition for condition in (where, f"id > {after_id}") if condition)
             # Fetch multiple pages in parallel
-            responses = self.api_multi_request(endpoint, query, offset)
+            responses = self.api_multi_request(endpoint, f"{query}where {conditions};limit {self.QUERY_ITEM_LIMIT};")
+            if not any(response is not None for response in responses):
+                error_message = f"Unable to get any page of the {endpoint.value} after IGDB ID {after_id}."
+                raise IGDBInteractionError(error_message)
 
             batch_result = []
+            is_last_batch = False
             for response in responses:
+                if response is None:
+                    continue
                 response_cast = self._cast_response(endpoint, response.json())
-                items_in_response += len(response_cast)
+                is_last_batch = is_last_batch or len(response_cast) < self.QUERY_ITEM_LIMIT
                 batch_result.extend(response_cast)
 
             if batch_result:
                 yield batch_result
 
-            if items_in_response != self.MAX_REQUESTS_TO_IGDB * self.QUERY_ITEM_LIMIT:
+            if is_last_batch:
                 break
-            offset += self.MAX_REQUESTS_TO_IGDB * self.QUERY_ITEM_LIMIT
-            # IGDB API has a limit of 4 requests per second
-            time.sleep(1)
-
-    def api_multi_request(self: Self, endpoint: IGDBEndpoints, query: str, offset: int = 0) -> list[requests.Response]:
+            # The objects of the failed pages before the last successful one are replayed from the dead-letter list.
+            after_id = max(item.id for item in batch_result)
+
+    def api_multi_request(
+        self: Self,
+        endpoint: IGDBEndpoints,
+        query: str,
+        offset: int = 0,
+    ) -> list[requests.Response | None]:
         """
-        Run up to `MAX_REQUESTS_TO_IGDB` request at the same time to the IGDB API.
+        Run `MAX_REQUESTS_TO_IGDB` requests of the consecutive pages to the IGDB API, paced by the rate limiter.
 
         Args:
             endpoint (IGDBEndpoints): The name of the endpoint.
@@ -384,26 +616,39 @@ def api_multi_request(self: Self, endpoint: IGDBEndpoints, query: str, offset: i
             offset (int): The offset to start from.
 
         Returns:
-            list[requests.Response]: A list of the responses.
+            list[requests.Response | None]: A list of the responses, None for the pages which failed after all
+                the retries and were moved to the dead-letter list.
+
+        Raises:
+            IGDBPermanentError: If any page failed with a permanent error, the other pages are cancelled.
         """
         if not query:
             error_message = "No query provided."
             raise IGDBInteractionError(error_message)
-        session = FuturesSession(max_workers=self.MAX_REQUESTS_TO_IGDB)
-        requests = [
-            session.post(
-                url=f"{self.IGDB_BASE_URL}{endpoint.value}",
-                data=f"{query}offset {new_offset};sort id;",
-                headers=self.basic_auth_headers,
-                timeout=60,
-            )
+        page_queries = [
+            f"{query}offset {new_offset};sort id;"
             for new_offset in range(
                 offset,
                 offset + (self.MAX_REQUESTS_TO_IGDB * self.QUERY_ITEM_LIMIT),
                 self.QUERY_ITEM_LIMIT,
             )
         ]
-        return [req.result() for req in requests]
+        futures = [self._post(endpoint.value, page_query, timeout=60) for page_query in page_queries]
+
+        responses: list[requests.Response | None] = []
+        for page_query, future in zip(page_queries, futures, strict=True):
+            try:
+                responses.append(self._get_response(endpoint.value, page_query, future, timeout=60))
+            except IGDBPermanentError:
+                for pending_future in futures:
+                    pending_future.cancel()
+                raise
+            except IGDBInteractionError as e:
+                Metrics.igdb_dead_letters_total.labels(endpoint=endpoint.value).inc()
+                with self._dead_letters_lock:
+                    self._dead_letters.append(IGDBDeadLetter(endpoint.value, page_query, str(e)))
+                responses.append(None)
+        return responses
 
 
 if __name__ == "__main__":
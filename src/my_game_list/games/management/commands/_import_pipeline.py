@@ -0,0 +1,137 @@
+"""Module with the pipeline overlapping the fetching of the IGDB data with writing it to the database."""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Sized
+
+PIPELINE_QUEUE_SIZE = 2
+"""The number of fetched batches waiting for the writer, bounding the memory use when the writer falls behind."""
+
+PUT_TIMEOUT = 0.1
+"""The number of seconds between the checks of the fetcher whether the writer stopped, while the queue is full."""
+
+
+@dataclass
+class PipelineStats:
+    """The throughput and the backpressure of the stages of the pipeline."""
+
+    batches: int = 0
+    """The number of batches passed through the pipeline."""
+    objects: int = 0
+    """The number of objects in the batches."""
+    fetch_time: float = 0.0
+    """The seconds spent by the fetcher on getting the batches."""
+    fetcher_blocked_time: float = 0.0
+    """The seconds the fetcher waited for room in the full queue, i.e. the backpressure of the writer."""
+    write_time: float = 0.0
+    """The seconds spent by the writer on processing the batches."""
+    writer_idle_time: float = 0.0
+    """The seconds the writer waited for the batches of the fetcher."""
+
+    def report(self: Self, name: str) -> str:
+        """Get the summary of the stages of the pipeline."""
+        fetch_rate = self.objects / self.fetch_time if self.fetch_time else 0.0
+        write_rate = self.objects / self.write_time if self.write_time else 0.0
+        return (
+            f"Pipeline of {name}: {self.objects} objects in {self.batches} batches. "
+            f"Fetching: {self.fetch_time:.2f}s ({fetch_rate:.0f} objects/s), "
+            f"blocked by the writer for {self.fetcher_blocked_time:.2f}s. "
+            f"Writing: {self.write_time:.2f}s ({write_rate:.0f} objects/s), "
+            f"waiting for the fetcher for {self.writer_idle_time:.2f}s."
+        )
+
+
+@dataclass
+class _FetcherError:
+    """The exception raised by the fetcher, re-raised by the writer."""
+
+    error: Exception
+
+
+_DONE = object()
+
+
+class _Fetcher(threading.Thread):
+    """The background thread putting the fetched batches into the queue."""
+
+    def __init__(self: Self, batches: Iterable[Sized], batch_queue: queue.Queue[object], stats: PipelineStats) -> None:
+        """Initialize the fetcher."""
+        super().__init__(name="igdb-import-fetcher", daemon=True)
+        self.batches = batches
+        self.batch_queue = batch_queue
+        self.stats = stats
+        self.stopped = threading.Event()
+
+    def put(self: Self, item: object) -> bool:
+        """Put the item into the queue, waiting for room until the writer stops."""
+        started_at = time.perf_counter()
+        try:
+            while not self.stopped.is_set():
+                try:
+                    self.batch_queue.put(item, timeout=PUT_TIMEOUT)
+                except queue.Full:
+                    continue
+                return True
+            return False
+        finally:
+            self.stats.fetcher_blocked_time += time.perf_counter() - started_at
+
+    def run(self: Self) -> None:
+        """Fetch the batches until they are exhausted or the writer stops."""
+        iterator = iter(self.batches)
+        try:
+            while True:
+                started_at = time.perf_counter()
+                batch = next(iterator, _DONE)
+                self.stats.fetch_time += time.perf_counter() - started_at
+                if not self.put(batch) or batch is _DONE:
+                    return
+        except Exception as error:  # noqa: BLE001
+            self.put(_FetcherError(error))
+
+
+def iter_pipelined[BatchType: Sized](
+    batches: Iterable[BatchType],
+    stats: PipelineStats,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+) -> Generator[BatchType]:
+    """Fetch the batches in a background thread while the caller processes the previous ones.
+
+    The batches are passed through a bounded FIFO queue by a single fetcher, so they are yielded in the same order
+    as without the pipeline and the results do not depend on the timing. The exceptions of the fetcher are re-raised
+    in the caller, and the fetcher is stopped when the caller stops consuming the batches.
+
+    Args:
+        batches (Iterable[BatchType]): The batches, consumed in the background thread.
+        stats (PipelineStats): The statistics updated with the throughput and the backpressure.
+        queue_size (int): The maximum number of fetched batches waiting for the caller.
+
+    Yields:
+        BatchType: The batches in their original order.
+    """
+    batch_queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+    fetcher = _Fetcher(batches, batch_queue, stats)
+    fetcher.start()
+    try:
+        while True:
+            started_at = time.perf_counter()
+            item = batch_queue.get()
+            stats.writer_idle_time += time.perf_counter() - started_at
+            if item is _DONE:
+                return
+            if isinstance(item, _FetcherError):
+                raise item.error
+            batch = cast("BatchType", item)
+            stats.batches += 1
+            stats.objects += len(batch)
+            started_at = time.perf_counter()
+            yield batch
+            stats.write_time += time.perf_counter() - started_at
+    finally:
+        fetcher.stopped.set()
+        fetcher.join()
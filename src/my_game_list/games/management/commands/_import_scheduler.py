@@ -0,0 +1,60 @@
+"""Module with the scheduler running the imports of the IGDB endpoints in the order of their dependencies."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Mapping
+
+
+def run_in_dependency_order(
+    tasks: Mapping[str, Callable[[], None]],
+    dependencies: Mapping[str, Collection[str]],
+    max_workers: int = 1,
+) -> dict[str, BaseException]:
+    """Run every task once all its dependencies finished, running the independent tasks concurrently.
+
+    Only the dependencies among the given tasks are respected, and a task is run after its dependencies finished
+    whether they succeeded or failed. A single worker runs the tasks one by one in the current thread,
+    the independent tasks in their given order.
+
+    Args:
+        tasks (Mapping[str, Callable[[], None]]): The tasks by their names.
+        dependencies (Mapping[str, Collection[str]]): The names of the tasks every task depends on.
+        max_workers (int): The maximum number of the tasks run at the same time.
+
+    Returns:
+        dict[str, BaseException]: The errors of the failed tasks by their names.
+
+    Raises:
+        graphlib.CycleError: If the dependencies of the tasks form a cycle.
+    """
+    sorter = TopologicalSorter(
+        {name: [dependency for dependency in dependencies.get(name, ()) if dependency in tasks] for name in tasks},
+    )
+    sorter.prepare()
+    errors: dict[str, BaseException] = {}
+
+    if max_workers == 1:
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                try:
+                    tasks[name]()
+                except Exception as e:  # noqa: BLE001
+                    errors[name] = e
+                sorter.done(name)
+        return errors
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="igdb-import") as executor:
+        running: dict[Future[None], str] = {}
+        while sorter.is_active():
+            # The tasks are started as soon as their last dependency finished.
+            running.update((executor.submit(tasks[name]), name) for name in sorter.get_ready())
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                if (error := future.exception()) is not None:
+                    errors[name] = error
+                sorter.done(name)
+    return errors
@@ -0,0 +1,116 @@
+"""Management command to benchmark the rank recalculation."""
+
+import itertools
+import random
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Self
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from my_game_list.games.models import Game, GameStats
+from my_game_list.games.stats import recalculate_game_ranks
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+def legacy_recalculate_ranks() -> int:
+    """The previous in-memory implementation: load all stats, sort them twice and update every row."""
+    stats_list = list(GameStats.objects.all())
+
+    stats_list.sort(key=lambda x: (x.average_score or 0, x.game_id), reverse=True)
+    for i, stat in enumerate(stats_list, start=1):
+        stat.rank_position = i
+
+    stats_list.sort(key=lambda x: (x.members_count, x.game_id), reverse=True)
+    for i, stat in enumerate(stats_list, start=1):
+        stat.popularity = i
+
+    GameStats.objects.bulk_update(stats_list, ["rank_position", "popularity"], batch_size=1000)
+    return len(stats_list)
+
+
+class Command(BaseCommand):  # NOSONAR(S8443) - Already inheriting from BaseCommand
+    """Benchmark the in-memory and the SQL rank recalculation on synthetic data."""
+
+    help = (
+        "Seeds synthetic games inside a transaction, times the legacy in-memory and the SQL rank recalculation "
+        "and rolls everything back."
+    )
+    BATCH_SIZE = 5000
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[100_000, 1_000_000],
+            help="The numbers of synthetic games to benchmark with.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="The seed of the synthetic statistics.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Execute the command."""
+        for size in options["sizes"]:
+            with transaction.atomic():
+                self._benchmark(size, random.Random(options["seed"]))  # noqa: S311
+                transaction.set_rollback(True)
+
+    def _seed(self: Self, size: int, rng: random.Random) -> None:
+        """Create the synthetic games with random statistics."""
+        first_igdb_id = (Game.objects.aggregate(max_igdb_id=Max("igdb_id"))["max_igdb_id"] or 0) + 1
+        igdb_updated_at = datetime.now(tz=UTC)
+        for batch in itertools.batched(range(first_igdb_id, first_igdb_id + size), self.BATCH_SIZE, strict=False):
+            games = Game.objects.bulk_create(
+                Game(
+                    title=f"Benchmark game {igdb_id}",
+                    slug=f"benchmark-game-{igdb_id}",
+                    igdb_id=igdb_id,
+                    igdb_updated_at=igdb_updated_at,
+                )
+                for igdb_id in batch
+            )
+            GameStats.objects.bulk_create(
+                GameStats(
+                    game=game,
+                    average_score=Decimal(rng.randint(0, 1000)) / 100,
+                    members_count=rng.randint(0, 10_000),
+                )
+                for game in games
+            )
+
+    def _benchmark(self: Self, size: int, rng: random.Random) -> None:
+        """Seed the data and time both rank recalculations."""
+        self.stdout.write(f"Seeding {size} games...")
+        self._seed(size, rng)
+
+        started_at = time.perf_counter()
+        legacy_count = legacy_recalculate_ranks()
+        legacy_time = time.perf_counter() - started_at
+        expected_ranks = set(GameStats.objects.values_list("game_id", "rank_position", "popularity"))
+
+        GameStats.objects.update(rank_position=None, popularity=None)
+        started_at = time.perf_counter()
+        sql_count = recalculate_game_ranks()
+        sql_time = time.perf_counter() - started_at
+
+        if set(GameStats.objects.values_list("game_id", "rank_position", "popularity")) != expected_ranks:
+            msg = f"The SQL ranks differ from the legacy ranks for {size} games."
+            raise CommandError(msg)
+
+        started_at = time.perf_counter()
+        unchanged_count = recalculate_game_ranks()
+        unchanged_time = time.perf_counter() - started_at
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{size} games: legacy {legacy_time:.2f}s ({legacy_count} rows written), "
+                f"sql {sql_time:.2f}s ({sql_count} rows written), "
+                f"sql without changes {unchanged_time:.2f}s ({unchanged_count} rows written).",
+            ),
+        )
@@ -1,16 +1,21 @@
 """A custom django command to import data from the IGDB database."""
 
-import time
-from dataclasses import dataclass
+import functools
+from dataclasses import asdict, dataclass
 from datetime import UTC, date, datetime
-from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self, TypeVar, cast
 
-from django.core.management.base import BaseCommand, CommandParser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections
 from django.db.models import Max
+from django.utils import timezone
 
+from my_game_list.games.cache import invalidate_dictionaries_caches, invalidate_game_caches, invalidate_game_details
+from my_game_list.games.cards import refresh_game_cards
 from my_game_list.games.management.commands._igdb_wrapper import (
     IGDBApiResponse,
     IGDBCompanyResponse,
+    IGDBDeadLetter,
     IGDBEndpoints,
     IGDBExternalGameResponse,
     IGDBExternalGameSourceResponse,
@@ -27,6 +32,8 @@
     IGDBPlayerPerspectiveResponse,
     IGDBWrapper,
 )
+from my_game_list.games.management.commands._import_pipeline import PipelineStats, iter_pipelined
+from my_game_list.games.management.commands._import_scheduler import run_in_dependency_order
 from my_game_list.games.models import (
     Company,
     ExternalGame,
@@ -37,13 +44,15 @@
     GameStatus,
     GameType,
     Genre,
+    IGDBImportCheckpoint,
+    IGDBImportStatus,
     Platform,
     PlayerPerspective,
 )
 from my_game_list.games.utils import normalize_title
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
 
 ModelType = TypeVar(
@@ -76,11 +85,31 @@ class Command(BaseCommand):  # NOSONAR(S8443) - Already inheriting from BaseComm
 
     help = "Import data from the IGDB database."
     NAME_UPDATED_AT_QUERY = "fields name, updated_at;"
+    IMPORT_DEPENDENCIES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "external_games": ("external_game_sources",),
+        "games": (
+            "platforms",
+            "genres",
+            "companies",
+            "game_modes",
+            "player_perspectives",
+            "game_engines",
+            "game_types",
+            "game_statuses",
+            "external_games",
+        ),
+    }
+    """The imports every import depends on, e.g. the games are related to the imported dictionaries."""
+    RECURSIVE_RELATIONS_QUERY = (
+        "fields name, slug, updated_at, parent_game, "
+        "bundles, dlcs, expanded_games, expansions, forks, ports, standalone_expansions;"
+    )
 
     def __init__(self: Self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         """Initializer for the command."""
         super().__init__(*args, **kwargs)
         self.igdb_wrapper = IGDBWrapper()
+        self.resume = False
 
     def add_arguments(self: Self, parser: CommandParser) -> None:
         """Add arguments to the command."""
@@ -107,6 +136,20 @@ def add_arguments(self: Self, parser: CommandParser) -> None:
             action="store_true",
             help="Import all data from the beginning, ignoring the last update time.",
         )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help=(
+                "The number of the imports run concurrently, sharing the rate limit of IGDB. "
+                "Every import is started once the imports it depends on finished."
+            ),
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Resume the interrupted imports after the last imported objects, with the windows they started with.",
+        )
 
     @staticmethod
     def _get_company(
@@ -270,28 +313,51 @@ def _get_model_input(
 
         return model_input
 
-    def _build_query(
+    def _get_checkpoint(
         self: Self,
-        query: str,
+        endpoint: IGDBEndpoints,
         model: type[ModelType],
         *,
         import_all: bool,
         import_start_timestamp: int | None,
-    ) -> str:
-        """Build the query string with appropriate time bounds."""
-        last_updated_at = model.objects.aggregate(max_updated_at=Max("igdb_updated_at"))["max_updated_at"]
+    ) -> IGDBImportCheckpoint:
+        """Get the checkpoint of the interrupted import when resuming, or start the checkpoint of a new import.
 
-        where_clauses = []
-        if last_updated_at and not import_all:
-            timestamp = int(last_updated_at.timestamp())
-            where_clauses.append(f"updated_at > {timestamp}")
+        The new import starts where the last finished one ended, so the objects of an interrupted import,
+        which are imported in the order of their IDs rather than their update times, are not skipped.
+        """
+        checkpoints = IGDBImportCheckpoint.objects.filter(endpoint=endpoint.value).order_by("-id")
+        if self.resume and (checkpoint := checkpoints.first()) and checkpoint.status != IGDBImportStatus.FINISHED:
+            self.stdout.write(f"Resuming the import of {endpoint.value} after IGDB ID {checkpoint.last_igdb_id}.")
+            checkpoint.status = IGDBImportStatus.RUNNING
+            checkpoint.error = ""
+            checkpoint.save(update_fields=["status", "error", "last_modified_at"])
+            return checkpoint
+
+        updated_after = None
+        if not import_all:
+            last_finished_checkpoint = checkpoints.filter(status=IGDBImportStatus.FINISHED).first()
+            updated_after = (
+                last_finished_checkpoint.updated_before
+                if last_finished_checkpoint and last_finished_checkpoint.updated_before
+                else model.objects.aggregate(max_updated_at=Max("igdb_updated_at"))["max_updated_at"]
+            )
 
-        if import_start_timestamp:
-            where_clauses.append(f"updated_at <= {import_start_timestamp}")
+        return IGDBImportCheckpoint.objects.create(
+            endpoint=endpoint.value,
+            updated_after=updated_after,
+            updated_before=(datetime.fromtimestamp(import_start_timestamp, tz=UTC) if import_start_timestamp else None),
+        )
 
-        if where_clauses:
-            return f"{query} where {' & '.join(where_clauses)};"
-        return query
+    @staticmethod
+    def _get_where(checkpoint: IGDBImportCheckpoint) -> str:
+        """Get the conditions of the update times of the objects within the window of the checkpoint."""
+        where_clauses = []
+        if checkpoint.updated_after:
+            where_clauses.append(f"updated_at > {int(checkpoint.updated_after.timestamp())}")
+        if checkpoint.updated_before:
+            where_clauses.append(f"updated_at <= {int(checkpoint.updated_before.timestamp())}")
+        return " & ".join(where_clauses)
 
     def _get_company_mapping(self: Self, unique_data_from_igdb: list[IGDBObject]) -> dict[int, Company]:
         """Get the mapping of IGDB company IDs to local Company objects for a batch of games."""
@@ -314,9 +380,12 @@ def _import_data(  # noqa: PLR0913
         *,
         import_all: bool = False,
         import_start_timestamp: int | None = None,
+        on_resume: Callable[[IGDBImportCheckpoint, str], None] | None = None,
     ) -> Iterator[tuple[list[ModelType], IGDBApiResponse]]:
         """Import data from the IGDB database to the application database.
 
+        The progress is saved in the checkpoint of the import after every batch processed by the caller.
+
         Args:
             endpoint (IGDBEndpoints): The IGDB endpoint to fetch data from.
             query (str): The query string for the IGDB API.
@@ -324,57 +393,165 @@ def _import_data(  # noqa: PLR0913
             extra_mappings (dict[str, dict[int, Any]] | None): Extra mappings for model creation.
             import_all (bool): Whether to import all data ignoring last update time.
             import_start_timestamp (int | None): The timestamp when the import process started.
+            on_resume (Callable[[IGDBImportCheckpoint, str], None] | None): Called with the checkpoint and its
+                conditions before resuming the interrupted import.
 
         Yields:
             Iterator[tuple[list[ModelType], IGDBApiResponse]]: A generator yielding a tuple containing
             a list of created model instances and the raw IGDB API response data for each batch.
         """
-        query = self._build_query(query, model, import_all=import_all, import_start_timestamp=import_start_timestamp)
+        checkpoint = self._get_checkpoint(
+            endpoint,
+            model,
+            import_all=import_all,
+            import_start_timestamp=import_start_timestamp,
+        )
+        where = self._get_where(checkpoint)
 
-        self.stdout.write(f"Fetching data from IGDB endpoint: {endpoint.value}, query: {query}")
+        self.stdout.write(
+            f"Fetching data from IGDB endpoint: {endpoint.value}, query: {query}, where: {where}, "
+            f"after IGDB ID: {checkpoint.last_igdb_id}",
+        )
 
-        for data_from_igdb in self.igdb_wrapper.iter_all_objects(endpoint=endpoint, query=query):
+        try:
+            if checkpoint.last_igdb_id and on_resume:
+                on_resume(checkpoint, where)
+            yield from self._import_batches(endpoint, query, model, checkpoint, where, extra_mappings)
+        except Exception as e:
+            checkpoint.status = IGDBImportStatus.FAILED
+            checkpoint.error = str(e)[:255]
+            checkpoint.finished_at = timezone.now()
+            checkpoint.save(update_fields=["status", "error", "finished_at", "last_modified_at"])
+            raise
+
+        checkpoint.status = IGDBImportStatus.FINISHED
+        checkpoint.finished_at = timezone.now()
+        checkpoint.save(update_fields=["status", "finished_at", "last_modified_at"])
+
+    def _import_batches(  # noqa: PLR0913
+        self: Self,
+        endpoint: IGDBEndpoints,
+        query: str,
+        model: type[ModelType],
+        checkpoint: IGDBImportCheckpoint,
+        where: str,
+        extra_mappings: dict[str, dict[int, Any]] | None = None,
+    ) -> Iterator[tuple[list[ModelType], IGDBApiResponse]]:
+        """Import the batches of the objects within the conditions after the last imported ID of the checkpoint."""
+        # The next batches are fetched in the background while the current one is written to the database.
+        stats = PipelineStats()
+        batches = self.igdb_wrapper.iter_all_objects(
+            endpoint=endpoint,
+            query=query,
+            where=where,
+            after_id=checkpoint.last_igdb_id,
+        )
+        for data_from_igdb in iter_pipelined(batches, stats):
             if not data_from_igdb:
                 continue
 
-            # Deduplicate data_from_igdb based on id, keeping the last occurrence
-            data_from_igdb_dict = {item.id: item for item in data_from_igdb}
-            unique_data_from_igdb = list(data_from_igdb_dict.values())
+            imported_objects, unique_data_from_igdb = self._write_batch(data_from_igdb, model, extra_mappings)
+            yield imported_objects, unique_data_from_igdb
+            # The batch is processed by the caller, e.g. its relations are set, before the next batch is written.
+            invalidate_game_details()
 
-            # Prepare mapping for companies if importing games
-            company_igdb_to_db_mapping = {}
-            if model == Game:
-                company_igdb_to_db_mapping = self._get_company_mapping(unique_data_from_igdb)
+            checkpoint.last_igdb_id = max(item.id for item in unique_data_from_igdb)
+            checkpoint.imported_count += len(unique_data_from_igdb)
+            checkpoint.dead_letters.extend(
+                asdict(letter) for letter in self.igdb_wrapper.take_dead_letters(endpoint.value)
+            )
+            checkpoint.save(update_fields=["last_igdb_id", "imported_count", "dead_letters", "last_modified_at"])
 
-            data_to_import = []
-            update_fields: set[str] = set()
+        self.stdout.write(stats.report(endpoint.value))
+        yield from self._replay_dead_letters(checkpoint, model, extra_mappings)
 
-            for data in unique_data_from_igdb:
-                model_input = self._get_model_input(
-                    data,
-                    company_igdb_to_db_mapping,
-                    extra_mappings=extra_mappings,
-                )
-                data_to_import.append(model(**model_input))
-                update_fields.update(model_input.keys())
-
-            update_fields.discard("igdb_id")
-
-            if model is Game:
-                for game_obj in cast("list[Game]", data_to_import):  # type: ignore[redundant-cast]
-                    parts = {normalize_title(t) for t in (game_obj.title_en or "", game_obj.title_pl or "") if t}
-                    game_obj.search_title = " ".join(sorted(parts))
-                update_fields.add("search_title")
-
-            yield (
-                model.objects.bulk_create(
-                    data_to_import,
-                    update_conflicts=True,
-                    unique_fields=["igdb_id"],
-                    update_fields=list(update_fields),
-                ),
-                unique_data_from_igdb,
+    def _replay_dead_letters(
+        self: Self,
+        checkpoint: IGDBImportCheckpoint,
+        model: type[ModelType],
+        extra_mappings: dict[str, dict[int, Any]] | None = None,
+    ) -> Iterator[tuple[list[ModelType], IGDBApiResponse]]:
+        """Replay the pages which failed after all the retries, including the pages of the interrupted import.
+
+        The pages failing again are kept in the checkpoint, so they are replayed when the import is resumed.
+
+        Raises:
+            IGDBInteractionError: If any page failed again.
+        """
+        pending_letters: list[dict[str, str]] = [
+            *checkpoint.dead_letters,
+            *(asdict(letter) for letter in self.igdb_wrapper.take_dead_letters(checkpoint.endpoint)),
+        ]
+        failed_letters: list[dict[str, str]] = []
+        if pending_letters:
+            self.stdout.write(self.style.NOTICE(f"Replaying {len(pending_letters)} failed pages..."))
+
+        while pending_letters:
+            dead_letter = pending_letters.pop(0)
+            try:
+                data_from_igdb = self.igdb_wrapper.replay_dead_letter(IGDBDeadLetter(**dead_letter))
+            except IGDBInteractionError as e:
+                failed_letters.append({**dead_letter, "error": str(e)})
+                data_from_igdb = []
+
+            if data_from_igdb:
+                imported_objects, unique_data_from_igdb = self._write_batch(data_from_igdb, model, extra_mappings)
+                yield imported_objects, unique_data_from_igdb
+                invalidate_game_details()
+                checkpoint.imported_count += len(unique_data_from_igdb)
+
+            checkpoint.dead_letters = [*failed_letters, *pending_letters]
+            checkpoint.save(update_fields=["imported_count", "dead_letters", "last_modified_at"])
+
+        if failed_letters:
+            error_message = f"{len(failed_letters)} pages failed again, they are replayed when the import is resumed."
+            raise IGDBInteractionError(error_message)
+
+    def _write_batch(
+        self: Self,
+        data_from_igdb: IGDBApiResponse,
+        model: type[ModelType],
+        extra_mappings: dict[str, dict[int, Any]] | None = None,
+    ) -> tuple[list[ModelType], IGDBApiResponse]:
+        """Create or update the objects of the batch, returning them with the deduplicated data from IGDB."""
+        # Deduplicate data_from_igdb based on id, keeping the last occurrence
+        data_from_igdb_dict = {item.id: item for item in data_from_igdb}
+        unique_data_from_igdb = list(data_from_igdb_dict.values())
+
+        # Prepare mapping for companies if importing games
+        company_igdb_to_db_mapping = {}
+        if model == Game:
+            company_igdb_to_db_mapping = self._get_company_mapping(unique_data_from_igdb)
+
+        data_to_import = []
+        update_fields: set[str] = set()
+
+        for data in unique_data_from_igdb:
+            model_input = self._get_model_input(
+                data,
+                company_igdb_to_db_mapping,
+                extra_mappings=extra_mappings,
             )
+            data_to_import.append(model(**model_input))
+            update_fields.update(model_input.keys())
+
+        update_fields.discard("igdb_id")
+
+        if model is Game:
+            for game_obj in cast("list[Game]", data_to_import):  # type: ignore[redundant-cast]
+                parts = {normalize_title(t) for t in (game_obj.title_en or "", game_obj.title_pl or "") if t}
+                game_obj.search_title = " ".join(sorted(parts))
+            update_fields.add("search_title")
+
+        return (
+            model.objects.bulk_create(
+                data_to_import,
+                update_conflicts=True,
+                unique_fields=["igdb_id"],
+                update_fields=list(update_fields),
+            ),
+            unique_data_from_igdb,
+        )
 
     def import_games(self: Self, *, import_all: bool = False, import_start_timestamp: int | None = None) -> None:
         """Import games from the IGDB database to the application database."""
@@ -425,6 +602,11 @@ def import_games(self: Self, *, import_all: bool = False, import_start_timestamp
             extra_mappings=extra_mappings,
             import_all=import_all,
             import_start_timestamp=import_start_timestamp,
+            on_resume=lambda checkpoint, where: self._collect_resumed_recursive_relations(
+                checkpoint,
+                where,
+                collector,
+            ),
         ):
             total_imported_games += len(imported_games)
             self._process_game_batch(
@@ -555,6 +737,31 @@ def _collect_recursive_relations(
                     target_list.append((imported_game.id, t))
                     collector.all_target_igdb_ids.add(t)
 
+    def _collect_resumed_recursive_relations(
+        self: Self,
+        checkpoint: IGDBImportCheckpoint,
+        where: str,
+        collector: RecursiveDataCollector,
+    ) -> None:
+        """Collect the recursive relations of the games imported before the import was interrupted.
+
+        The recursive relations are set after all the games are imported, so only the fields of these relations
+        of the already imported games are fetched again.
+        """
+        self.stdout.write(self.style.NOTICE("Collecting the recursive relations of the imported games..."))
+        conditions = " & ".join(condition for condition in (where, f"id <= {checkpoint.last_igdb_id}") if condition)
+        for igdb_games in self.igdb_wrapper.iter_all_objects(
+            endpoint=IGDBEndpoints.GAMES,
+            query=self.RECURSIVE_RELATIONS_QUERY,
+            where=conditions,
+        ):
+            game_ids = dict(
+                Game.objects.filter(igdb_id__in=[game.id for game in igdb_games]).values_list("igdb_id", "id"),
+            )
+            for game_from_igdb in igdb_games:
+                if isinstance(game_from_igdb, IGDBGameResponse) and game_from_igdb.id in game_ids:
+                    self._collect_recursive_relations(Game(id=game_ids[game_from_igdb.id]), game_from_igdb, collector)
+
     def _bulk_create_simple_relations(
         self: Self,
         rel_containers: dict[str, list[Any]],
@@ -823,17 +1030,39 @@ def handle(self: Self, *args: None, **options: dict[str, int | None | str]) -> N
         }
 
         import_all = bool(options.get("all", False))
+        self.resume = bool(options.get("resume", False))
         import_start_timestamp = int(datetime.now(tz=UTC).timestamp())
-
-        for item in options["what_to_import"]:
-            action = actions.get(item)
-            if action:
-                try:
-                    action(import_all=import_all, import_start_timestamp=import_start_timestamp)
-                except Exception as e:  # noqa: BLE001
-                    self.stdout.write(self.style.ERROR(f"Error importing {item}: {e}"))
-            time.sleep(1)  # To avoid hitting IGDB rate limits
-
+        jobs = cast("int", options.get("jobs") or 1)
+
+        def run_import(item: str) -> None:
+            try:
+                actions[item](import_all=import_all, import_start_timestamp=import_start_timestamp)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"Error importing {item}: {e}"))
+                raise
+            finally:
+                if jobs > 1:
+                    # The imports run concurrently use the database connections of their threads.
+                    connections.close_all()
+
+        try:
+            errors = run_in_dependency_order(
+                {item: functools.partial(run_import, item) for item in options["what_to_import"]},
+                self.IMPORT_DEPENDENCIES,
+                max_workers=jobs,
+            )
+        finally:
+            # The session of the wrapper keeps its thread pool and the connections to IGDB open until closed.
+            self.igdb_wrapper.close()
+        failed_items = [item for item in dict.fromkeys(options["what_to_import"]) if item in errors]
+
+        updated_count = refresh_game_cards()
+        self.stdout.write(f"Created or updated {updated_count} game cards.")
+        invalidate_game_caches()
+        invalidate_dictionaries_caches()
+        if failed_items:
+            message = f"Failed to import: {', '.join(failed_items)}. Run the import with --resume to continue."
+            raise CommandError(message)
         self.stdout.write(
             self.style.SUCCESS("Import process completed."),
         )
@@ -1,27 +1,88 @@
 """Management command to recalculate game statistics."""
 
 import itertools
-from typing import Any
+import time
+from contextlib import contextmanager
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, Any, Self
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db.models import Avg, Count, Sum
 
 from my_game_list.games.models import Game, GameList, GameStats
+from my_game_list.games.stats import STATS_AGGREGATE_FIELDS, get_game_stats_aggregates, upsert_all_game_stats
 from my_game_list.games.tasks import recalculate_ranks
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.core.management.base import CommandParser
+
 
 class Command(BaseCommand):  # NOSONAR(S8443) - Already inheriting from BaseCommand
     """Recalculate statistics for all games."""
 
     help = "Recalculates score_sum, score_count, average_score, members_count, and ranks for all games."
     BATCH_SIZE = 2000
+    MAX_REPORTED_DRIFTS = 20
+    ENGINE_BATCHED = "batched"
+    ENGINE_SQL = "sql"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--check-drift",
+            action="store_true",
+            help="Compare the stored statistics with a full recompute without writing anything. "
+            "Exits with an error if any game has drifted.",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=(self.ENGINE_BATCHED, self.ENGINE_SQL),
+            default=self.ENGINE_BATCHED,
+            help="The engine used to rebuild the aggregates: batched Python updates "
+            "or a single INSERT ... SELECT ... GROUP BY ... ON CONFLICT DO UPDATE statement.",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
         """Execute the command."""
-        self.stdout.write("Starting statistics recalculation...")
-
-        # 1. Ensure GameStats exist for all games
-        self.stdout.write("Creating missing GameStats...")
+        if options["check_drift"]:
+            self._check_drift()
+            return
+
+        self.stdout.write(f"Starting statistics recalculation with the {options['engine']} engine...")
+        started_at = time.perf_counter()
+
+        if options["engine"] == self.ENGINE_SQL:
+            with self._phase("Upserting GameStats aggregates"):
+                updated_count = upsert_all_game_stats()
+            self.stdout.write(f"Created or updated {updated_count} GameStats.")
+        else:
+            with self._phase("Creating missing GameStats"):
+                self._create_missing_stats()
+            with self._phase("Updating GameStats aggregates"):
+                self._update_aggregates()
+
+        with self._phase("Recalculating ranks"):
+            # Synchronously for the command
+            recalculate_ranks()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully recalculated all game statistics in {time.perf_counter() - started_at:.2f}s.",
+            ),
+        )
+
+    @contextmanager
+    def _phase(self: Self, name: str) -> Iterator[None]:
+        """Report the duration of a phase of the recalculation."""
+        self.stdout.write(f"{name}...")
+        started_at = time.perf_counter()
+        yield
+        self.stdout.write(f"{name} took {time.perf_counter() - started_at:.2f}s.")
+
+    def _create_missing_stats(self: Self) -> None:
+        """Ensure GameStats exist for all games."""
         missing_games = Game.objects.filter(stats__isnull=True)
 
         # Create missing stats in batches
@@ -36,9 +97,8 @@ def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
             GameStats.objects.bulk_create(missing_stats)
             self.stdout.write(f"Created {len(missing_stats)} missing GameStats...")
 
-        # 2. Update Stats in Batches (Memory Efficient)
-        self.stdout.write("Updating GameStats aggregates...")
-
+    def _update_aggregates(self: Self) -> None:
+        """Update Stats in Batches (Memory Efficient)."""
         total_stats = GameStats.objects.count()
         processed_count = 0
         update_fields = ["score_sum", "score_count", "average_score", "members_count"]
@@ -87,9 +147,45 @@ def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
             processed_count += len(batch)
             self.stdout.write(f"Updated {processed_count}/{total_stats} stats...")
 
-        self.stdout.write("Aggregates updated. Recalculating ranks...")
+    @staticmethod
+    def _normalize(values: dict[str, Any]) -> tuple[int, int, Decimal, int]:
+        """Normalize the aggregate values so stored and computed statistics can be compared."""
+        return (
+            values["score_sum"],
+            values["score_count"],
+            Decimal(values["average_score"]).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+            values["members_count"],
+        )
+
+    def _check_drift(self: Self) -> None:
+        """Verify that the incrementally maintained statistics match a full recompute."""
+        self.stdout.write("Checking GameStats drift...")
+
+        missing_stats_count = Game.objects.filter(stats__isnull=True).count()
+        if missing_stats_count:
+            self.stdout.write(self.style.WARNING(f"{missing_stats_count} games have no GameStats."))
+
+        empty_values = {"score_sum": 0, "score_count": 0, "average_score": Decimal(0), "members_count": 0}
+        stats_qs = GameStats.objects.values("game_id", *STATS_AGGREGATE_FIELDS).order_by("id")
+        checked_count = 0
+        drifted_count = 0
 
-        # 3. Recalculate ranks (Synchronously for the command)
-        recalculate_ranks()
+        for batch in itertools.batched(stats_qs.iterator(chunk_size=self.BATCH_SIZE), self.BATCH_SIZE, strict=False):
+            aggregates = get_game_stats_aggregates(stats["game_id"] for stats in batch)
+            for stats in batch:
+                stored = self._normalize(stats)
+                expected = self._normalize(aggregates.get(stats["game_id"], empty_values))
+                if stored != expected:
+                    drifted_count += 1
+                    if drifted_count <= self.MAX_REPORTED_DRIFTS:
+                        self.stdout.write(f"Game {stats['game_id']}: stored {stored}, expected {expected}")
+            checked_count += len(batch)
+
+        if drifted_count or missing_stats_count:
+            msg = (
+                f"Found {drifted_count} drifted GameStats out of {checked_count} "
+                f"and {missing_stats_count} games without GameStats."
+            )
+            raise CommandError(msg)
 
-        self.stdout.write(self.style.SUCCESS("Successfully recalculated all game statistics."))
+        self.stdout.write(self.style.SUCCESS(f"No drift found in {checked_count} GameStats."))
@@ -0,0 +1,57 @@
+"""Management command to warm up the cache of the game details."""
+
+import itertools
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from django.utils import translation
+from rest_framework.renderers import JSONRenderer
+
+from my_game_list.games.cache import get_game_detail_cache_key
+from my_game_list.games.models import Game
+from my_game_list.games.serializers import GameSerializer
+from my_game_list.my_game_list.mixins import cache_rendered_content
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+
+class Command(BaseCommand):  # NOSONAR(S8443) - Already inheriting from BaseCommand
+    """Render and cache the details of the most popular games."""
+
+    help = "Renders and caches the details of the most popular games in every language, like the game detail endpoint."
+    BATCH_SIZE = 100
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=1000,
+            help="The number of the most popular games to warm up.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Execute the command."""
+        game_ids = Game.objects.order_by(F("stats__popularity").asc(nulls_last=True), "id").values_list(
+            "id",
+            flat=True,
+        )[: options["top"]]
+        renderer = JSONRenderer()
+        timeout = settings.GAME_DETAIL_CACHE_TIMEOUT
+        warmed_count = 0
+
+        for batch in itertools.batched(game_ids, self.BATCH_SIZE, strict=False):
+            for game in Game.objects.with_details().filter(id__in=batch):
+                for language, _ in settings.LANGUAGES:
+                    with translation.override(language):
+                        key = get_game_detail_cache_key(game.pk, translation.get_language(), renderer.media_type)
+                        cache_rendered_content(key, renderer.render(GameSerializer(game).data), timeout)
+                warmed_count += 1
+            self.stdout.write(f"Cached the details of {warmed_count} games...")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully cached the details of {warmed_count} games in every language."),
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.6 on 2026-10-18 19:30
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0029_add_search_title_to_game"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                django.db.models.functions.comparison.Collate("search_title", "C"),
+                name="games_game_search_title_prefix",
+            ),
+        ),
+    ]
@@ -0,0 +1,159 @@
+# Generated by Django 6.0.6 on 2026-10-18 19:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0030_game_search_title_prefix_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameCard",
+            fields=[
+                (
+                    "game",
+                    models.OneToOneField(
+                        help_text="The game this card belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="games.game",
+                    ),
+                ),
+                ("title", models.CharField(help_text="The game's title.", max_length=255, verbose_name="title")),
+                (
+                    "title_en",
+                    models.CharField(help_text="The game's title.", max_length=255, null=True, verbose_name="title"),
+                ),
+                (
+                    "title_pl",
+                    models.CharField(help_text="The game's title.", max_length=255, null=True, verbose_name="title"),
+                ),
+                (
+                    "slug",
+                    models.SlugField(help_text="URL-safe identifier of the game.", max_length=512, verbose_name="slug"),
+                ),
+                (
+                    "release_date",
+                    models.DateField(
+                        blank=True,
+                        help_text="The worldwide release date of the game.",
+                        null=True,
+                        verbose_name="release date",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(help_text="The creation time of the game.", verbose_name="creation time"),
+                ),
+                (
+                    "cover_image_id",
+                    models.CharField(
+                        blank=True,
+                        help_text="The IGDB cover image ID used to construct the cover image URL.",
+                        max_length=255,
+                        verbose_name="cover image id",
+                    ),
+                ),
+                (
+                    "average_score",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="The computed average score across all user ratings.",
+                        max_digits=4,
+                        verbose_name="average score",
+                    ),
+                ),
+                (
+                    "scores_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of users who have scored the game.",
+                        verbose_name="scores count",
+                    ),
+                ),
+                (
+                    "rank_position",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The game's position in the all-time ranking, 0 when not ranked yet.",
+                        verbose_name="rank position",
+                    ),
+                ),
+                (
+                    "members_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of users who have the game in their game list.",
+                        verbose_name="members count",
+                    ),
+                ),
+                (
+                    "popularity",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The game's popularity rank, 0 when not ranked yet.",
+                        verbose_name="popularity",
+                    ),
+                ),
+                (
+                    "game_status",
+                    models.CharField(
+                        blank=True,
+                        help_text="The release status name of the game.",
+                        max_length=255,
+                        null=True,
+                        verbose_name="game status",
+                    ),
+                ),
+                (
+                    "game_status_en",
+                    models.CharField(
+                        blank=True,
+                        help_text="The release status name of the game.",
+                        max_length=255,
+                        null=True,
+                        verbose_name="game status",
+                    ),
+                ),
+                (
+                    "game_status_pl",
+                    models.CharField(
+                        blank=True,
+                        help_text="The release status name of the game.",
+                        max_length=255,
+                        null=True,
+                        verbose_name="game status",
+                    ),
+                ),
+                (
+                    "game_type",
+                    models.CharField(
+                        blank=True, help_text="The game type name.", max_length=255, null=True, verbose_name="game type"
+                    ),
+                ),
+                (
+                    "game_type_en",
+                    models.CharField(
+                        blank=True, help_text="The game type name.", max_length=255, null=True, verbose_name="game type"
+                    ),
+                ),
+                (
+                    "game_type_pl",
+                    models.CharField(
+                        blank=True, help_text="The game type name.", max_length=255, null=True, verbose_name="game type"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "game card",
+                "verbose_name_plural": "game cards",
+            },
+        ),
+    ]
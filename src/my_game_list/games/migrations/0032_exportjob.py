@@ -0,0 +1,102 @@
+# Generated by Django 6.0.6 on 2026-10-18 20:07
+
+import django.db.models.deletion
+import my_game_list.games.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0031_gamecard"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportJob",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("game_list", "Game list"), ("collections", "Collections"), ("reviews", "Reviews")],
+                        help_text="The kind of the exported data (game list, collections or reviews).",
+                        max_length=20,
+                        verbose_name="kind",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("finished", "Finished"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        help_text="The status of the export (pending, running, finished or failed).",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "language",
+                    models.CharField(
+                        help_text="The language of the exported data.", max_length=10, verbose_name="language"
+                    ),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        blank=True,
+                        help_text="The gzip compressed JSON Lines artifact, set when the export is finished.",
+                        upload_to=my_game_list.games.models.get_export_job_file_path,
+                        verbose_name="file",
+                    ),
+                ),
+                (
+                    "entries_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="The number of exported entries.", verbose_name="entries count"
+                    ),
+                ),
+                (
+                    "error",
+                    models.CharField(
+                        blank=True,
+                        help_text="The reason of the failure of the export.",
+                        max_length=255,
+                        verbose_name="error",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="creation time")),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The time the export finished or failed.",
+                        null=True,
+                        verbose_name="finished at",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user whose data is exported.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="export_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "export job",
+                "verbose_name_plural": "export jobs",
+                "ordering": ("id",),
+                "abstract": False,
+            },
+        ),
+    ]
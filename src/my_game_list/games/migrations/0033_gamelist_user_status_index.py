@@ -0,0 +1,19 @@
+# Generated by Django 6.0.6 on 2026-10-18 20:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0032_exportjob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gamelist",
+            index=models.Index(fields=["user", "status", "id"], name="games_gamelist_user_status_idx"),
+        ),
+    ]
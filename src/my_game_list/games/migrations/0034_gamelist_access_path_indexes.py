@@ -0,0 +1,46 @@
+# Generated by Django 6.0.6 on 2026-10-18 20:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0033_gamelist_user_status_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gamelist",
+            index=models.Index(fields=["user", "-last_modified_at"], name="games_gamelist_user_mod_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="gamelist",
+            index=models.Index(fields=["game"], include=("score", "id"), name="games_gamelist_game_score_idx"),
+        ),
+        migrations.AlterField(
+            model_name="gamelist",
+            name="game",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="The game this list entry refers to.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="game_lists",
+                to="games.game",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="gamelist",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="The user who owns this game list entry.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="game_lists",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 6.0.6 on 2026-10-18 20:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0034_gamelist_access_path_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IGDBImportCheckpoint",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "endpoint",
+                    models.CharField(help_text="The imported IGDB endpoint.", max_length=30, verbose_name="endpoint"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("finished", "Finished"), ("failed", "Failed")],
+                        default="running",
+                        help_text="The status of the import (running, finished or failed).",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "last_igdb_id",
+                    models.PositiveBigIntegerField(
+                        default=0,
+                        help_text="The IGDB ID of the last imported object, the import is resumed after it.",
+                        verbose_name="last IGDB ID",
+                    ),
+                ),
+                (
+                    "updated_after",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The exclusive lower bound of the update time of the imported objects, empty for all objects.",
+                        null=True,
+                        verbose_name="updated after",
+                    ),
+                ),
+                (
+                    "updated_before",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The inclusive upper bound of the update time of the imported objects, the start of the import.",
+                        null=True,
+                        verbose_name="updated before",
+                    ),
+                ),
+                (
+                    "imported_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="The number of imported objects.", verbose_name="imported count"
+                    ),
+                ),
+                (
+                    "error",
+                    models.CharField(
+                        blank=True,
+                        help_text="The reason of the failure of the import.",
+                        max_length=255,
+                        verbose_name="error",
+                    ),
+                ),
+                ("started_at", models.DateTimeField(auto_now_add=True, verbose_name="start time")),
+                ("last_modified_at", models.DateTimeField(auto_now=True, verbose_name="last modified")),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The time the import finished or failed.",
+                        null=True,
+                        verbose_name="finished at",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "IGDB import checkpoint",
+                "verbose_name_plural": "IGDB import checkpoints",
+                "ordering": ("id",),
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.6 on 2026-10-18 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0035_igdbimportcheckpoint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="igdbimportcheckpoint",
+            name="dead_letters",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="The requests of the pages which failed after all the retries, replayed at the end of the import.",
+                verbose_name="dead letters",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.6 on 2026-10-18 20:57
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0036_igdbimportcheckpoint_dead_letters"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="gamecard",
+            options={"ordering": ("pk",), "verbose_name": "game card", "verbose_name_plural": "game cards"},
+        ),
+    ]
@@ -9,16 +9,22 @@
 from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Collate
 from django.utils.html import format_html
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_stubs_ext.db.models import TypedModelMeta
 
-from my_game_list.games.querysets import GameQuerySet
+from my_game_list.games.querysets import GameCardQuerySet, GameQuerySet
 from my_game_list.games.utils import normalize_title
 from my_game_list.my_game_list.igdb_integration import IGDBImageSize, get_image_url
 from my_game_list.my_game_list.models import BaseDictionaryModel, BaseModel
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from django.db.models import QuerySet
+
 
 class IGDBModel(models.Model):
     """Base IGDB model.
@@ -143,6 +149,39 @@ class GameListStatus(models.TextChoices):
     ON_HOLD = "OH", _("On hold")
 
 
+class GameListExportFormat(models.TextChoices):
+    """File formats of the game list export."""
+
+    JSON = "json", _("JSON")
+    NDJSON = "ndjson", _("JSON Lines")
+    CSV = "csv", _("CSV")
+
+
+class ExportJobKind(models.TextChoices):
+    """Kinds of the data exported by the export jobs."""
+
+    GAME_LIST = "game_list", _("Game list")
+    COLLECTIONS = "collections", _("Collections")
+    REVIEWS = "reviews", _("Reviews")
+
+
+class ExportJobStatus(models.TextChoices):
+    """Statuses of the export jobs."""
+
+    PENDING = "pending", _("Pending")
+    RUNNING = "running", _("Running")
+    FINISHED = "finished", _("Finished")
+    FAILED = "failed", _("Failed")
+
+
+class IGDBImportStatus(models.TextChoices):
+    """Statuses of the IGDB import checkpoints."""
+
+    RUNNING = "running", _("Running")
+    FINISHED = "finished", _("Finished")
+    FAILED = "failed", _("Failed")
+
+
 class GameMedia(BaseDictionaryModel):
     """Data about media on which the game is owned."""
 
@@ -196,16 +235,19 @@ class GameList(BaseModel):
     created_at = models.DateTimeField(_("creation time"), auto_now_add=True)
     last_modified_at = models.DateTimeField(_("last modified"), auto_now=True)
 
+    # The lookups by the game and by the user are served by the composite indexes, see Meta.
     game = models.ForeignKey(
         "Game",
         on_delete=models.CASCADE,
         related_name="game_lists",
+        db_index=False,
         help_text="The game this list entry refers to.",
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="game_lists",
+        db_index=False,
         help_text="The user who owns this game list entry.",
     )
     owned_on = models.ManyToManyField(
@@ -214,6 +256,9 @@ class GameList(BaseModel):
         help_text="The media formats on which the user owns this game.",
     )
 
+    # (game_id, score) as last persisted, used to maintain GameStats incrementally.
+    loaded_stats_values: tuple[int, int | None] | None = None
+
     class Meta(BaseModel.Meta):
         """Meta data for game list model."""
 
@@ -222,11 +267,55 @@ class Meta(BaseModel.Meta):
         constraints: ClassVar[list[models.BaseConstraint]] = [
             models.UniqueConstraint(fields=("game", "user"), name="unique_game_user_in_game_list"),
         ]
+        # The indexes follow the hot access paths, their usage is reported by the report_index_usage command.
+        # The lookups of a game and a user are served by the unique constraint.
+        indexes: ClassVar[list[models.Index]] = [
+            # The entries of a user in a status, e.g. the random Plan to Play pick and the user statistics,
+            # also the entries of a user in any status.
+            models.Index(fields=["user", "status", "id"], name="games_gamelist_user_status_idx"),
+            # The latest updates of a user.
+            models.Index(fields=["user", "-last_modified_at"], name="games_gamelist_user_mod_idx"),
+            # The stats aggregation of games, with index-only scans.
+            models.Index(fields=["game"], include=["score", "id"], name="games_gamelist_game_score_idx"),
+        ]
 
     def __str__(self: Self) -> str:
         """String representation of the game list model."""
         return f"{self.user.username} - {self.game.title}"
 
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Collection[str], values: Collection[Any]) -> Self:
+        """Remember the stats-relevant values as loaded from the database.
+
+        The snapshot lets the stats signals apply a delta instead of re-aggregating the whole game.
+        """
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values, strict=True))
+        if "game_id" in loaded and "score" in loaded:
+            instance.loaded_stats_values = (loaded["game_id"], loaded["score"])
+        return instance
+
+    def refresh_from_db(
+        self: Self,
+        using: str | None = None,
+        fields: Iterable[str] | None = None,
+        from_queryset: QuerySet[Self] | None = None,
+    ) -> None:
+        """Reload the instance, and its stats snapshot when both the game and the score are reloaded.
+
+        Loading a deferred field reloads only that field, so the unsaved changes of the other fields
+        must not be taken into the snapshot.
+        """
+        if fields is None:
+            deferred_fields = self.get_deferred_fields()
+            reloads_stats_values = "game_id" not in deferred_fields and "score" not in deferred_fields
+        else:
+            fields = set(fields)
+            reloads_stats_values = bool(fields & {"game", "game_id"}) and "score" in fields
+        super().refresh_from_db(using, fields, from_queryset)
+        if reloads_stats_values:
+            self.loaded_stats_values = (self.game_id, self.score)
+
 
 class GameReview(BaseModel):
     """Contains reviews for games."""
@@ -266,6 +355,151 @@ def __str__(self: Self) -> str:
         return f"{self.user.username} - {self.game.title}"
 
 
+def get_export_job_file_path(instance: ExportJob, filename: str) -> str:
+    """Get the path of the export artifact, unique so the files cannot be guessed from the job IDs."""
+    return f"exports/{instance.user_id}/{uuid4()}-{filename}"
+
+
+class ExportJob(BaseModel):
+    """An export of the user's data run in the background.
+
+    The artifact is a gzip compressed JSON Lines file written to the media storage by a Celery task.
+    """
+
+    kind = models.CharField(
+        _("kind"),
+        max_length=20,
+        choices=ExportJobKind.choices,
+        help_text="The kind of the exported data (game list, collections or reviews).",
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=ExportJobStatus.choices,
+        default=ExportJobStatus.PENDING,
+        help_text="The status of the export (pending, running, finished or failed).",
+    )
+    language = models.CharField(
+        _("language"),
+        max_length=10,
+        help_text="The language of the exported data.",
+    )
+    file = models.FileField(
+        _("file"),
+        upload_to=get_export_job_file_path,
+        blank=True,
+        help_text="The gzip compressed JSON Lines artifact, set when the export is finished.",
+    )
+    entries_count = models.PositiveIntegerField(
+        _("entries count"),
+        default=0,
+        help_text="The number of exported entries.",
+    )
+    error = models.CharField(
+        _("error"),
+        max_length=255,
+        blank=True,
+        help_text="The reason of the failure of the export.",
+    )
+    created_at = models.DateTimeField(_("creation time"), auto_now_add=True)
+    finished_at = models.DateTimeField(
+        _("finished at"),
+        null=True,
+        blank=True,
+        help_text="The time the export finished or failed.",
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="export_jobs",
+        help_text="The user whose data is exported.",
+    )
+
+    class Meta(BaseModel.Meta):
+        """Meta data for export job model."""
+
+        verbose_name = _("export job")
+        verbose_name_plural = _("export jobs")
+
+    def __str__(self: Self) -> str:
+        """String representation of the export job model."""
+        return f"{self.user.username} - {self.kind} ({self.status})"
+
+
+class IGDBImportCheckpoint(BaseModel):
+    """The progress of the import of an IGDB endpoint, saved after every imported batch.
+
+    The objects updated within the window are imported in the order of their IGDB IDs,
+    so an interrupted import is resumed after the last imported ID with the same window.
+    """
+
+    endpoint = models.CharField(
+        _("endpoint"),
+        max_length=30,
+        help_text="The imported IGDB endpoint.",
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=IGDBImportStatus.choices,
+        default=IGDBImportStatus.RUNNING,
+        help_text="The status of the import (running, finished or failed).",
+    )
+    last_igdb_id = models.PositiveBigIntegerField(
+        _("last IGDB ID"),
+        default=0,
+        help_text="The IGDB ID of the last imported object, the import is resumed after it.",
+    )
+    updated_after = models.DateTimeField(
+        _("updated after"),
+        null=True,
+        blank=True,
+        help_text="The exclusive lower bound of the update time of the imported objects, empty for all objects.",
+    )
+    updated_before = models.DateTimeField(
+        _("updated before"),
+        null=True,
+        blank=True,
+        help_text="The inclusive upper bound of the update time of the imported objects, the start of the import.",
+    )
+    imported_count = models.PositiveIntegerField(
+        _("imported count"),
+        default=0,
+        help_text="The number of imported objects.",
+    )
+    error = models.CharField(
+        _("error"),
+        max_length=255,
+        blank=True,
+        help_text="The reason of the failure of the import.",
+    )
+    dead_letters = models.JSONField(
+        _("dead letters"),
+        default=list,
+        blank=True,
+        help_text="The requests of the pages which failed after all the retries, replayed at the end of the import.",
+    )
+    started_at = models.DateTimeField(_("start time"), auto_now_add=True)
+    last_modified_at = models.DateTimeField(_("last modified"), auto_now=True)
+    finished_at = models.DateTimeField(
+        _("finished at"),
+        null=True,
+        blank=True,
+        help_text="The time the import finished or failed.",
+    )
+
+    class Meta(BaseModel.Meta):
+        """Meta data for IGDB import checkpoint model."""
+
+        verbose_name = _("IGDB import checkpoint")
+        verbose_name_plural = _("IGDB import checkpoints")
+
+    def __str__(self: Self) -> str:
+        """String representation of the IGDB import checkpoint model."""
+        return f"{self.endpoint} - {self.last_igdb_id} ({self.status})"
+
+
 class Genre(BaseDictionaryModel, IGDBModel):
     """Data about game genres."""
 
@@ -661,6 +895,8 @@ class Meta(BaseModel.Meta):
         verbose_name_plural = _("games")
         indexes: ClassVar = [
             GinIndex(fields=["search_title"], name="games_game_search_title_gin", opclasses=["gin_trgm_ops"]),
+            # Serves the prefix lookups and the ordering of the autocomplete.
+            models.Index(Collate("search_title", "C"), name="games_game_search_title_prefix"),
         ]
 
     def __str__(self: Self) -> str:
@@ -722,3 +958,89 @@ def popularity(self: Self) -> int:
         if hasattr(self, "stats") and self.stats.popularity is not None:
             return self.stats.popularity
         return 0
+
+
+class GameCard(models.Model):
+    """A denormalized projection of a game holding exactly the fields of the games list.
+
+    The cards are refreshed with a set-based upsert from the games, their stats, statuses and types,
+    see `my_game_list.games.cards`, so the list is read from a single table.
+    """
+
+    game = models.OneToOneField(
+        Game,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="card",
+        help_text="The game this card belongs to.",
+    )
+    title = models.CharField(_("title"), max_length=255, help_text="The game's title.")
+    slug = models.SlugField(_("slug"), max_length=512, help_text="URL-safe identifier of the game.")
+    release_date = models.DateField(
+        _("release date"),
+        blank=True,
+        null=True,
+        help_text="The worldwide release date of the game.",
+    )
+    created_at = models.DateTimeField(_("creation time"), help_text="The creation time of the game.")
+    cover_image_id = models.CharField(
+        _("cover image id"),
+        max_length=255,
+        blank=True,
+        help_text="The IGDB cover image ID used to construct the cover image URL.",
+    )
+    average_score = models.DecimalField(
+        _("average score"),
+        max_digits=4,
+        decimal_places=2,
+        default=0,
+        help_text="The computed average score across all user ratings.",
+    )
+    scores_count = models.PositiveIntegerField(
+        _("scores count"),
+        default=0,
+        help_text="The number of users who have scored the game.",
+    )
+    rank_position = models.PositiveIntegerField(
+        _("rank position"),
+        default=0,
+        help_text="The game's position in the all-time ranking, 0 when not ranked yet.",
+    )
+    members_count = models.PositiveIntegerField(
+        _("members count"),
+        default=0,
+        help_text="The number of users who have the game in their game list.",
+    )
+    popularity = models.PositiveIntegerField(
+        _("popularity"),
+        default=0,
+        help_text="The game's popularity rank, 0 when not ranked yet.",
+    )
+    # Null for the games without a status or a type, like in the serialized games.
+    game_status = models.CharField(  # noqa: DJ001
+        _("game status"),
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text="The release status name of the game.",
+    )
+    game_type = models.CharField(  # noqa: DJ001
+        _("game type"),
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text="The game type name.",
+    )
+
+    objects = GameCardQuerySet.as_manager()
+
+    class Meta(TypedModelMeta):
+        """Meta data for the game card model."""
+
+        ordering = ("pk",)
+        verbose_name = _("game card")
+        verbose_name_plural = _("game cards")
+
+    def __str__(self: Self) -> str:
+        """String representation of the game card model."""
+        return f"{self.title} - Card"
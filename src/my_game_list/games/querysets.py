@@ -1,11 +1,112 @@
 """The queryset for the game related data."""
 
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Self, cast
 
-from django.db.models import QuerySet
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db.models import F, ManyToManyField, Model, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import JSONObject, NullIf
+from django.db.models.query import ModelIterable
 
 if TYPE_CHECKING:
-    from my_game_list.games.models import Game  # noqa: F401
+    from collections.abc import Collection, Iterator
+
+    from django.db.models import Field
+
+    from my_game_list.games.models import Game, GameCard  # noqa: F401 - GameCard is only named in a base class
+
+RELATED_GAME_FIELDS = ("id", "title", "slug", "cover_image_id")
+"""The fields of the related games shown in the game details."""
+
+GAME_DETAIL_RELATIONS: dict[str, tuple[str, ...] | None] = {
+    "genres": None,
+    "platforms": None,
+    "bundles": RELATED_GAME_FIELDS,
+    "dlcs": RELATED_GAME_FIELDS,
+    "expanded_games": RELATED_GAME_FIELDS,
+    "expansions": RELATED_GAME_FIELDS,
+    "forks": RELATED_GAME_FIELDS,
+    "ports": RELATED_GAME_FIELDS,
+    "standalone_expansions": RELATED_GAME_FIELDS,
+    "game_engines": None,
+    "game_modes": None,
+    "player_perspectives": None,
+    "external_games": None,
+}
+"""The many-to-many relations of the game details with the loaded fields, None loads all the fields."""
+
+GAME_DETAIL_RELATED_OBJECTS: dict[str, tuple[str, ...]] = {"external_games": ("external_game_source",)}
+"""The foreign keys of the related objects loaded together with them."""
+
+
+def get_json_fields(model: type[Model], field_names: Collection[str] | None = None) -> list[Field[Any, Any]]:
+    """Get the concrete fields of the model aggregated into JSON, with the translations of the translated fields."""
+    return [
+        field
+        for field in model._meta.concrete_fields  # noqa: SLF001
+        if field_names is None or getattr(field, "translated_field", field).name in field_names
+    ]
+
+
+def build_json_object(
+    model: type[Model],
+    field_names: Collection[str] | None = None,
+    related_objects: Collection[str] = (),
+    prefix: str = "",
+) -> JSONObject:
+    """Build the JSON object with the fields of the model, the foreign keys in `related_objects` are nested objects."""
+    values: dict[str, Any] = {
+        field.attname: F(f"{prefix}{field.attname}") for field in get_json_fields(model, field_names)
+    }
+    for name in related_objects:
+        related_model = cast("type[Model]", model._meta.get_field(name).related_model)  # noqa: SLF001
+        values[name] = build_json_object(related_model, prefix=f"{prefix}{name}__")
+    return JSONObject(**values)
+
+
+def build_instance(
+    model: type[Model],
+    data: dict[str, Any],
+    field_names: Collection[str] | None = None,
+    related_objects: Collection[str] = (),
+    db: str | None = None,
+) -> Model:
+    """Build the model instance from the JSON object, the fields not loaded into the object are deferred."""
+    fields = get_json_fields(model, field_names)
+    instance = model.from_db(
+        db,
+        [field.attname for field in fields],
+        [field.to_python(data[field.attname]) for field in fields],
+    )
+    for name in related_objects:
+        related_model = cast("type[Model]", model._meta.get_field(name).related_model)  # noqa: SLF001
+        setattr(instance, name, build_instance(related_model, data[name], db=db))
+    return instance
+
+
+def get_detail_annotation(name: str) -> str:
+    """Get the name of the annotation holding the aggregated objects of the relation."""
+    return f"{name}_data"
+
+
+class GameDetailsIterable(ModelIterable["Game"]):
+    """Yield the games with the related objects of the details set as prefetched from the aggregated JSON."""
+
+    def __iter__(self: Self) -> Iterator[Game]:
+        """Yield the games, building the related objects from the annotations."""
+        for game in super().__iter__():
+            prefetched_objects_cache = getattr(game, "_prefetched_objects_cache", {})
+            for name, field_names in GAME_DETAIL_RELATIONS.items():
+                related_objects = GAME_DETAIL_RELATED_OBJECTS.get(name, ())
+                manager = getattr(game, name)
+                queryset = manager.get_queryset()
+                queryset._result_cache = [  # noqa: SLF001
+                    build_instance(queryset.model, data, field_names, related_objects, self.queryset.db)
+                    for data in vars(game).pop(get_detail_annotation(name)) or []
+                ]
+                queryset._prefetch_done = True  # noqa: SLF001
+                prefetched_objects_cache[name] = queryset
+            game._prefetched_objects_cache = prefetched_objects_cache  # type: ignore[attr-defined]  # noqa: SLF001
+            yield game
 
 
 class GameQuerySet(QuerySet["Game"]):
@@ -14,3 +115,64 @@ class GameQuerySet(QuerySet["Game"]):
     def with_stats(self: Self) -> Self:
         """Prefetch the game stats."""
         return self.select_related("stats")
+
+    def with_details(self: Self) -> Self:
+        """Load the games with everything shown in the game details in a single query.
+
+        The foreign keys are selected with the game, the objects of every many-to-many relation are
+        aggregated into a JSON array by a correlated subquery on the through table, ordered like the
+        related model. The related objects are built from the arrays and set as prefetched.
+        """
+        annotations = {}
+        for name, field_names in GAME_DETAIL_RELATIONS.items():
+            field = cast("ManyToManyField[Any, Any]", self.model._meta.get_field(name))  # noqa: SLF001
+            through = cast("type[Model]", field.remote_field.through)
+            source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+            related_model = field.related_model
+            ordering = [
+                f"-{target}__{field_name[1:]}" if field_name.startswith("-") else f"{target}__{field_name}"
+                for field_name in cast("list[str]", related_model._meta.ordering or ["pk"])  # noqa: SLF001
+            ]
+            annotations[get_detail_annotation(name)] = Subquery(
+                through._default_manager.filter(**{source: OuterRef("pk")})  # noqa: SLF001
+                .order_by()
+                .values(source)
+                .annotate(
+                    data=JSONBAgg(
+                        build_json_object(
+                            related_model,
+                            field_names,
+                            GAME_DETAIL_RELATED_OBJECTS.get(name, ()),
+                            prefix=f"{target}__",
+                        ),
+                        order_by=ordering,
+                    ),
+                )
+                .values("data"),
+            )
+
+        queryset = self.with_stats().select_related(
+            "publisher",
+            "developer",
+            "game_status",
+            "game_type",
+            "parent_game",
+        )
+        queryset = queryset.annotate(**annotations)
+        queryset._iterable_class = GameDetailsIterable  # noqa: SLF001
+        return queryset
+
+
+class GameCardQuerySet(QuerySet["GameCard"]):
+    """The queryset for the GameCard model."""
+
+    def with_nullable_ranks(self: Self) -> Self:
+        """Annotate the ranks of the cards with nulls for the games not ranked yet, stored as 0 in the cards.
+
+        Ordered by the annotations, the games not ranked yet are last in the ascending order and first
+        in the descending order, like when ordered by the game stats.
+        """
+        return self.annotate(
+            rank_position_or_null=NullIf("rank_position", Value(0)),
+            popularity_or_null=NullIf("popularity", Value(0)),
+        )
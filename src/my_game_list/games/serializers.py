@@ -1,17 +1,23 @@
 """This module contains the serializers for the game related data."""
 
-from typing import Any, Self
+from typing import Any, Self, cast
 
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
 from my_game_list.games.models import (
     Company,
+    ExportJob,
+    ExportJobStatus,
     ExternalGame,
     ExternalGameSource,
     Game,
+    GameCard,
     GameEngine,
     GameFollow,
     GameList,
+    GameListExportFormat,
+    GameListStatus,
     GameMedia,
     GameMode,
     GameReview,
@@ -21,7 +27,14 @@
     Platform,
     PlayerPerspective,
 )
-from my_game_list.my_game_list.serializers import BaseDictionarySerializer
+from my_game_list.games.stats import defer_game_stats, defer_game_stats_update
+from my_game_list.my_game_list.metrics import Metrics
+from my_game_list.my_game_list.pagination import invalidate_cached_counts
+from my_game_list.my_game_list.serializers import (
+    BaseDictionarySerializer,
+    BulkCreateListSerializer,
+    PreloadedPrimaryKeyRelatedField,
+)
 from my_game_list.users.models import User
 from my_game_list.users.serializers import UserSerializer
 
@@ -134,19 +147,37 @@ class Meta:
         )
 
 
+class GameListBulkCreateSerializer(BulkCreateListSerializer[GameList]):
+    """A list serializer creating the game list entries in bulk.
+
+    The bulk insert does not send the model signals, so the created entries counter and the cached counts
+    are updated here, and the stats of every distinct game are recalculated once the transaction is committed.
+    """
+
+    def create(self: Self, validated_data: list[dict[str, Any]]) -> list[GameList]:  # type: ignore[override]
+        """Create the game list entries in bulk and update the data derived from them."""
+        with defer_game_stats():
+            instances = super().create(validated_data)
+            defer_game_stats_update({instance.game_id for instance in instances})
+        for instance in instances:
+            instance.loaded_stats_values = (instance.game_id, instance.score)
+        Metrics.game_lists_entries_created_total.inc(len(instances))
+        for user_id in {instance.user_id for instance in instances}:
+            invalidate_cached_counts(GameList, user_id)
+        return instances
+
+
 class GameListCreateSerializer(serializers.ModelSerializer[GameList]):
     """A serializer for the game list create model."""
 
-    owned_on = serializers.SlugRelatedField(  # type: ignore[var-annotated]
-        queryset=GameMedia.objects.all(),
-        slug_field="id",
-        many=True,
-    )
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
+    owned_on = PreloadedPrimaryKeyRelatedField(queryset=GameMedia.objects.all(), many=True)
 
     class Meta:
         """Meta data for the game list create serializer."""
 
         model = GameList
+        list_serializer_class = GameListBulkCreateSerializer
         fields = (
             "id",
             "status",
@@ -163,6 +194,80 @@ class Meta:
         )
 
 
+class GameListBulkDeleteSerializer(serializers.Serializer[Any]):
+    """A serializer for validating the game list entries of the authenticated user changed at once."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=1000,
+        help_text="The IDs of the game list entries of the authenticated user (at most 1000).",
+    )
+
+    def validate_ids(self: Self, value: list[int]) -> list[int]:
+        """Check that all the entries belong to the authenticated user, with a single query.
+
+        The errors are reported per entry, under the index of its ID.
+        """
+        user = self.context["request"].user
+        ids = list(dict.fromkeys(value))
+        existing_ids = set(GameList.objects.filter(user_id=user.pk, id__in=ids).values_list("id", flat=True))
+        errors: dict[str, list[str]] = {
+            str(index): [f"Game list entry {entry_id} does not exist."]
+            for index, entry_id in enumerate(value)
+            if entry_id not in existing_ids
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        return ids
+
+
+class GameListBulkUpdateSerializer(GameListBulkDeleteSerializer):
+    """A serializer for validating the changes applied to many game list entries of the authenticated user."""
+
+    status = serializers.ChoiceField(
+        choices=GameListStatus.choices,
+        required=False,
+        help_text="The new play status of the entries.",
+    )
+    score = serializers.IntegerField(
+        min_value=1,
+        max_value=10,
+        allow_null=True,
+        required=False,
+        help_text="The new score of the entries, between 1 and 10, or null to clear the scores.",
+    )
+    description = serializers.CharField(
+        max_length=200,
+        allow_blank=True,
+        required=False,
+        help_text="The new personal notes of the entries.",
+    )
+    completed_at = serializers.DateField(
+        allow_null=True,
+        required=False,
+        help_text="The new completion date of the entries.",
+    )
+    started_at = serializers.DateField(
+        allow_null=True,
+        required=False,
+        help_text="The new start date of the entries.",
+    )
+    playtime = serializers.IntegerField(
+        min_value=0,
+        allow_null=True,
+        required=False,
+        help_text="The new number of minutes played of the entries.",
+    )
+
+    def validate(self: Self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Check that at least one field is changed."""
+        if attrs.keys() == {"ids"}:
+            message = "At least one field to change is required."
+            raise serializers.ValidationError(message)
+        return attrs
+
+
 class GameReviewSerializer(serializers.ModelSerializer[GameReview]):
     """A serializer for the game review model."""
 
@@ -176,7 +281,12 @@ class Meta:
         fields = ("id", "score", "created_at", "review", "game", "user")
 
     def get_score(self: Self, instance: GameReview) -> int | None:
-        """Get user score for the this game."""
+        """Get user score for the this game.
+
+        The score annotated by the queryset, like in the review export, is used without querying the game list.
+        """
+        if hasattr(instance, "user_score"):
+            return cast("int | None", instance.user_score)
         game_list_instance = instance.user.game_lists.filter(game__id=instance.game.id).first()
         if game_list_instance:
             return game_list_instance.score
@@ -327,6 +437,19 @@ class Meta:
         )
 
 
+class GameCardSerializer(serializers.ModelSerializer[GameCard]):
+    """A serializer for the game cards, with the same output as the game list serializer."""
+
+    id = serializers.IntegerField(source="game_id", read_only=True)
+    average_score = serializers.FloatField(read_only=True)
+
+    class Meta:
+        """Meta data for game card serializer."""
+
+        model = GameCard
+        fields = GameSimpleListSerializer.Meta.fields
+
+
 class GameSerializer(serializers.ModelSerializer[Game]):
     """A serializer for the game model."""
 
@@ -405,6 +528,92 @@ class ReleaseCalendarQuerySerializer(serializers.Serializer[Any]):
     )
 
 
+class GameListExportQuerySerializer(serializers.Serializer[Any]):
+    """A serializer for validating the query parameters for the game list export endpoint."""
+
+    export_format = serializers.ChoiceField(
+        choices=GameListExportFormat.choices,
+        default=GameListExportFormat.JSON,
+        help_text=(
+            "The file format of the export: a JSON array (default), JSON Lines with one entry per line "
+            "or CSV with the names of the owned on media separated by commas."
+        ),
+    )
+
+
+class ExportJobSerializer(serializers.ModelSerializer[ExportJob]):
+    """A serializer for the export job model."""
+
+    kind_display = serializers.CharField(source="get_kind_display", read_only=True)
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        """Meta data for the export job serializer."""
+
+        model = ExportJob
+        fields = (
+            "id",
+            "kind",
+            "kind_display",
+            "status",
+            "status_display",
+            "entries_count",
+            "error",
+            "created_at",
+            "finished_at",
+            "download_url",
+        )
+        read_only_fields = ("status", "entries_count", "error", "created_at", "finished_at")
+
+    def get_download_url(self: Self, instance: ExportJob) -> str | None:
+        """Get the URL of the artifact of the finished export."""
+        if instance.status != ExportJobStatus.FINISHED:
+            return None
+        return reverse("games:export-jobs-download", kwargs={"pk": instance.pk}, request=self.context.get("request"))
+
+
+class RandomPlanToPlayQuerySerializer(serializers.Serializer[Any]):
+    """A serializer for validating the query parameters for the random Plan to Play endpoint."""
+
+    count = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=25,
+        help_text=(
+            "The number of distinct suggestions returned as a list (1-25). "
+            "Without it a single game-list entry is returned."
+        ),
+    )
+
+
+class GameAutocompleteQuerySerializer(serializers.Serializer[Any]):
+    """A serializer for validating the query parameters for the game autocomplete endpoint."""
+
+    title = serializers.CharField(
+        required=True,
+        max_length=255,
+        help_text="The beginning of the game title typed by the user.",
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=25,
+        help_text="The maximal number of returned games (1-25, default 10).",
+    )
+
+
+class GameAutocompleteSerializer(serializers.ModelSerializer[Game]):
+    """A minimal serializer for the game autocomplete suggestions."""
+
+    class Meta:
+        """Meta data for game autocomplete serializer."""
+
+        model = Game
+        fields = ("id", "title", "slug", "cover_image_id")
+
+
 class SteamImportNotFoundSerializer(serializers.Serializer[Any]):
     """A serializer for the Steam games that were not found in the database."""
 
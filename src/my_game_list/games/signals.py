@@ -1,13 +1,26 @@
 """Signals for the games application."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from django.db.models import Avg, Count, Sum
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from my_game_list.games.models import Game, GameList, GameStats
+from my_game_list.games.cache import DICTIONARY_MODELS, invalidate_game_caches, invalidate_game_details
+from my_game_list.games.cards import refresh_game_cards
+from my_game_list.games.models import Company, ExternalGame, Game, GameList, GameStats, GameStatus, GameType
+from my_game_list.games.stats import (
+    apply_game_stats_delta,
+    defer_game_stats_update,
+    get_game_stats_deltas,
+    recalculate_game_stats,
+)
+from my_game_list.my_game_list.filters import invalidate_dictionary_caches
 from my_game_list.my_game_list.metrics import Metrics
+from my_game_list.my_game_list.pagination import invalidate_cached_counts
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+    from django.db.models.signals import ModelSignal
 
 
 @receiver(post_save, sender=Game)
@@ -22,6 +35,64 @@ def create_game_stats(
         GameStats.objects.get_or_create(game=instance)
 
 
+@receiver(post_save, sender=Game)
+def refresh_game_card(
+    sender: type[Game],  # noqa: ARG001
+    instance: Game,
+    **kwargs: Any,  # noqa: ARG001, ANN401
+) -> None:
+    """Refresh the card of a saved game, after its GameStats are created."""
+    refresh_game_cards([instance.pk])
+
+
+@receiver(post_save, sender=GameStatus)
+@receiver(post_save, sender=GameType)
+def refresh_game_cards_on_dictionary_change(
+    sender: type[GameStatus | GameType],
+    instance: GameStatus | GameType,
+    **kwargs: Any,  # noqa: ARG001, ANN401
+) -> None:
+    """Refresh the cards of the games with a renamed status or type."""
+    field_name = "game_status" if sender is GameStatus else "game_type"
+    refresh_game_cards(Game.objects.filter(**{field_name: instance}).values_list("id", flat=True))
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+def invalidate_game_caches_on_game_change(
+    sender: type[Game],  # noqa: ARG001
+    **kwargs: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Invalidate the caches derived from the game catalogue when a game is changed."""
+    invalidate_game_caches()
+
+
+def invalidate_dictionary_caches_on_change(
+    sender: type[Model],
+    **kwargs: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Invalidate the caches derived from a dictionary, e.g. the filter lookups and game details, on changes."""
+    invalidate_dictionary_caches(sender)
+    invalidate_game_details()
+
+
+for dictionary_model in DICTIONARY_MODELS:
+    post_save.connect(invalidate_dictionary_caches_on_change, sender=dictionary_model)
+    post_delete.connect(invalidate_dictionary_caches_on_change, sender=dictionary_model)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_save, sender=ExternalGame)
+@receiver(post_delete, sender=ExternalGame)
+def invalidate_game_details_on_change(
+    sender: type[Company | ExternalGame],  # noqa: ARG001
+    **kwargs: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Invalidate the cached game details when a company or an external game shown in them is changed."""
+    invalidate_game_details()
+
+
 @receiver(post_save, sender=GameList)
 def increment_game_lists_entries_created_total(
     sender: type[GameList],  # noqa: ARG001
@@ -33,27 +104,57 @@ def increment_game_lists_entries_created_total(
         Metrics.game_lists_entries_created_total.inc()
 
 
+@receiver(post_save, sender=GameList)
+@receiver(post_delete, sender=GameList)
+def invalidate_game_list_counts(
+    sender: type[GameList],
+    instance: GameList,
+    **kwargs: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Invalidate the cached counts of the game lists of the user when an entry is changed."""
+    invalidate_cached_counts(sender, instance.user_id)
+
+
 @receiver(post_save, sender=GameList)
 @receiver(post_delete, sender=GameList)
 def update_game_stats(
     sender: type[GameList],  # noqa: ARG001
     instance: GameList,
-    **kwargs: Any,  # noqa: ARG001, ANN401
+    signal: ModelSignal,
+    **kwargs: Any,  # noqa: ANN401
 ) -> None:
-    """Update GameStats when a GameList is modified."""
-    game = instance.game
-    stats, _ = GameStats.objects.get_or_create(game=game)
-
-    # Calculate aggregates
-    aggregates = GameList.objects.filter(game=game).aggregate(
-        total_score=Sum("score"),
-        count_score=Count("score"),
-        avg_score=Avg("score"),
-        total_members=Count("id"),
-    )
-
-    stats.score_sum = aggregates["total_score"] or 0
-    stats.score_count = aggregates["count_score"] or 0
-    stats.average_score = aggregates["avg_score"] or 0.0
-    stats.members_count = aggregates["total_members"] or 0
-    stats.save()
+    """Update GameStats when a GameList is modified.
+
+    The stats are maintained incrementally from the difference between the persisted and the new
+    (game, score) of the entry. When the persisted values are unknown, the game stats are recomputed.
+    Inside `defer_game_stats` the touched games are only collected and recalculated on commit.
+    """
+    current: tuple[int, int | None] | None = (instance.game_id, instance.score)
+    touched_game_ids = {instance.game_id}
+    if instance.loaded_stats_values is not None:
+        touched_game_ids.add(instance.loaded_stats_values[0])
+    if defer_game_stats_update(touched_game_ids):
+        instance.loaded_stats_values = None if signal is post_delete else current
+        return
+
+    if signal is post_delete:
+        previous = instance.loaded_stats_values or current
+        current = None
+    elif kwargs.get("created"):
+        previous = None
+    elif instance.loaded_stats_values is None:
+        recalculate_game_stats([instance.game_id])
+        instance.loaded_stats_values = current
+        return
+    else:
+        previous = instance.loaded_stats_values
+
+    deltas = get_game_stats_deltas(previous, current)
+    for game_id, delta in deltas.items():
+        # A missing stats row on delete means there is nothing to decrement.
+        if not apply_game_stats_delta(game_id, delta) and signal is post_save:
+            recalculate_game_stats([game_id])
+    refresh_game_cards(deltas)
+    invalidate_game_details(deltas)
+
+    instance.loaded_stats_values = current
@@ -0,0 +1,297 @@
+"""Maintenance of the aggregated game statistics (GameStats)."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import partial
+from typing import TYPE_CHECKING, Any, Self
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Avg, Case, Count, DecimalField, F, Sum, Value, When
+from django.db.models.functions import Cast
+
+from my_game_list.games.cache import invalidate_game_details
+from my_game_list.games.cards import refresh_game_cards
+from my_game_list.games.models import Game, GameList, GameStats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+STATS_AGGREGATE_FIELDS = ("score_sum", "score_count", "average_score", "members_count")
+
+# Missing statistics rows are created and unchanged rows are left untouched.
+UPSERT_ALL_GAME_STATS_SQL = """
+    INSERT INTO {stats_table} AS stats (game_id, score_sum, score_count, average_score, members_count)
+    SELECT
+        game.id,
+        COALESCE(aggregates.score_sum, 0),
+        COALESCE(aggregates.score_count, 0),
+        COALESCE(aggregates.average_score, 0),
+        COALESCE(aggregates.members_count, 0)
+    FROM {game_table} AS game
+    LEFT JOIN (
+        SELECT
+            game_id,
+            SUM(score) AS score_sum,
+            COUNT(score) AS score_count,
+            ROUND(AVG(score), 2) AS average_score,
+            COUNT(*) AS members_count
+        FROM {game_list_table}
+        GROUP BY game_id
+    ) AS aggregates ON aggregates.game_id = game.id
+    ON CONFLICT (game_id) DO UPDATE SET
+        score_sum = EXCLUDED.score_sum,
+        score_count = EXCLUDED.score_count,
+        average_score = EXCLUDED.average_score,
+        members_count = EXCLUDED.members_count
+    WHERE (stats.score_sum, stats.score_count, stats.average_score, stats.members_count)
+        IS DISTINCT FROM (EXCLUDED.score_sum, EXCLUDED.score_count, EXCLUDED.average_score, EXCLUDED.members_count)
+"""
+
+_deferred_game_ids: ContextVar[set[int] | None] = ContextVar("deferred_game_ids", default=None)
+"""The IDs of the games whose stats recalculation is deferred in the current context."""
+
+# Ties are broken by the higher game ID, so every game gets a unique position.
+RECALCULATE_RANKS_SQL = """
+    UPDATE {table} AS stats
+    SET rank_position = ranked.rank_position, popularity = ranked.popularity
+    FROM (
+        SELECT
+            id,
+            ROW_NUMBER() OVER (ORDER BY average_score DESC, game_id DESC) AS rank_position,
+            ROW_NUMBER() OVER (ORDER BY members_count DESC, game_id DESC) AS popularity
+        FROM {table}
+    ) AS ranked
+    WHERE stats.id = ranked.id
+        AND (
+            stats.rank_position IS DISTINCT FROM ranked.rank_position
+            OR stats.popularity IS DISTINCT FROM ranked.popularity
+        )
+"""
+
+
+@dataclass(frozen=True)
+class GameStatsDelta:
+    """A change of the GameStats aggregates caused by adding, editing or removing game list entries."""
+
+    score_sum: int = 0
+    """The change of the sum of all scores."""
+    score_count: int = 0
+    """The change of the number of scored entries."""
+    members_count: int = 0
+    """The change of the number of entries."""
+
+    def __bool__(self: Self) -> bool:
+        """The delta is truthy when it changes anything."""
+        return bool(self.score_sum or self.score_count or self.members_count)
+
+    def __add__(self: Self, other: GameStatsDelta) -> GameStatsDelta:
+        """Combine two deltas."""
+        return GameStatsDelta(
+            score_sum=self.score_sum + other.score_sum,
+            score_count=self.score_count + other.score_count,
+            members_count=self.members_count + other.members_count,
+        )
+
+    @classmethod
+    def for_entry(cls: type[Self], score: int | None, *, sign: int) -> Self:
+        """The delta of adding (sign=1) or removing (sign=-1) a single game list entry."""
+        return cls(
+            score_sum=sign * (score or 0),
+            score_count=sign * int(score is not None),
+            members_count=sign,
+        )
+
+
+def get_game_stats_deltas(
+    previous: tuple[int, int | None] | None,
+    current: tuple[int, int | None] | None,
+) -> dict[int, GameStatsDelta]:
+    """Get the per-game deltas between two states of a game list entry.
+
+    Args:
+        previous (tuple[int, int | None] | None): The (game_id, score) as persisted before the change,
+            None for a new entry.
+        current (tuple[int, int | None] | None): The (game_id, score) after the change, None for a deleted entry.
+
+    Returns:
+        dict[int, GameStatsDelta]: The non-empty deltas by game ID.
+    """
+    deltas: dict[int, GameStatsDelta] = {}
+    if previous is not None:
+        game_id, score = previous
+        deltas[game_id] = GameStatsDelta.for_entry(score, sign=-1)
+    if current is not None:
+        game_id, score = current
+        deltas[game_id] = deltas.get(game_id, GameStatsDelta()) + GameStatsDelta.for_entry(score, sign=1)
+    return {game_id: delta for game_id, delta in deltas.items() if delta}
+
+
+def apply_game_stats_delta(game_id: int, delta: GameStatsDelta) -> bool:
+    """Apply the delta to the game statistics with a single atomic UPDATE.
+
+    The new average is computed in the same statement from the updated sum and count,
+    so concurrent writers never overwrite each other's changes.
+
+    Args:
+        game_id (int): The ID of the game.
+        delta (GameStatsDelta): The change to apply.
+
+    Returns:
+        bool: False if the game has no statistics row yet, True otherwise.
+    """
+    if not delta:
+        return True
+
+    new_score_sum = F("score_sum") + delta.score_sum
+    new_score_count = F("score_count") + delta.score_count
+    updated_rows = GameStats.objects.filter(game_id=game_id).update(
+        score_sum=new_score_sum,
+        score_count=new_score_count,
+        members_count=F("members_count") + delta.members_count,
+        average_score=Case(
+            When(
+                score_count__gt=-delta.score_count,
+                then=Cast(new_score_sum, output_field=DecimalField(max_digits=20, decimal_places=2)) / new_score_count,
+            ),
+            default=Value(Decimal(0)),
+            output_field=DecimalField(max_digits=4, decimal_places=2),
+        ),
+    )
+    return updated_rows > 0
+
+
+def get_game_stats_aggregates(game_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+    """Compute the statistics of the given games from their game list entries.
+
+    Games without any entries are not present in the result.
+    """
+    aggregates = (
+        GameList.objects.filter(game_id__in=game_ids)
+        .values("game")
+        .annotate(
+            total_score=Sum("score"),
+            count_score=Count("score"),
+            avg_score=Avg("score"),
+            total_members=Count("id"),
+        )
+    )
+    return {
+        item["game"]: {
+            "score_sum": item["total_score"] or 0,
+            "score_count": item["count_score"] or 0,
+            "average_score": item["avg_score"] or Decimal(0),
+            "members_count": item["total_members"] or 0,
+        }
+        for item in aggregates
+    }
+
+
+def recalculate_game_stats(game_ids: Iterable[int]) -> None:
+    """Fully recompute the statistics of the given games, creating missing statistics rows.
+
+    The cards of the games are refreshed and their cached details are invalidated.
+    """
+    game_ids = set(game_ids)
+    if not game_ids:
+        return
+
+    existing_game_ids = set(Game.objects.filter(id__in=game_ids).values_list("id", flat=True))
+    GameStats.objects.bulk_create(
+        [GameStats(game_id=game_id) for game_id in existing_game_ids],
+        ignore_conflicts=True,
+    )
+
+    aggregates = get_game_stats_aggregates(existing_game_ids)
+    stats_list = list(GameStats.objects.filter(game_id__in=existing_game_ids))
+    for stats in stats_list:
+        data = aggregates.get(stats.game_id, {})
+        stats.score_sum = data.get("score_sum", 0)
+        stats.score_count = data.get("score_count", 0)
+        stats.average_score = data.get("average_score", Decimal(0))
+        stats.members_count = data.get("members_count", 0)
+    GameStats.objects.bulk_update(stats_list, STATS_AGGREGATE_FIELDS)
+    refresh_game_cards(existing_game_ids)
+    invalidate_game_details(existing_game_ids)
+
+
+def upsert_all_game_stats() -> int:
+    """Rebuild the statistics of all games with a single set-based statement.
+
+    Returns:
+        int: The number of created or updated statistics rows.
+    """
+    quote_name = connection.ops.quote_name
+    sql = UPSERT_ALL_GAME_STATS_SQL.format(
+        stats_table=quote_name(GameStats._meta.db_table),  # noqa: SLF001
+        game_table=quote_name(Game._meta.db_table),  # noqa: SLF001
+        game_list_table=quote_name(GameList._meta.db_table),  # noqa: SLF001
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        updated_count: int = cursor.rowcount
+    return updated_count
+
+
+def recalculate_game_ranks() -> int:
+    """Recompute rank_position and popularity of all games in the database.
+
+    The ranks are computed with window functions in a single statement,
+    and only the rows whose rank changed are written.
+
+    Returns:
+        int: The number of updated statistics rows.
+    """
+    table = connection.ops.quote_name(GameStats._meta.db_table)  # noqa: SLF001
+    with connection.cursor() as cursor:
+        cursor.execute(RECALCULATE_RANKS_SQL.format(table=table))
+        updated_count: int = cursor.rowcount
+    return updated_count
+
+
+@contextmanager
+def defer_game_stats() -> Iterator[None]:
+    """Defer the GameStats maintenance of the game list writes done inside the block.
+
+    The IDs of the touched games are collected instead of updating their stats per entry,
+    and the stats of every distinct game are recalculated once the transaction is committed.
+    Nested blocks are merged into the outermost one.
+    """
+    if _deferred_game_ids.get() is not None:
+        yield
+        return
+
+    game_ids: set[int] = set()
+    token = _deferred_game_ids.set(game_ids)
+    try:
+        yield
+    finally:
+        _deferred_game_ids.reset(token)
+
+    if game_ids:
+        transaction.on_commit(partial(flush_game_stats, game_ids))
+
+
+def defer_game_stats_update(game_ids: Iterable[int]) -> bool:
+    """Register the games for the deferred stats recalculation.
+
+    Returns:
+        bool: True if the games were registered, False if the stats are not deferred in the current context.
+    """
+    deferred_game_ids = _deferred_game_ids.get()
+    if deferred_game_ids is None:
+        return False
+    deferred_game_ids.update(game_ids)
+    return True
+
+
+def flush_game_stats(game_ids: Iterable[int]) -> None:
+    """Recalculate the stats of the games inline or in a single Celery task, depending on the settings."""
+    if settings.GAME_STATS_FLUSH_ASYNC:
+        from my_game_list.games.tasks import recalculate_games_stats  # noqa: PLC0415
+
+        recalculate_games_stats.delay(sorted(game_ids))
+    else:
+        recalculate_game_stats(game_ids)
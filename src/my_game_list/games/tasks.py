@@ -1,58 +1,110 @@
 """Tasks for the games app."""
 
 import logging
+from datetime import timedelta
 
 from celery import shared_task
+from django.conf import settings
 from django.core.management import call_command
+from django.utils import timezone
 
-from my_game_list.games.models import GameStats
+from my_game_list.games.cache import invalidate_game_details
+from my_game_list.games.cards import refresh_game_cards
+from my_game_list.games.exports import get_stale_export_job_cutoff, write_export_job_artifact
+from my_game_list.games.models import ExportJob, ExportJobStatus
+from my_game_list.games.stats import recalculate_game_ranks, recalculate_game_stats
 
 logger = logging.getLogger(__name__)
 
 
 @shared_task
 def recalculate_ranks() -> None:
-    """Recalculate rank_position and popularity for all games."""
-    stats_qs = GameStats.objects.all()
-    stats_list = list(stats_qs)
+    """Recalculate rank_position and popularity for all games, refresh the game cards and invalidate the details."""
+    updated_count = recalculate_game_ranks()
+    logger.info("Recalculated ranks and popularity, %d games changed their rank.", updated_count)
+    updated_count = refresh_game_cards()
+    logger.info("Refreshed the game cards, %d cards were created or updated.", updated_count)
+    invalidate_game_details()
 
-    # Calculate Rank Position (by average_score desc)
-    # Note: This is a simple rank (1, 2, 3...). Ties get arbitrary order here unless we sort by second key.
-    # To match 'DenseRank' or 'Rank' behavior with Python is doable but 'enumerate' gives unique ranks.
-    stats_list.sort(key=lambda x: (x.average_score or 0, x.game_id), reverse=True)
 
-    # Create a list to hold updates to avoid race conditions if we were partial,
-    # but here we update everything.
-    for i, stat in enumerate(stats_list, start=1):
-        stat.rank_position = i
+@shared_task
+def recalculate_games_stats(game_ids: list[int]) -> None:
+    """Recalculate the statistics of the given games."""
+    recalculate_game_stats(game_ids)
+    logger.info("Recalculated statistics for %d games.", len(game_ids))
 
-    # Calculate Popularity (by members_count desc)
-    stats_list.sort(key=lambda x: (x.members_count, x.game_id), reverse=True)
 
-    for i, stat in enumerate(stats_list, start=1):
-        stat.popularity = i
+@shared_task
+def nightly_igdb_import_and_recalculate() -> None:
+    """Import all data from IGDB then recalculate game statistics.
 
-    # Batch update
-    GameStats.objects.bulk_update(stats_list, ["rank_position", "popularity"], batch_size=1000)
+    The independent endpoints are imported concurrently and every endpoint is imported once the endpoints
+    it depends on finished. The imports interrupted by the previous run are resumed from their checkpoints,
+    the failed imports fail the task after the statistics are recalculated.
+    """
+    try:
+        call_command(
+            "import_data_from_igdb",
+            "platforms",
+            "genres",
+            "game_modes",
+            "player_perspectives",
+            "game_engines",
+            "game_types",
+            "game_statuses",
+            "external_game_sources",
+            "external_games",
+            "companies",
+            "games",
+            "--resume",
+            f"--jobs={settings.IGDB_IMPORT_JOBS}",
+        )
+    finally:
+        call_command("recalculate_stats")
 
-    logger.info("Recalculated ranks and popularity for %d games.", len(stats_list))
+
+@shared_task
+def run_export_job(job_id: int) -> None:
+    """Write the artifact of the pending export job and mark the job as finished, or as failed on an error."""
+    # Claiming the pending job makes the task safe to deliver more than once.
+    if not ExportJob.objects.filter(pk=job_id, status=ExportJobStatus.PENDING).update(status=ExportJobStatus.RUNNING):
+        logger.warning("Export job %d is not pending, skipping it.", job_id)
+        return
+
+    job = ExportJob.objects.get(pk=job_id)
+    try:
+        job.entries_count = write_export_job_artifact(job)
+    except Exception:
+        logger.exception("Export job %d failed.", job_id)
+        job.status = ExportJobStatus.FAILED
+        job.error = "The export could not be written, please try again later."
+    else:
+        logger.info("Export job %d finished with %d entries.", job_id, job.entries_count)
+        job.status = ExportJobStatus.FINISHED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["file", "entries_count", "status", "error", "finished_at"])
 
 
 @shared_task
-def nightly_igdb_import_and_recalculate() -> None:
-    """Import all data from IGDB then recalculate game statistics."""
-    call_command(
-        "import_data_from_igdb",
-        "platforms",
-        "genres",
-        "game_modes",
-        "player_perspectives",
-        "game_engines",
-        "game_types",
-        "game_statuses",
-        "external_game_sources",
-        "external_games",
-        "companies",
-        "games",
+def cleanup_old_export_jobs() -> None:
+    """Mark the stale export jobs as failed and delete the jobs older than the retention period with their artifacts.
+
+    The pending and running jobs older than the timeout were lost, e.g. by a crash of the worker after claiming them.
+    """
+    stale_count = ExportJob.objects.filter(
+        status__in=(ExportJobStatus.PENDING, ExportJobStatus.RUNNING),
+        created_at__lt=get_stale_export_job_cutoff(),
+    ).update(
+        status=ExportJobStatus.FAILED,
+        error="The export timed out, please try again.",
+        finished_at=timezone.now(),
     )
-    call_command("recalculate_stats")
+    logger.info("Marked %d stale export jobs as failed.", stale_count)
+
+    cutoff = timezone.now() - timedelta(days=settings.EXPORT_JOB_RETENTION_DAYS)
+    deleted_count = 0
+    for job in ExportJob.objects.filter(created_at__lt=cutoff).iterator():
+        job.file.delete(save=False)
+        job.delete()
+        deleted_count += 1
+    logger.info("Export jobs cleanup task finished. Deleted %d jobs.", deleted_count)
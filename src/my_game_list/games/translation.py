@@ -6,6 +6,7 @@
     Company,
     ExternalGameSource,
     Game,
+    GameCard,
     GameEngine,
     GameMedia,
     GameMode,
@@ -82,3 +83,10 @@ class GameTranslationOptions(TranslationOptions):
     """Translation options for the Game model."""
 
     fields = ("title", "summary")
+
+
+@register(GameCard)
+class GameCardTranslationOptions(TranslationOptions):
+    """Translation options for the GameCard model."""
+
+    fields = ("title", "game_status", "game_type")
@@ -5,6 +5,7 @@
 
 from my_game_list.games.views import (
     CompanyViewSet,
+    ExportJobViewSet,
     ExternalGameSourceViewSet,
     GameEngineViewSet,
     GameFollowViewSet,
@@ -24,6 +25,7 @@
 
 router = routers.SimpleRouter()
 router.register("companies", CompanyViewSet, basename="companies")
+router.register("export-jobs", ExportJobViewSet, basename="export-jobs")
 router.register("game-follows", GameFollowViewSet, basename="game-follows")
 router.register("game-lists", GameListViewSet, basename="game-lists")
 router.register("game-reviews", GameReviewViewSet, basename="game-reviews")
@@ -1,21 +1,46 @@
 """This module contains the viewsets for the game related data."""
 
-from typing import TYPE_CHECKING, Any, Self
+import operator
+import random
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Self, cast
 
 import requests
 from django.conf import settings
 from django.core.cache import cache
 from django.db import transaction
-from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from django.db.models import Q
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.translation import get_language
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    PolymorphicProxySerializer,
+    extend_schema,
+    extend_schema_view,
+)
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.mixins import CreateModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 
+from my_game_list.games.cache import get_game_detail_cache_key
+from my_game_list.games.exports import (
+    EXPORT_CONTENT_TYPES,
+    EXPORT_FILE_EXTENSIONS,
+    get_game_list_export_queryset,
+    get_stale_export_job_cutoff,
+    iter_game_list_export,
+)
 from my_game_list.games.filters import (
     CompanyFilterSet,
     ExternalGameSourceFilterSet,
+    GameCardFilterSet,
     GameEngineFilterSet,
     GameFilterSet,
     GameFollowFilterSet,
@@ -28,14 +53,19 @@
     GenreFilterSet,
     PlatformFilterSet,
     PlayerPerspectiveFilterSet,
+    autocomplete_by_title,
 )
 from my_game_list.games.models import (
     Company,
+    ExportJob,
+    ExportJobStatus,
     ExternalGameSource,
     Game,
+    GameCard,
     GameEngine,
     GameFollow,
     GameList,
+    GameListExportFormat,
     GameListStatus,
     GameMedia,
     GameMode,
@@ -49,10 +79,17 @@
 from my_game_list.games.serializers import (
     CompanyDetailSerializer,
     CompanySerializer,
+    ExportJobSerializer,
     ExternalGameSourceSerializer,
+    GameAutocompleteQuerySerializer,
+    GameAutocompleteSerializer,
+    GameCardSerializer,
     GameEngineSerializer,
     GameFollowSerializer,
+    GameListBulkDeleteSerializer,
+    GameListBulkUpdateSerializer,
     GameListCreateSerializer,
+    GameListExportQuerySerializer,
     GameListSerializer,
     GameMediaSerializer,
     GameModeSerializer,
@@ -65,17 +102,31 @@
     GenreSerializer,
     PlatformSerializer,
     PlayerPerspectiveSerializer,
+    RandomPlanToPlayQuerySerializer,
     ReleaseCalendarQuerySerializer,
     SteamImportResponseSerializer,
 )
+from my_game_list.games.stats import defer_game_stats, defer_game_stats_update
+from my_game_list.games.tasks import run_export_job
+from my_game_list.games.utils import normalize_title
+from my_game_list.my_game_list.exceptions import ConflictException
+from my_game_list.my_game_list.mixins import BaseCachedResponseMixin, CachedResponseMixin
+from my_game_list.my_game_list.pagination import (
+    CachedCountPagination,
+    KeysetPaginationMixin,
+    invalidate_cached_counts,
+)
 from my_game_list.my_game_list.permissions import IsAdminOrReadOnly
 
 if TYPE_CHECKING:
     import datetime
 
     from django.db.models import QuerySet
+    from django.http.response import HttpResponseBase
     from rest_framework.request import Request
 
+    from my_game_list.games.querysets import GameQuerySet
+
 
 HIGHEST_NUMBER_OF_DAYS_IN_MONTH = 31
 MAX_GAMES_PER_DAY_IN_CALENDAR = 3
@@ -292,6 +343,14 @@ class GameListViewSet(ModelViewSet[GameList]):
     serializer_class = GameListSerializer
     permission_classes = (IsAuthenticated,)
     filterset_class = GameListFilterSet
+    pagination_class = CachedCountPagination
+    # Every user sees the same entries, the counts are scoped to the users the entries are filtered by.
+    count_cache_per_user = False
+
+    def get_count_owner_id(self: Self) -> int | None:
+        """Get the ID of the user the listed entries are filtered by, None if they are not."""
+        owner_id = self.request.query_params.get("user", "")
+        return int(owner_id) if owner_id.isdigit() else None
 
     def get_serializer_class(
         self: Self,
@@ -312,26 +371,56 @@ def get_serializer_class(
         description=(
             "Return a random game from the authenticated user's game list that has status "
             "Plan to Play. Returns HTTP 404 if the user has no Plan to Play games. "
+            "Pass `count` to get a list of up to that many distinct suggestions instead of a single entry. "
             "Use this endpoint to get a suggestion for what to play next."
         ),
+        parameters=[RandomPlanToPlayQuerySerializer],
+        responses={
+            200: OpenApiResponse(
+                response=PolymorphicProxySerializer(
+                    component_name="RandomPlanToPlay",
+                    serializers=[GameListSerializer, GameListSerializer(many=True)],
+                    resource_type_field_name=None,
+                    many=False,
+                ),
+                description="A single entry, or a list of the distinct entries when `count` is given.",
+            ),
+            404: None,
+        },
     )
-    @action(detail=False, methods=["get"], url_path="random-ptp")
+    @action(detail=False, methods=["get"], url_path="random-ptp", filter_backends=[], pagination_class=None)
     def random_ptp(self: Self, request: Request) -> Response:
-        """Return a random game from the user's game list in status Plan To Play."""
+        """Return random games from the user's game list in status Plan To Play."""
         if not request.user.is_authenticated:
             return Response(status=status.HTTP_401_UNAUTHORIZED)
 
-        ptp_game = (
-            self.get_queryset()
-            .filter(user_id=request.user.pk, status=GameListStatus.PLAN_TO_PLAY)
-            .order_by("?")
-            .first()
+        query_serializer = RandomPlanToPlayQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        count = query_serializer.validated_data.get("count")
+
+        # The entries are counted and picked at random offsets with index-only scans of the (user, status, id) index,
+        # instead of sorting all the entries by random().
+        ptp_ids = (
+            GameList.objects.filter(user_id=request.user.pk, status=GameListStatus.PLAN_TO_PLAY)
+            .order_by("id")
+            .values_list("id", flat=True)
         )
-        if not ptp_game:
+        ptp_count = ptp_ids.count()
+        if not ptp_count:
             return Response(status=status.HTTP_404_NOT_FOUND)
+        offsets = random.sample(range(ptp_count), min(count or 1, ptp_count))
+        sampled_entries = reduce(operator.or_, (Q(id__in=ptp_ids[offset : offset + 1]) for offset in offsets))
+        suggestions = list(
+            self.get_queryset().filter(sampled_entries).select_related("game").prefetch_related("owned_on"),
+        )
+        # The entries removed since counting them are skipped.
+        if not suggestions:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        random.shuffle(suggestions)
 
-        serializer = self.get_serializer(ptp_game)
-        return Response(serializer.data)
+        if count is None:
+            return Response(self.get_serializer(suggestions[0]).data)
+        return Response(self.get_serializer(suggestions, many=True).data)
 
     @extend_schema(
         description=(
@@ -438,21 +527,34 @@ def steam_import(self: Self, request: Request) -> Response:
 
     @extend_schema(
         description=(
-            "Export the full game list of the authenticated user as JSON. "
-            "Returns all entries without pagination. "
-            "Use this endpoint to back up or transfer a user's complete game list."
+            "Export the full game list of the authenticated user as a JSON array, JSON Lines or CSV file. "
+            "Returns all entries without pagination, streamed in chunks as they are read from the database. "
+            "Use this endpoint to back up or transfer a user's complete game list. "
+            "For very large game lists, start an export job instead."
         ),
-        responses={200: GameListSerializer(many=True)},
+        parameters=[GameListExportQuerySerializer],
+        responses={
+            (200, "application/json"): GameListSerializer(many=True),
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
     )
     @action(detail=False, methods=["get"], url_path="export", filter_backends=[], pagination_class=None)
-    def export(self: Self, request: Request) -> Response:
-        """Return the full game list of the authenticated user without pagination."""
+    def export(self: Self, request: Request) -> HttpResponseBase:
+        """Stream the full game list of the authenticated user without pagination."""
         if not request.user.is_authenticated:
             return Response(status=status.HTTP_401_UNAUTHORIZED)
 
-        queryset = self.get_queryset().filter(user_id=request.user.pk)
-        serializer = GameListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        query_serializer = GameListExportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        export_format = GameListExportFormat(query_serializer.validated_data["export_format"])
+
+        response = StreamingHttpResponse(
+            iter_game_list_export(get_game_list_export_queryset(request.user.pk), export_format, get_language()),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="game-list.{EXPORT_FILE_EXTENSIONS[export_format]}"'
+        return response
 
     @extend_schema(
         description=(
@@ -471,20 +573,158 @@ def bulk_create(self: Self, request: Request) -> Response:
         if not isinstance(items, list) or len(items) == 0:
             return Response({"non_field_errors": ["This field may not be empty."]}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializers_list = []
-        for item in items:
-            data = {**item, "user": request.user.pk, "owned_on": item.get("owned_on", [])}
-            serializer = GameListCreateSerializer(data=data)
-            if not serializer.is_valid():
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            serializers_list.append(serializer)
+        data = [
+            {**item, "user": request.user.pk, "owned_on": item.get("owned_on", [])} if isinstance(item, dict) else item
+            for item in items
+        ]
+        serializer = GameListCreateSerializer(data=data, many=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         with transaction.atomic():
-            instances = [s.save() for s in serializers_list]
+            instances = serializer.save()
 
         result = GameListSerializer(instances, many=True)
         return Response(result.data, status=status.HTTP_201_CREATED)
 
+    @extend_schema(
+        description=(
+            "Bulk-update game-list entries of the authenticated user. "
+            "Accepts the IDs of the entries and the fields to change, for example a new play status "
+            "or a null score to clear the scores, and applies the same changes to all the entries at once. "
+            "Returns the list of updated game-list entries. "
+            "The entries not belonging to the user are reported under the index of their ID and nothing is changed."
+        ),
+        request=GameListBulkUpdateSerializer,
+        responses={200: GameListSerializer(many=True)},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-update", filter_backends=[], pagination_class=None)
+    def bulk_update(self: Self, request: Request) -> Response:
+        """Bulk-update GameList entries of the authenticated user with a single UPDATE statement."""
+        if not request.user.is_authenticated:
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = GameListBulkUpdateSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        changes = dict(serializer.validated_data)
+        entries = GameList.objects.filter(user_id=request.user.pk, id__in=changes.pop("ids"))
+
+        with transaction.atomic(), defer_game_stats():
+            if "score" in changes:
+                defer_game_stats_update(entries.values_list("game_id", flat=True))
+            entries.update(**changes, last_modified_at=timezone.now())
+        invalidate_cached_counts(GameList, request.user.pk)
+
+        result = GameListSerializer(entries.select_related("game").prefetch_related("owned_on"), many=True)
+        return Response(result.data)
+
+    @extend_schema(
+        description=(
+            "Bulk-delete game-list entries of the authenticated user. "
+            "Accepts the IDs of the entries and deletes all of them at once. "
+            "The entries not belonging to the user are reported under the index of their ID and nothing is deleted. "
+            "This does not delete the underlying game records."
+        ),
+        request=GameListBulkDeleteSerializer,
+        responses={204: None},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-delete", filter_backends=[], pagination_class=None)
+    def bulk_delete(self: Self, request: Request) -> Response:
+        """Bulk-delete GameList entries of the authenticated user, recalculating the stats of their games once."""
+        if not request.user.is_authenticated:
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = GameListBulkDeleteSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        entries = GameList.objects.filter(user_id=request.user.pk, id__in=serializer.validated_data["ids"])
+
+        # The delete signals collect the touched games and invalidate the cached counts.
+        with transaction.atomic(), defer_game_stats():
+            entries.delete()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@extend_schema_view(
+    list=extend_schema(
+        description=(
+            "List the export jobs of the authenticated user, oldest first. "
+            "Poll this endpoint or the job detail to follow the status of the exports."
+        ),
+    ),
+    create=extend_schema(
+        description=(
+            "Start a background export of the authenticated user's game list, collections or reviews. "
+            "The export is written as a gzip compressed JSON Lines file, with one entry per line. "
+            "Returns HTTP 202 with the new pending job, or HTTP 200 with the job already exporting the same data. "
+            "Use this endpoint instead of the streaming export for very large accounts."
+        ),
+        responses={200: ExportJobSerializer, 202: ExportJobSerializer},
+    ),
+    retrieve=extend_schema(
+        description=(
+            "Retrieve the status of a single export job of the authenticated user. "
+            "The download URL is set once the export is finished."
+        ),
+    ),
+)
+class ExportJobViewSet(CreateModelMixin, ReadOnlyModelViewSet[ExportJob]):
+    """A ViewSet for the ExportJob model."""
+
+    serializer_class = ExportJobSerializer
+    permission_classes = (IsAuthenticated,)
+
+    def get_queryset(self: Self) -> QuerySet[ExportJob]:
+        """Get the export jobs of the authenticated user."""
+        user = self.request.user
+        if not user.is_authenticated:
+            return ExportJob.objects.none()
+        return ExportJob.objects.filter(user=user)
+
+    def create(self: Self, request: Request, *args: Any, **kwargs: Any) -> Response:  # noqa: ANN401, ARG002
+        """Create a pending export job and run it in a Celery task once the job is committed.
+
+        The active job of the same kind is returned instead, unless it is stale.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        active_job = (
+            self.get_queryset()
+            .filter(
+                kind=serializer.validated_data["kind"],
+                status__in=(ExportJobStatus.PENDING, ExportJobStatus.RUNNING),
+                created_at__gte=get_stale_export_job_cutoff(),
+            )
+            .first()
+        )
+        if active_job is not None:
+            return Response(self.get_serializer(active_job).data)
+
+        job = serializer.save(user=request.user, language=get_language())
+        transaction.on_commit(lambda: run_export_job.delay(job.pk))
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        description=(
+            "Download the artifact of a finished export job of the authenticated user "
+            "as a gzip compressed JSON Lines file. Returns HTTP 409 if the export is not finished."
+        ),
+        responses={(200, "application/gzip"): OpenApiTypes.BINARY, 409: None},
+    )
+    @action(detail=True, methods=["get"])
+    def download(self: Self, request: Request, pk: str | None = None) -> HttpResponseBase:  # noqa: ARG002
+        """Download the artifact of the finished export job."""
+        job = self.get_object()
+        if job.status != ExportJobStatus.FINISHED or not job.file:
+            raise ConflictException(detail=_("The export is not finished."))
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=f"{job.kind}.jsonl.gz",
+            content_type="application/gzip",
+        )
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -558,7 +798,8 @@ def get_serializer_class(
             "The `title` filter searches across both the English (`title_en`) and Polish "
             "(`title_pl`) title fields simultaneously. "
             "Results can be ordered by `rank_position`, `popularity`, `release_date`, "
-            "or `created_at` using the `ordering` parameter."
+            "or `created_at` using the `ordering` parameter. "
+            "Pass `pagination=cursor` to page through the results with cursors instead of page numbers."
         ),
         parameters=[
             OpenApiParameter(
@@ -655,6 +896,21 @@ def get_serializer_class(
                     "Prefix with '-' for descending."
                 ),
             ),
+            OpenApiParameter(
+                name="pagination",
+                description=(
+                    "Set to `cursor` to use the cursor pagination instead of the page numbers. "
+                    "The cursor pagination returns only the `next` link and the `results`, "
+                    "without the total count, and keeps the same performance on deep pages."
+                ),
+            ),
+            OpenApiParameter(
+                name="cursor",
+                description=(
+                    "The cursor of the page to return, taken from the `next` link of the previous page. "
+                    "Selects the cursor pagination. A cursor is only valid for the ordering it was created with."
+                ),
+            ),
         ],
     ),
     retrieve=extend_schema(
@@ -666,49 +922,106 @@ def get_serializer_class(
         ),
     ),
 )
-class GameViewSet(ReadOnlyModelViewSet[Game]):
-    """A ViewSet for the Game model."""
+class GameViewSet(BaseCachedResponseMixin, KeysetPaginationMixin, ReadOnlyModelViewSet[Game]):
+    """A ViewSet for the Game model.
+
+    The view has no `queryset` attribute, as the list reads the game cards instead of the games.
+    """
 
-    queryset = Game.objects.all()
     permission_classes = (IsAdminOrReadOnly,)
-    filterset_class = GameFilterSet
+    pagination_class = CachedCountPagination
+    count_cache_per_user = False
 
-    def get_queryset(self: Self) -> QuerySet[Game]:
-        """Get the queryset for the Game model."""
-        queryset = super().get_queryset()
+    @property
+    def filterset_class(self: Self) -> type[GameFilterSet]:
+        """The filter set of the games, the list is filtered on the game cards."""
         if self.action == "list":
-            return queryset.select_related("stats", "game_status", "game_type")
-
-        return queryset.select_related(
-            "stats",
-            "publisher",
-            "developer",
-            "game_status",
-            "game_type",
-            "parent_game",
-        ).prefetch_related(
-            "genres",
-            "platforms",
-            "bundles",
-            "dlcs",
-            "expanded_games",
-            "expansions",
-            "forks",
-            "ports",
-            "standalone_expansions",
-            "game_engines",
-            "game_modes",
-            "player_perspectives",
-        )
+            return GameCardFilterSet
+        return GameFilterSet
+
+    def get_queryset(self: Self) -> QuerySet[Any]:
+        """Get the queryset for the Game model, or the game cards for the list.
+
+        The list is filtered, ordered, counted and serialized from the game cards, the games are joined
+        only by the filters of their relations missing from the cards.
+        """
+        if self.action == "list":
+            cards: QuerySet[GameCard] = GameCard.objects.with_nullable_ranks()
+            return cards
+        queryset = cast("GameQuerySet", Game.objects.all())
+        if self.action == "autocomplete":
+            return queryset.only("id", "title", "title_en", "title_pl", "slug", "cover_image_id")
+        if self.action == "retrieve":
+            return queryset.with_details()
+
+        return queryset.with_stats().select_related("game_status", "game_type")
 
     def get_serializer_class(
         self: Self,
-    ) -> type[GameSerializer | GameSimpleListSerializer]:
+    ) -> type[GameSerializer | GameSimpleListSerializer | GameCardSerializer | GameAutocompleteSerializer]:
         """Get the serializer class for the Game model."""
-        if self.action in ("list", "release_calendar"):
+        if self.action == "list":
+            return GameCardSerializer
+        if self.action == "release_calendar":
             return GameSimpleListSerializer
+        if self.action == "autocomplete":
+            return GameAutocompleteSerializer
         return GameSerializer
 
+    def retrieve(  # type: ignore[override]
+        self: Self,
+        request: Request,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> HttpResponseBase:
+        """Retrieve the game details, using the cached response."""
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_response_cache_key(self: Self, request: Request) -> str | None:
+        """Get the cache key of the game details, the details filtered by query parameters are not cached."""
+        if request.query_params:
+            return None
+        try:
+            game_id = int(self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+        except ValueError:
+            return None
+        return get_game_detail_cache_key(game_id, get_language(), request.accepted_media_type)
+
+    def get_response_cache_timeout(self: Self) -> int:
+        """Get the timeout of the cached game details."""
+        return int(settings.GAME_DETAIL_CACHE_TIMEOUT)
+
+    @extend_schema(
+        description=(
+            "Return title suggestions for a typeahead. "
+            "Games whose title starts with the typed text come first, followed by games with any word "
+            "of the title starting with it. The text is normalized like the title search "
+            "(case, diacritics and special characters are ignored). The response is not paginated."
+        ),
+        request=None,
+        parameters=[GameAutocompleteQuerySerializer],
+        responses={200: GameAutocompleteSerializer(many=True), 400: None},
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="autocomplete",
+        pagination_class=None,
+        filter_backends=[],
+    )
+    def autocomplete(self: Self, request: Request) -> Response:
+        """Get the game title suggestions."""
+        query_serializer = GameAutocompleteQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        games = autocomplete_by_title(
+            self.get_queryset(),
+            normalize_title(query_serializer.validated_data["title"]),
+            query_serializer.validated_data["limit"],
+        )
+        serializer = self.get_serializer(games, many=True)
+        return Response(serializer.data)
+
     @extend_schema(
         description=(
             "Return all games releasing within a specified date range, grouped by day. "
@@ -797,7 +1110,7 @@ def release_calendar(self: Self, request: Request) -> Response:
         description="Retrieve a single genre by ID.",
     ),
 )
-class GenreViewSet(ReadOnlyModelViewSet[Genre]):
+class GenreViewSet(CachedResponseMixin, ReadOnlyModelViewSet[Genre]):
     """A ViewSet for the Genre model."""
 
     queryset = Genre.objects.all()
@@ -835,7 +1148,7 @@ class GenreViewSet(ReadOnlyModelViewSet[Genre]):
         description="Retrieve a single platform by ID.",
     ),
 )
-class PlatformViewSet(ReadOnlyModelViewSet[Platform]):
+class PlatformViewSet(CachedResponseMixin, ReadOnlyModelViewSet[Platform]):
     """A ViewSet for the Platform model."""
 
     queryset = Platform.objects.all()
@@ -873,7 +1186,7 @@ class PlatformViewSet(ReadOnlyModelViewSet[Platform]):
         description="Retrieve a single game type by ID.",
     ),
 )
-class GameTypeViewSet(ReadOnlyModelViewSet[GameType]):
+class GameTypeViewSet(CachedResponseMixin, ReadOnlyModelViewSet[GameType]):
     """A ViewSet for the GameType model."""
 
     queryset = GameType.objects.all()
@@ -911,7 +1224,7 @@ class GameTypeViewSet(ReadOnlyModelViewSet[GameType]):
         description="Retrieve a single game status by ID.",
     ),
 )
-class GameStatusViewSet(ReadOnlyModelViewSet[GameStatus]):
+class GameStatusViewSet(CachedResponseMixin, ReadOnlyModelViewSet[GameStatus]):
     """A ViewSet for the GameStatus model."""
 
     queryset = GameStatus.objects.all()
@@ -949,7 +1262,7 @@ class GameStatusViewSet(ReadOnlyModelViewSet[GameStatus]):
         description="Retrieve a single game engine by ID.",
     ),
 )
-class GameEngineViewSet(ReadOnlyModelViewSet[GameEngine]):
+class GameEngineViewSet(CachedResponseMixin, ReadOnlyModelViewSet[GameEngine]):
     """A ViewSet for the GameEngine model."""
 
     queryset = GameEngine.objects.all()
@@ -987,7 +1300,7 @@ class GameEngineViewSet(ReadOnlyModelViewSet[GameEngine]):
         description="Retrieve a single game mode by ID.",
     ),
 )
-class GameModeViewSet(ReadOnlyModelViewSet[GameMode]):
+class GameModeViewSet(CachedResponseMixin, ReadOnlyModelViewSet[GameMode]):
     """A ViewSet for the GameMode model."""
 
     queryset = GameMode.objects.all()
@@ -1025,7 +1338,7 @@ class GameModeViewSet(ReadOnlyModelViewSet[GameMode]):
         description="Retrieve a single player perspective by ID.",
     ),
 )
-class PlayerPerspectiveViewSet(ReadOnlyModelViewSet[PlayerPerspective]):
+class PlayerPerspectiveViewSet(CachedResponseMixin, ReadOnlyModelViewSet[PlayerPerspective]):
     """A ViewSet for the PlayerPerspective model."""
 
     queryset = PlayerPerspective.objects.all()
@@ -1063,7 +1376,7 @@ class PlayerPerspectiveViewSet(ReadOnlyModelViewSet[PlayerPerspective]):
         description="Retrieve a single external game source by ID.",
     ),
 )
-class ExternalGameSourceViewSet(ReadOnlyModelViewSet[ExternalGameSource]):
+class ExternalGameSourceViewSet(CachedResponseMixin, ReadOnlyModelViewSet[ExternalGameSource]):
     """A ViewSet for the ExternalGameSource model."""
 
     queryset = ExternalGameSource.objects.all()
@@ -1109,7 +1422,7 @@ class ExternalGameSourceViewSet(ReadOnlyModelViewSet[ExternalGameSource]):
         description="Delete a game media record. Requires administrator privileges.",
     ),
 )
-class GameMediaViewSet(ModelViewSet[GameMedia]):
+class GameMediaViewSet(CachedResponseMixin, ModelViewSet[GameMedia]):
     """A ViewSet for the GameMedia model."""
 
     queryset = GameMedia.objects.all()
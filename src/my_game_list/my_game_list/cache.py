@@ -0,0 +1,41 @@
+"""Helpers for versioned caching.
+
+Every cache namespace has a version counter stored in the cache. The version is part of all keys
+of the namespace, so bumping it invalidates all the cached entries at once without scanning the keys.
+A version is started from the current time, so a version lost with the cache never repeats and
+the data cached out of the shared cache, e.g. in the process memory, can rely on it too.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any
+
+from django.core.cache import cache
+
+CACHE_VERSION_KEY_PREFIX = "cache_version"
+
+
+def get_cache_version(namespace: str) -> int:
+    """Get the current version of the cache namespace."""
+    version: int | None = cache.get_or_set(f"{CACHE_VERSION_KEY_PREFIX}:{namespace}", time.time_ns, timeout=None)
+    return version or time.time_ns()
+
+
+def bump_cache_version(namespace: str) -> None:
+    """Invalidate all the cached entries of the namespace."""
+    key = f"{CACHE_VERSION_KEY_PREFIX}:{namespace}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The version expired or was never set, a new version differs from the cached entries.
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def build_cache_key(namespace: str, *parts: Any) -> str:  # noqa: ANN401
+    """Build a cache key of the namespace from JSON serializable parts.
+
+    The parts are hashed, so keys stay short and safe for every cache backend.
+    """
+    digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{namespace}:{digest}"
@@ -4,12 +4,52 @@
 from typing import Any, cast
 
 from django import forms as django_forms
-from django.db.models import Q, QuerySet
+from django.db.models import Model, Q, QuerySet
 from django_filters import rest_framework as filters
 
+from my_game_list.my_game_list.cache import bump_cache_version, get_cache_version
+
+_dictionary_lookups: dict[tuple[str, str, str], tuple[int, dict[str, Any]]] = {}
+"""The lookups of the dictionaries cached in the process memory, with the versions they were built for."""
+
+
+def get_dictionary_cache_namespace(model: type[Model]) -> str:
+    """Get the cache namespace of the data derived from the dictionary model."""
+    return f"dictionary:{model._meta.label_lower}"  # noqa: SLF001
+
+
+def invalidate_dictionary_caches(model: type[Model]) -> None:
+    """Invalidate the data derived from the dictionary model in the shared cache and in all processes."""
+    bump_cache_version(get_dictionary_cache_namespace(model))
+
+
+def get_dictionary_lookup(queryset: QuerySet[Any], en_field: str, pl_field: str) -> dict[str, Any]:
+    """Get the mapping of the lowercase English and Polish values of the dictionary to primary keys.
+
+    The mapping is cached in the process memory, it is rebuilt only when the version of the dictionary
+    in the shared cache changes. A value used by several objects is mapped to the lowest primary key.
+    """
+    key = (queryset.model._meta.label_lower, en_field, pl_field)  # noqa: SLF001
+    version = get_cache_version(get_dictionary_cache_namespace(queryset.model))
+    cached = _dictionary_lookups.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    lookup: dict[str, Any] = {}
+    for pk, *values in queryset.order_by("pk").values_list("pk", en_field, pl_field):
+        for value in values:
+            if value is not None:
+                lookup.setdefault(value.lower(), pk)
+    _dictionary_lookups[key] = (version, lookup)
+    return lookup
+
 
 class BilingualModelMultipleChoiceField(django_forms.ModelMultipleChoiceField):  # type: ignore[type-arg]
-    """ModelMultipleChoiceField that resolves values by matching en_field or pl_field (iexact)."""
+    """ModelMultipleChoiceField that resolves values by matching en_field or pl_field (case-insensitive).
+
+    The values are resolved with the cached dictionary lookup, so the cleaned value is the list of
+    the matched primary keys and no query is run.
+    """
 
     def __init__(
         self,
@@ -23,15 +63,11 @@ def __init__(
         self.pl_field = pl_field
         super().__init__(*args, **kwargs)
 
-    def _check_values(self, value: Collection[Any]) -> QuerySet[Any]:
-        qs = cast("QuerySet[Any]", self.queryset)
+    def _check_values(self, value: Collection[Any]) -> list[Any]:
+        lookup = get_dictionary_lookup(cast("QuerySet[Any]", self.queryset), self.en_field, self.pl_field)
         matched_pks: list[Any] = []
         for v in value:
-            pk = (
-                qs.filter(Q(**{f"{self.en_field}__iexact": v}) | Q(**{f"{self.pl_field}__iexact": v}))
-                .values_list("pk", flat=True)
-                .first()
-            )
+            pk = lookup.get(str(v).lower())
             if pk is None:
                 raise django_forms.ValidationError(
                     self.error_messages["invalid_choice"],
@@ -39,7 +75,7 @@ def _check_values(self, value: Collection[Any]) -> QuerySet[Any]:
                     params={"value": v},
                 )
             matched_pks.append(pk)
-        return qs.filter(pk__in=matched_pks)
+        return matched_pks
 
 
 class BilingualModelMultipleChoiceFilter(filters.ModelMultipleChoiceFilter):
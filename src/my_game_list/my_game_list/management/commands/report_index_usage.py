@@ -0,0 +1,93 @@
+"""Management command to report the usage of the database indexes."""
+
+from typing import TYPE_CHECKING, Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+INDEX_USAGE_QUERY = """
+    SELECT
+        stats.relname,
+        stats.indexrelname,
+        stats.idx_scan,
+        stats.idx_tup_read,
+        stats.idx_tup_fetch,
+        pg_size_pretty(pg_relation_size(stats.indexrelid)),
+        indexes.indisunique
+    FROM pg_stat_user_indexes AS stats
+    JOIN pg_index AS indexes ON indexes.indexrelid = stats.indexrelid
+    WHERE stats.relname = ANY(%s)
+    ORDER BY stats.relname, stats.idx_scan, stats.indexrelname
+"""
+
+STATS_RESET_QUERY = "SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()"
+
+
+class Command(BaseCommand):  # NOSONAR(S8443) - Already inheriting from BaseCommand
+    """Report the usage of the indexes of the tables of the project."""
+
+    help = (
+        "Reports the number of scans, the read and fetched tuples and the size of every index of the given models, "
+        "or of all the models of the project, since the statistics were last reset."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add arguments to the command."""
+        parser.add_argument(
+            "models",
+            nargs="*",
+            metavar="app_label.ModelName",
+            help="The models to report the indexes of, all the models of the project by default.",
+        )
+        parser.add_argument(
+            "--unused",
+            action="store_true",
+            help="Report only the indexes that were never scanned, except the unique ones enforcing constraints.",
+        )
+
+    def get_tables(self: Command, labels: list[str]) -> list[str]:
+        """Get the database tables of the models with the given labels, or of all the models of the project."""
+        if not labels:
+            return [
+                model._meta.db_table  # noqa: SLF001
+                for model in apps.get_models(include_auto_created=True)
+                if model.__module__.startswith(f"{settings.MAIN_APP}.")
+            ]
+        tables = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as error:
+                message = f"Unknown model: {label}."
+                raise CommandError(message) from error
+            tables.append(model._meta.db_table)  # noqa: SLF001
+        return tables
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Execute the command."""
+        tables = self.get_tables(options["models"])
+
+        with connection.cursor() as cursor:
+            cursor.execute(STATS_RESET_QUERY)
+            stats_reset = cursor.fetchone()
+            cursor.execute(INDEX_USAGE_QUERY, [tables])
+            rows = cursor.fetchall()
+
+        since = stats_reset[0] if stats_reset and stats_reset[0] else "the start of the statistics"
+        self.stdout.write(f"The index usage since {since}:")
+
+        reported_count = 0
+        for table, index, scans, tuples_read, tuples_fetched, size, is_unique in rows:
+            if options["unused"] and (scans or is_unique):
+                continue
+            self.stdout.write(
+                f"{table}.{index}: {scans} scans, {tuples_read} tuples read, {tuples_fetched} tuples fetched, {size}",
+            )
+            reported_count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Reported {reported_count} indexes of {len(tables)} tables."))
@@ -13,3 +13,23 @@ class Metrics:
         "game_lists_entries_created_total",
         "Total number of game list entries created.",
     )
+    igdb_requests_total = Counter(
+        "igdb_requests_total",
+        "Total number of requests to the IGDB API.",
+        ["endpoint", "status"],
+    )
+    igdb_request_retries_total = Counter(
+        "igdb_request_retries_total",
+        "Total number of retried requests to the IGDB API.",
+        ["endpoint"],
+    )
+    igdb_dead_letters_total = Counter(
+        "igdb_dead_letters_total",
+        "Total number of IGDB pages moved to the dead-letter list after all the retries.",
+        ["endpoint"],
+    )
+    igdb_dead_letters_replayed_total = Counter(
+        "igdb_dead_letters_replayed_total",
+        "Total number of replayed IGDB pages from the dead-letter list.",
+        ["endpoint", "result"],
+    )
@@ -0,0 +1,128 @@
+"""Mixins of the API views."""
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Self, cast
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from django.utils.translation import get_language
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+
+from my_game_list.my_game_list.cache import build_cache_key, get_cache_version
+from my_game_list.my_game_list.filters import get_dictionary_cache_namespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.db.models import QuerySet
+    from django.http.response import HttpResponseBase
+    from rest_framework.request import Request
+    from rest_framework.response import Response
+
+
+def cache_rendered_content(key: str, content: bytes, timeout: int) -> str:
+    """Cache the rendered content together with its strong ETag.
+
+    Returns:
+        str: The quoted ETag of the content.
+    """
+    etag = quote_etag(hashlib.sha256(content).hexdigest())
+    cache.set(key, (content, etag), timeout=timeout)
+    return etag
+
+
+class BaseCachedResponseMixin(GenericAPIView[Any]):
+    """Cache the rendered JSON responses with strong ETags.
+
+    The subclasses route the cached actions through `get_cached_response` and build the cache keys,
+    the responses are not cached by default. The requests with `If-None-Match` matching the ETag of
+    the response get the 304 Not Modified response without a body.
+    """
+
+    def get_response_cache_key(self: Self, request: Request) -> str | None:  # noqa: ARG002
+        """Get the cache key of the response, None when the response is not cached."""
+        return None
+
+    def get_response_cache_timeout(self: Self) -> int:
+        """Get the timeout of the cached responses in seconds."""
+        return int(settings.DICTIONARY_RESPONSE_CACHE_TIMEOUT)
+
+    def get_cached_response(
+        self: Self,
+        handler: Callable[..., Response],
+        request: Request,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> HttpResponseBase:
+        """Get the rendered response from the cache, or render and cache the response of the handler."""
+        renderer = request.accepted_renderer
+        key = self.get_response_cache_key(request) if renderer.format == "json" else None
+        if key is None:
+            return handler(request, *args, **kwargs)
+
+        cached: tuple[bytes, str] | None = cache.get(key)
+        if cached is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            rendered = renderer.render(response.data, request.accepted_media_type, self.get_renderer_context())
+            content = rendered.encode() if isinstance(rendered, str) else rendered
+            etag = cache_rendered_content(key, content, self.get_response_cache_timeout())
+        else:
+            content, etag = cached
+
+        etags = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in etags or "*" in etags:
+            cached_response: HttpResponseBase = HttpResponseNotModified()
+        else:
+            content_type = request.accepted_media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            cached_response = HttpResponse(content, content_type=content_type)
+        cached_response.headers["ETag"] = etag
+        patch_vary_headers(cached_response, ("Accept-Language",))
+        return cached_response
+
+
+class CachedResponseMixin(RetrieveModelMixin, ListModelMixin, BaseCachedResponseMixin):
+    """Cache the rendered JSON responses of the list and retrieve actions of a dictionary, with strong ETags.
+
+    The responses are cached per language, URL, query parameters and media type under the version of
+    the dictionary of the model, so every write to the dictionary invalidates them.
+    """
+
+    def list(  # type: ignore[override]
+        self: Self,
+        request: Request,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> HttpResponseBase:
+        """List the objects, using the cached response."""
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(  # type: ignore[override]
+        self: Self,
+        request: Request,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> HttpResponseBase:
+        """Retrieve the object, using the cached response."""
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_response_cache_key(self: Self, request: Request) -> str:
+        """Get the cache key of the response, it changes with the version of the dictionary."""
+        namespace = get_dictionary_cache_namespace(cast("QuerySet[Any]", self.queryset).model)
+        params = sorted((name, sorted(values)) for name, values in request.query_params.lists())
+        return build_cache_key(
+            f"response:{namespace}",
+            get_cache_version(namespace),
+            get_language(),
+            request.build_absolute_uri(request.path),
+            params,
+            request.accepted_media_type,
+        )
@@ -0,0 +1,453 @@
+"""Pagination classes of the API."""
+
+import base64
+import binascii
+import datetime
+import json
+import operator
+from decimal import Decimal
+from functools import cached_property, partial, reduce
+from typing import TYPE_CHECKING, Any, Self, cast
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.core.paginator import Page as DjangoPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import F, Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.generics import GenericAPIView
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from my_game_list.my_game_list.cache import build_cache_key, bump_cache_version, get_cache_version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.paginator import Page
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+
+
+def _encode_cursor_value(value: Any) -> str:  # noqa: ANN401
+    """Encode the values of the ordering keys that are not JSON serializable, keeping their full precision."""
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    msg = f"Object of type {type(value).__name__} cannot be used in a cursor."
+    raise TypeError(msg)
+
+
+def get_count_cache_namespace(model: type[Model]) -> str:
+    """Get the cache namespace of the counts of the model lists."""
+    return f"pagination_count:{model._meta.label_lower}"  # noqa: SLF001
+
+
+def get_owner_count_cache_namespace(model: type[Model], owner_id: int | None) -> str:
+    """Get the cache namespace of the counts of the model lists scoped to the owner, or to any owner for None."""
+    owner = "owners" if owner_id is None else f"owner:{owner_id}"
+    return f"{get_count_cache_namespace(model)}:{owner}"
+
+
+def invalidate_cached_counts(model: type[Model], owner_id: int | None = None) -> None:
+    """Invalidate the cached counts of the lists of the model changed for the owner, or for all the owners.
+
+    The counts of the lists not scoped to an owner are always invalidated, while the counts of the lists
+    scoped to the other owners are kept when the owner is given.
+    """
+    bump_cache_version(get_count_cache_namespace(model))
+    bump_cache_version(get_owner_count_cache_namespace(model, owner_id))
+
+
+class EstimatedCountPage(DjangoPage[Any]):
+    """Page of a list with an estimated count, knowing if the next page exists from the fetched objects."""
+
+    def __init__(
+        self: Self,
+        object_list: list[Any],
+        number: int,
+        paginator: CachedCountPaginator,
+        *,
+        has_next: bool,
+    ) -> None:
+        """Initialize the page with the existence of the next page."""
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self: Self) -> bool:
+        """Check if there is a page after this one."""
+        return self._has_next
+
+    def next_page_number(self: Self) -> int:
+        """Get the number of the next page."""
+        if not self._has_next:
+            raise EmptyPage(self.paginator.error_messages["no_results"])
+        return self.number + 1
+
+    def previous_page_number(self: Self) -> int:
+        """Get the number of the previous page."""
+        return self.paginator.validate_number(self.number - 1)
+
+
+class CachedCountPaginator(DjangoPaginator[Any]):
+    """Django paginator taking the count of the objects from a callable instead of counting them.
+
+    An estimated count is only reported, the pages are not validated against it. Instead, one object more than
+    the page size is fetched, so a stale estimate neither hides the existing pages nor links to the empty ones.
+    """
+
+    def __init__(
+        self: Self,
+        object_list: Any,  # noqa: ANN401
+        per_page: int,
+        *,
+        count_function: Callable[[], tuple[int, bool]],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the paginator with the function getting the count of the objects and if it is exact."""
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_function = count_function
+
+    @cached_property
+    def counted(self: Self) -> tuple[int, bool]:
+        """The total number of objects and if it is exact, as returned by the count function."""
+        return self.count_function()
+
+    @cached_property
+    def count(self: Self) -> int:
+        """The total number of objects, as returned by the count function."""
+        return self.counted[0]
+
+    @property
+    def count_is_exact(self: Self) -> bool:
+        """False when the count is an estimate."""
+        return self.counted[1]
+
+    def validate_number(self: Self, number: Any) -> int:  # noqa: ANN401
+        """Validate the page number, without an upper bound when the count is an estimate."""
+        if self.count_is_exact:
+            return super().validate_number(number)
+        try:
+            page_number = int(number)
+        except (TypeError, ValueError) as error:
+            raise PageNotAnInteger(self.error_messages["invalid_page"]) from error
+        if page_number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return page_number
+
+    def page(self: Self, number: Any) -> DjangoPage[Any]:  # noqa: ANN401
+        """Get the page, fetching one more object to know if the next page exists when the count is an estimate."""
+        if self.count_is_exact:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedCountPage(
+            object_list[: self.per_page],
+            number,
+            self,
+            has_next=len(object_list) > self.per_page,
+        )
+
+
+class CachedCountPagination(PageNumberPagination):
+    """Page number pagination serving the counts from a short-lived cache.
+
+    The counts are cached per model, path and filters of the request, and per user unless the view sets
+    `count_cache_per_user` to False for the lists showing the same objects to every user. They are
+    invalidated by the changes of the model. The lists scoped to the objects of one owner, returned by
+    the `get_count_owner_id` method of the view, are only invalidated by the changes of that owner and
+    are always counted exactly, as they are small.
+
+    On a cache miss, the count of the other lists is estimated by the planner, from `pg_class.reltuples`
+    for unfiltered lists and from the EXPLAIN row estimate otherwise. Lists estimated at
+    `PAGINATION_ESTIMATED_COUNT_THRESHOLD` rows or more get the estimate, the smaller ones are counted
+    exactly. The estimate is only reported, the pages of such lists and their next links come from the
+    fetched objects. The clients can ask for the exact count with `exact_count=true`.
+    """
+
+    exact_count_query_param = "exact_count"
+    exact_count_query_description = (
+        "When true, the count of the results is exact instead of served from the cache or estimated for large lists."
+    )
+    count_cache_ignored_params = frozenset({"page", "exact_count", api_settings.ORDERING_PARAM})
+
+    def paginate_queryset(
+        self: Self,
+        queryset: QuerySet[Any],
+        request: Request,
+        view: APIView | None = None,
+    ) -> list[Any] | None:
+        """Paginate the queryset, getting the count of the objects with the cached count."""
+        self.django_paginator_class = partial(  # type: ignore[assignment]
+            CachedCountPaginator,
+            count_function=partial(self.get_count, queryset, request, view),
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+    def is_exact_count_requested(self: Self, request: Request) -> bool:
+        """Check if the client asked for the exact count."""
+        return request.query_params.get(self.exact_count_query_param, "").lower() == "true"
+
+    @staticmethod
+    def get_count_owner_id(view: APIView | None) -> int | None:
+        """Get the ID of the owner the listed objects are scoped to, None if the list is not scoped."""
+        get_owner_id: Callable[[], int | None] | None = getattr(view, "get_count_owner_id", None)
+        return None if get_owner_id is None else get_owner_id()
+
+    def get_count_cache_key(self: Self, queryset: QuerySet[Any], request: Request, view: APIView | None) -> str:
+        """Get the cache key of the count of the list, built from the normalized filters of the request."""
+        params = sorted(
+            (name, sorted(values))
+            for name, values in request.query_params.lists()
+            if name not in self.count_cache_ignored_params
+        )
+        user_id = request.user.pk if getattr(view, "count_cache_per_user", True) else None
+        owner_id = self.get_count_owner_id(view)
+        namespace = get_count_cache_namespace(queryset.model)
+        if owner_id is None:
+            versions = [get_cache_version(namespace)]
+        else:
+            versions = [
+                get_cache_version(get_owner_count_cache_namespace(queryset.model, None)),
+                get_cache_version(get_owner_count_cache_namespace(queryset.model, owner_id)),
+            ]
+        return build_cache_key(namespace, versions, owner_id, request.path, user_id, params)
+
+    def get_count(self: Self, queryset: QuerySet[Any], request: Request, view: APIView | None) -> tuple[int, bool]:
+        """Get the count of the objects from the cache, the planner estimate or the database, and if it is exact."""
+        key = self.get_count_cache_key(queryset, request, view)
+        if not self.is_exact_count_requested(request):
+            cached = cache.get(key)
+            if cached is not None:
+                return cast("tuple[int, bool]", tuple(cached))
+
+            estimate = self.estimate_count(queryset) if self.get_count_owner_id(view) is None else None
+            if estimate is not None and estimate >= settings.PAGINATION_ESTIMATED_COUNT_THRESHOLD:
+                cache.set(key, (estimate, False), timeout=settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+                return estimate, False
+
+        count = queryset.count()
+        cache.set(key, (count, True), timeout=settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count, True
+
+    @staticmethod
+    def estimate_count(queryset: QuerySet[Any]) -> int | None:
+        """Estimate the count of the objects with the planner statistics, None if there are none."""
+        query = queryset.query
+        if not query.where and not query.distinct and query.group_by is None and not query.combinator:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],  # noqa: SLF001
+                )
+                row = cursor.fetchone()
+            # The table was never vacuumed nor analyzed, when the number of tuples is negative.
+            if row is None or row[0] < 0:
+                return None
+            return int(row[0])
+
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        if isinstance(plan, list):
+            plan = plan[0]
+        return int(plan["Plan"]["Plan Rows"])
+
+    def get_paginated_response(self: Self, data: Any) -> Response:  # noqa: ANN401
+        """Wrap the page in the paginated response, telling if its count is exact."""
+        paginator = cast("CachedCountPaginator", cast("Page[Any]", self.page).paginator)
+        return Response(
+            {
+                "count": paginator.count,
+                "count_is_exact": paginator.count_is_exact,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_paginated_response_schema(self: Self, schema: dict[str, Any]) -> dict[str, Any]:
+        """The schema of the paginated response."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_exact"] = {
+            "type": "boolean",
+            "description": "False when the count is a planner estimate of a large list.",
+        }
+        return response_schema
+
+    def get_schema_operation_parameters(self: Self, view: APIView) -> list[dict[str, Any]]:
+        """The query parameters of the pagination."""
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.exact_count_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.exact_count_query_description,
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination using keyset predicates on the ordering of the queryset.
+
+    The ordering of the queryset is completed with the primary key as a tiebreaker, and the next page
+    is selected with a composite predicate on the ordering values of the last object, so no OFFSET
+    nor COUNT is needed. Null values are ordered like PostgreSQL does: last in ascending order,
+    first in descending order. Only forward pagination is supported.
+    """
+
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    mode_query_value = "cursor"
+    page_size = cast("int", api_settings.PAGE_SIZE)
+    invalid_cursor_message = "Invalid cursor"
+    unsupported_ordering_message = "The cursor pagination is not supported for this ordering."
+    key_annotation_prefix = "keyset_key_"
+
+    def __init__(self: Self) -> None:
+        """Initialize the paginator state."""
+        self.request: Request | None = None
+        self.ordering: list[str] = []
+        self.next_values: list[Any] | None = None
+
+    @classmethod
+    def is_requested(cls: type[Self], request: Request) -> bool:
+        """Check if the client asked for the cursor pagination."""
+        return (
+            cls.cursor_query_param in request.query_params
+            or request.query_params.get(cls.mode_query_param) == cls.mode_query_value
+        )
+
+    def paginate_queryset(
+        self: Self,
+        queryset: QuerySet[Any],
+        request: Request,
+        view: APIView | None = None,  # noqa: ARG002
+    ) -> list[Any]:
+        """Get the page of objects following the cursor."""
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        keys = [
+            (f"{self.key_annotation_prefix}{index}", name.startswith("-")) for index, name in enumerate(self.ordering)
+        ]
+        queryset = queryset.annotate(
+            **{key: F(name.removeprefix("-")) for (key, _), name in zip(keys, self.ordering, strict=True)},
+        ).order_by(*self.ordering)
+
+        values = self.decode_cursor(request)
+        if values is not None:
+            queryset = queryset.filter(self.get_keyset_filter(keys, values))
+
+        results = list(queryset[: self.page_size + 1])
+        self.next_values = None
+        if len(results) > self.page_size:
+            results = results[: self.page_size]
+            self.next_values = [getattr(results[-1], key) for key, _ in keys]
+        return results
+
+    def get_ordering(self: Self, queryset: QuerySet[Any]) -> list[str]:
+        """Get the ordering of the queryset completed with the primary key tiebreaker."""
+        query = queryset.query
+        ordering: list[str] = []
+        default_ordering = (query.get_meta().ordering or ()) if query.default_ordering else ()
+        for name in query.order_by or default_ordering:
+            if not isinstance(name, str) or not name.lstrip("-") or name == "?":
+                raise NotFound(self.unsupported_ordering_message)
+            ordering.append(name)
+
+        pk_names = {"pk", queryset.model._meta.pk.name}  # noqa: SLF001
+        if not any(name.removeprefix("-") in pk_names for name in ordering):
+            ordering.append("pk")
+        return ordering
+
+    @staticmethod
+    def get_keyset_filter(keys: list[tuple[str, bool]], values: list[Any]) -> Q:
+        """Get the predicate selecting the objects ordered after the given ordering values.
+
+        For the keys k1, k2, ..., kn it is `k1 after v1 OR (k1 = v1 AND k2 after v2) OR ...`.
+        """
+        conditions = []
+        equal = Q()
+        for (key, descending), value in zip(keys, values, strict=True):
+            if value is None:
+                # Nulls are first in descending order, so every non-null value comes after them.
+                if descending:
+                    conditions.append(equal & Q(**{f"{key}__isnull": False}))
+                equal &= Q(**{f"{key}__isnull": True})
+            else:
+                after = Q(**{f"{key}__lt": value}) if descending else Q(**{f"{key}__gt": value})
+                if not descending:
+                    # Nulls are last in ascending order.
+                    after |= Q(**{f"{key}__isnull": True})
+                conditions.append(equal & after)
+                equal &= Q(**{key: value})
+        return reduce(operator.or_, conditions)
+
+    def encode_cursor(self: Self, values: list[Any]) -> str:
+        """Encode the ordering and the ordering values of the last object into a cursor."""
+        data = json.dumps({"ordering": self.ordering, "values": values}, default=_encode_cursor_value)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self: Self, request: Request) -> list[Any] | None:
+        """Decode the ordering values from the cursor of the request."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            values = data["values"]
+            ordering = data["ordering"]
+        except (binascii.Error, ValueError, TypeError, KeyError) as error:
+            raise NotFound(self.invalid_cursor_message) from error
+        # A cursor is only valid for the ordering it was created for.
+        if ordering != self.ordering or not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def get_next_link(self: Self) -> str | None:
+        """Get the link to the next page."""
+        if self.request is None or self.next_values is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), "page")
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_values))
+
+    def get_paginated_response(self: Self, data: Any) -> Response:  # noqa: ANN401
+        """Wrap the page in the paginated response."""
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self: Self, schema: dict[str, Any]) -> dict[str, Any]:
+        """The schema of the paginated response."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPaginationMixin(GenericAPIView[Any]):
+    """Let the clients switch a list view to the keyset pagination per request.
+
+    The keyset pagination is used when the request has the `cursor` parameter or `pagination=cursor`,
+    the default pagination class is used otherwise.
+    """
+
+    keyset_pagination_class: type[KeysetPagination] = KeysetPagination
+
+    @property
+    def paginator(self: Self) -> BasePagination | None:
+        """The paginator instance associated with the view, or None."""
+        if not hasattr(self, "_paginator") and self.keyset_pagination_class.is_requested(self.request):
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
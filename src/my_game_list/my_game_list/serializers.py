@@ -1,8 +1,18 @@
-"""This module contains the base class for all dictionary serializers."""
+"""This module contains the base serializers shared by the applications."""
 
-from typing import Any
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueTogetherValidator
+
+if TYPE_CHECKING:
+    from django.db.models import ManyToManyField, QuerySet
+
+ModelType = TypeVar("ModelType", bound=Model)
 
 
 class BaseDictionarySerializer(serializers.ModelSerializer[Any]):
@@ -12,3 +22,153 @@ class Meta:
         """Meta data for dictionary models."""
 
         fields: tuple[str, ...] = ("id", "name")
+
+
+def get_primary_key_value(model: type[Model], value: Any) -> Any | None:  # noqa: ANN401
+    """Convert the value to a primary key of the model, None if it is not a valid primary key."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return model._meta.pk.to_python(value)  # noqa: SLF001
+    except DjangoValidationError:
+        return None
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField[Any]):
+    """A primary key related field resolving the objects preloaded by `BulkCreateListSerializer`.
+
+    Outside of the bulk validation every object is looked up with its own query, like in the parent class.
+    """
+
+    preloaded_objects: dict[Any, Model] | None = None
+
+    def to_internal_value(self: Self, data: Any) -> Model:  # noqa: ANN401
+        """Get the preloaded object with the given primary key."""
+        if self.preloaded_objects is None:
+            return cast("Model", super().to_internal_value(data))
+        pk = get_primary_key_value(cast("QuerySet[Model]", self.get_queryset()).model, data)
+        if pk is None:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if pk not in self.preloaded_objects:
+            self.fail("does_not_exist", pk_value=data)
+        return self.preloaded_objects[pk]
+
+
+class BulkCreateListSerializer(serializers.ListSerializer[ModelType]):
+    """A list serializer validating and creating the objects in bulk.
+
+    The objects referenced by the `PreloadedPrimaryKeyRelatedField` fields of the child serializer are loaded
+    with one query per field and the unique together constraints are checked with one query per constraint.
+    The objects are inserted with a single `bulk_create` and the rows of every many-to-many relation with
+    another one, so the model signals are not sent.
+    """
+
+    def get_preloaded_fields(self: Self) -> dict[str, PreloadedPrimaryKeyRelatedField]:
+        """Get the writable preloaded related fields of the child serializer by their names."""
+        preloaded_fields = {}
+        for name, field in self.child.fields.items():  # type: ignore[union-attr]
+            relation = field.child_relation if isinstance(field, serializers.ManyRelatedField) else field
+            if isinstance(relation, PreloadedPrimaryKeyRelatedField) and not field.read_only:
+                preloaded_fields[name] = relation
+        return preloaded_fields
+
+    def get_unique_together_validators(self: Self) -> list[UniqueTogetherValidator]:
+        """Get the unconditional unique together validators of the child serializer."""
+        return [
+            validator
+            for validator in self.child.validators  # type: ignore[union-attr]
+            if isinstance(validator, UniqueTogetherValidator) and getattr(validator, "condition", None) is None
+        ]
+
+    def preload_related_objects(self: Self, data: list[Any], preloaded_fields: dict[str, Any]) -> None:
+        """Load the objects referenced by the items with a single query per preloaded field."""
+        for name, relation in preloaded_fields.items():
+            queryset = relation.get_queryset()
+            pks = set()
+            for item in data:
+                value = item.get(name) if isinstance(item, Mapping) else None
+                for related_value in value if isinstance(value, list) else [value]:
+                    pk = get_primary_key_value(queryset.model, related_value)
+                    if pk is not None:
+                        pks.add(pk)
+            relation.preloaded_objects = queryset.in_bulk(pks)
+
+    def validate_unique_together(
+        self: Self,
+        validated_data: list[dict[str, Any]],
+        validators: list[UniqueTogetherValidator],
+    ) -> None:
+        """Check the unique together constraints of all the items, within the items and in the database."""
+        errors: list[dict[str, Any]] = [{} for _ in validated_data]
+        for validator in validators:
+            fields = tuple(validator.fields)
+            values = [tuple(attrs.get(field) for field in fields) for attrs in validated_data]
+            lookups = {f"{field}__in": {value[index] for value in values} for index, field in enumerate(fields)}
+            existing_values = set(validator.queryset.filter(**lookups).values_list(*fields))
+            seen_values = set()
+            for index, value in enumerate(values):
+                pk_value = tuple(getattr(related, "pk", related) for related in value)
+                if pk_value in existing_values or pk_value in seen_values:
+                    message = validator.message.format(field_names=", ".join(fields))
+                    errors[index].setdefault(api_settings.NON_FIELD_ERRORS_KEY, []).append(message)
+                seen_values.add(pk_value)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+    def to_internal_value(self: Self, data: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Validate the items with the related objects preloaded and the uniqueness checked for all the items."""
+        preloaded_fields = self.get_preloaded_fields()
+        unique_together_validators = self.get_unique_together_validators()
+        child_validators = self.child.validators  # type: ignore[union-attr]
+        if isinstance(data, list):
+            self.preload_related_objects(data, preloaded_fields)
+        self.child.validators = [  # type: ignore[union-attr]
+            validator for validator in child_validators if validator not in unique_together_validators
+        ]
+        try:
+            validated_data: list[dict[str, Any]] = super().to_internal_value(data)
+        finally:
+            self.child.validators = child_validators  # type: ignore[union-attr]
+            for relation in preloaded_fields.values():
+                relation.preloaded_objects = None
+        self.validate_unique_together(validated_data, unique_together_validators)
+        return validated_data
+
+    def create(self: Self, validated_data: list[dict[str, Any]]) -> list[ModelType]:  # type: ignore[override]
+        """Insert the objects and the rows of their many-to-many relations in bulk.
+
+        The related objects are set as prefetched on the created objects, so they are serialized without queries.
+        """
+        model = cast("type[ModelType]", self.child.Meta.model)  # type: ignore[union-attr]
+        many_to_many_fields = cast("list[ManyToManyField[Any, Any]]", model._meta.many_to_many)  # noqa: SLF001
+        instances = []
+        related_objects = []
+        for attrs in validated_data:
+            instance_attrs = dict(attrs)
+            related_objects.append(
+                {
+                    field.name: list(dict.fromkeys(instance_attrs.pop(field.name)))
+                    for field in many_to_many_fields
+                    if field.name in instance_attrs
+                },
+            )
+            instances.append(model(**instance_attrs))
+        model._default_manager.bulk_create(instances)  # noqa: SLF001
+
+        for field in many_to_many_fields:
+            through = cast("type[Model]", field.remote_field.through)
+            source_name, target_name = field.m2m_field_name(), field.m2m_reverse_field_name()
+            through._default_manager.bulk_create(  # noqa: SLF001
+                through(**{f"{source_name}_id": instance.pk, f"{target_name}_id": related_object.pk})
+                for instance, related in zip(instances, related_objects, strict=True)
+                for related_object in related.get(field.name, [])
+            )
+            for instance, related in zip(instances, related_objects, strict=True):
+                if field.name in related:
+                    queryset = getattr(instance, field.name).get_queryset()
+                    queryset._result_cache = related[field.name]  # noqa: SLF001
+                    queryset._prefetch_done = True  # noqa: SLF001
+                    prefetched_objects_cache = getattr(instance, "_prefetched_objects_cache", {})
+                    prefetched_objects_cache[field.name] = queryset
+                    instance._prefetched_objects_cache = prefetched_objects_cache  # type: ignore[attr-defined]  # noqa: SLF001
+        return instances
@@ -0,0 +1,20 @@
+"""Signals for the notifications application."""
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from my_game_list.my_game_list.pagination import invalidate_cached_counts
+from my_game_list.notifications.models import Notification
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def invalidate_notification_counts(
+    sender: type[Notification],
+    instance: Notification,
+    **kwargs: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Invalidate the cached counts of the notification lists of the recipient when a notification is changed."""
+    invalidate_cached_counts(sender, instance.recipient_id)
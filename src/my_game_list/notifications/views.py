@@ -11,6 +11,7 @@
 from rest_framework.serializers import IntegerField
 from rest_framework.viewsets import GenericViewSet
 
+from my_game_list.my_game_list.pagination import CachedCountPagination, invalidate_cached_counts
 from my_game_list.notifications.filters import NotificationFilterSet
 from my_game_list.notifications.models import Notification
 from my_game_list.notifications.serializers import NotificationSerializer
@@ -60,6 +61,7 @@ class NotificationViewSet(ListModelMixin, RetrieveModelMixin, DestroyModelMixin,
     serializer_class = NotificationSerializer
     permission_classes = (IsAuthenticated,)
     filterset_class = NotificationFilterSet
+    pagination_class = CachedCountPagination
 
     def get_queryset(self: Self) -> NotificationQuerySet:
         """Get the queryset for the current user."""
@@ -68,6 +70,10 @@ def get_queryset(self: Self) -> NotificationQuerySet:
             return Notification.objects.none()
         return Notification.objects.filter(recipient=user)
 
+    def get_count_owner_id(self: Self) -> int | None:
+        """Get the ID of the recipient the listed notifications are scoped to."""
+        return self.request.user.pk
+
     @extend_schema(
         description="Return the count of unread notifications for the authenticated user.",
         responses={
@@ -104,9 +110,10 @@ def mark_as_read(self: Self, request: Request, pk: int) -> Response:  # noqa: AR
         responses={204: None},
     )
     @action(detail=False, methods=("post",), url_path="mark-all-as-read")
-    def mark_all_as_read(self: Self, request: Request) -> Response:  # noqa: ARG002
+    def mark_all_as_read(self: Self, request: Request) -> Response:
         """Mark all notifications as read for the user."""
-        self.get_queryset().unread().mark_all_as_read()
+        if self.get_queryset().unread().mark_all_as_read():
+            invalidate_cached_counts(Notification, request.user.pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @extend_schema(
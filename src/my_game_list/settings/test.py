@@ -18,6 +18,7 @@
         "PASSWORD": "testcontainers_managed",  # NOSONAR
         "HOST": "localhost",
         "PORT": "0",
+        "OPTIONS": DATABASES["default"]["OPTIONS"],
     },
 }
 
@@ -5,6 +5,7 @@
 import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.management import call_command
 from freezegun import freeze_time
 from model_bakery import baker
@@ -45,6 +46,14 @@ def django_db_setup(
         yield
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Generator[None]:
+    """Start every test with an empty cache, so cached responses do not leak between tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 @freeze_time("2023-05-25 12:01:12")
 def user_fixture() -> UserModel:
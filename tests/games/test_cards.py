@@ -0,0 +1,141 @@
+"""Tests for the denormalized game cards."""
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+from django.utils import translation
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.cards import refresh_game_cards
+from my_game_list.games.models import Game, GameCard, GameList, GameStats, GameStatus, GameType, Genre
+from my_game_list.games.serializers import GameCardSerializer, GameSimpleListSerializer
+from my_game_list.games.tasks import recalculate_ranks
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db()
+def test_card_is_created_with_the_game() -> None:
+    """Saving a game creates its card holding the list fields in both languages."""
+    game_status = baker.make(GameStatus, status_en="Released", status_pl="Wydana")
+    game_type = baker.make(GameType, type_en="Main Game", type_pl="Gra główna")
+    game = baker.make(
+        Game,
+        title_en="The Witcher",
+        title_pl="Wiedźmin",
+        game_status=game_status,
+        game_type=game_type,
+    )
+
+    card = GameCard.objects.filter(game=game).values().get()
+
+    assert (card["title_en"], card["title_pl"]) == ("The Witcher", "Wiedźmin")
+    assert (card["game_status_en"], card["game_status_pl"]) == ("Released", "Wydana")
+    assert (card["game_type_en"], card["game_type_pl"]) == ("Main Game", "Gra główna")
+    assert card["slug"] == game.slug
+    assert (card["average_score"], card["members_count"], card["rank_position"]) == (Decimal(0), 0, 0)
+
+
+@pytest.mark.django_db()
+def test_card_serializer_matches_game_serializer() -> None:
+    """The card serializer outputs the same data as the game list serializer in every language."""
+    game_status = baker.make(GameStatus, status_en="Released", status_pl="Wydana")
+    game = baker.make(Game, title_en="The Witcher", title_pl="Wiedźmin", game_status=game_status)
+    baker.make(GameList, game=game, score=7)
+    baker.make(GameList, game=game, score=8)
+    recalculate_ranks()
+
+    for language in ("en", "pl"):
+        with translation.override(language):
+            game = Game.objects.select_related("stats", "game_status", "game_type").get(pk=game.pk)
+            card = GameCard.objects.get(game=game)
+            assert GameCardSerializer(card).data == GameSimpleListSerializer(game).data
+
+
+@pytest.mark.django_db()
+def test_card_follows_game_list_changes() -> None:
+    """The stats of the card are refreshed with the game list entries."""
+    game = baker.make(Game)
+    entry = baker.make(GameList, game=game, score=6)
+    baker.make(GameList, game=game, score=9)
+
+    card = GameCard.objects.get(game=game)
+    assert (card.average_score, card.scores_count, card.members_count) == (Decimal("7.50"), 2, 2)
+
+    entry.delete()
+    card.refresh_from_db()
+    assert (card.average_score, card.scores_count, card.members_count) == (Decimal("9.00"), 1, 1)
+
+
+@pytest.mark.django_db()
+def test_card_follows_ranks_and_dictionary_changes() -> None:
+    """The ranks are refreshed by the recalculation, the status names by saving the status."""
+    game_status = baker.make(GameStatus, status_en="Alpha")
+    game = baker.make(Game, game_status=game_status)
+    baker.make(GameList, game=game, score=10)
+
+    recalculate_ranks()
+    with translation.override("en"):
+        game_status.status = "Beta"
+        game_status.save()
+
+    card = GameCard.objects.filter(game=game).values("rank_position", "popularity", "game_status_en").get()
+    assert card == {"rank_position": 1, "popularity": 1, "game_status_en": "Beta"}
+
+
+@pytest.mark.django_db()
+def test_refresh_game_cards_writes_only_changed_cards() -> None:
+    """Refreshing the cards writes the missing and changed cards only."""
+    games = baker.make(Game, _quantity=3)
+    GameCard.objects.filter(game=games[0]).delete()
+    Game.objects.filter(pk=games[1].pk).update(cover_image_id="new_cover")
+
+    assert refresh_game_cards() == 2  # noqa: PLR2004
+    assert refresh_game_cards() == 0
+    assert refresh_game_cards([]) == 0
+    assert GameCard.objects.get(game=games[1]).cover_image_id == "new_cover"
+
+
+@pytest.mark.django_db()
+def test_games_list_reads_game_cards(
+    api_client: APIClient,
+    django_assert_max_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The games list is counted, paginated and serialized from the cards without joining the games."""
+    games = baker.make(Game, _quantity=30)
+    baker.make(GameList, game=games[0], score=8)
+
+    # The count and the page of the cards.
+    with django_assert_max_num_queries(2) as captured:
+        response = api_client.get(reverse("games:games-list"), {"exact_count": "true"})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["count"] == 30  # noqa: PLR2004
+    assert [game["id"] for game in data["results"]] == [game.pk for game in games[:25]]
+    assert data["results"][0]["average_score"] == 8.0  # noqa: PLR2004
+    assert all(f'"{Game._meta.db_table}"' not in query["sql"] for query in captured.captured_queries)  # noqa: SLF001
+
+
+@pytest.mark.django_db()
+def test_games_list_joins_games_only_for_relation_filters(
+    api_client: APIClient,
+    django_assert_max_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The filters by the relations missing from the cards join the games, ordered by the ranks of the cards."""
+    genre = baker.make(Genre, name_en="Action", name_pl="Akcja")
+    not_ranked_game, ranked_game = baker.make(Game, genres=[genre], _quantity=2)
+    baker.make(Game)
+    GameStats.objects.filter(game=ranked_game).update(rank_position=1)
+    refresh_game_cards()
+
+    with django_assert_max_num_queries(2) as captured:
+        response = api_client.get(reverse("games:games-list"), {"genres": "Action", "ordering": "rank_position"})
+
+    assert [game["id"] for game in response.json()["results"]] == [ranked_game.pk, not_ranked_game.pk]
+    assert any(f'"{Game._meta.db_table}"' in query["sql"] for query in captured.captured_queries)  # noqa: SLF001
@@ -0,0 +1,42 @@
+"""Tests for the games filters."""
+
+import pytest
+from django.db import connection
+from model_bakery import baker
+
+from my_game_list.games.filters import search_by_title
+from my_game_list.games.models import Game, GameList
+
+
+@pytest.mark.django_db()
+def test_word_similarity_threshold_is_set_on_connection() -> None:
+    """The title search prefilter threshold is sent with the options of every database connection."""
+    with connection.cursor() as cursor:
+        cursor.execute("SHOW pg_trgm.word_similarity_threshold")
+        (threshold,) = cursor.fetchone()
+
+    assert float(threshold) == 0.2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_search_by_title_uses_search_title_gin_index() -> None:
+    """The title search prefilter is eligible for the trigram GIN index on the search title."""
+    baker.make(Game, title_en="The Witcher", title_pl="Wiedźmin", _quantity=3)
+
+    with connection.cursor() as cursor:
+        # The table is tiny, so the planner has to be told to avoid the sequential scan.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = search_by_title(Game.objects.all(), "witcher", "search_title").explain()
+
+    assert "games_game_search_title_gin" in plan
+
+
+@pytest.mark.django_db()
+def test_search_by_title_filters_game_lists_by_game_title() -> None:
+    """The title search on game lists matches the title of the listed game."""
+    witcher = baker.make(GameList, game=baker.make(Game, title_en="The Witcher", title_pl="Wiedźmin"))
+    baker.make(GameList, game=baker.make(Game, title_en="Half-Life", title_pl="Half-Life"))
+
+    result = search_by_title(GameList.objects.all(), "witcher", "game__search_title")
+
+    assert list(result) == [witcher]
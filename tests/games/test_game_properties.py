@@ -4,6 +4,7 @@
 from model_bakery import baker
 
 from my_game_list.games.models import Game, GameList
+from my_game_list.games.stats import recalculate_game_ranks
 from my_game_list.games.tasks import recalculate_ranks
 
 
@@ -63,3 +64,39 @@ def test_game_popularity() -> None:
     assert game1.popularity == 1
     assert game2.popularity == 2  # noqa: PLR2004
     assert game3.popularity == 3  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_game_rank_position_ties_are_broken_by_game_id() -> None:
+    """Test that games with the same average score are ranked by the higher game ID first."""
+    older_game = baker.make(Game)
+    newer_game = baker.make(Game)
+    baker.make(GameList, game=older_game, score=7)
+    baker.make(GameList, game=newer_game, score=7)
+
+    recalculate_ranks()
+
+    older_game.refresh_from_db()
+    newer_game.refresh_from_db()
+
+    assert newer_game.rank_position == 1
+    assert older_game.rank_position == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_recalculate_game_ranks_writes_only_changed_ranks() -> None:
+    """Test that only the statistics with a changed rank are updated."""
+    game1 = baker.make(Game)
+    game2 = baker.make(Game)
+    baker.make(Game)
+    game_list = baker.make(GameList, game=game1, score=10)
+    baker.make(GameList, game=game2, score=8)
+
+    assert recalculate_game_ranks() == 3  # noqa: PLR2004
+    assert recalculate_game_ranks() == 0
+
+    # Swaps the rank positions of game1 and game2, the popularity stays the same.
+    game_list.score = 5
+    game_list.save()
+
+    assert recalculate_game_ranks() == 2  # noqa: PLR2004
@@ -0,0 +1,275 @@
+"""Tests for the rate limited requests of the IGDB wrapper, run against a local stub server."""
+
+import json
+import re
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, ClassVar, Self
+from unittest.mock import Mock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from my_game_list.games.management.commands._igdb_wrapper import (
+    IGDBEndpoints,
+    IGDBPermanentError,
+    IGDBWrapper,
+    TokenBucket,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class FakeClock:
+    """A clock advanced only by the waits of the token bucket."""
+
+    def __init__(self: Self) -> None:
+        """Start the clock."""
+        self.now = 0.0
+        self.waits: list[float] = []
+
+    def __call__(self: Self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def sleep(self: Self, seconds: float) -> None:
+        """Record the wait and advance the clock."""
+        self.waits.append(seconds)
+        self.now += seconds
+
+
+class StubIGDBHandler(BaseHTTPRequestHandler):
+    """Serve the access token and the pages of the genres, recording the requests."""
+
+    protocol_version = "HTTP/1.1"
+    GENRES_COUNT = 45
+    RESPONSE_DELAY = 0.3
+    requests: ClassVar[list[tuple[float, int]]] = []
+    queries: ClassVar[list[str]] = []
+    failures: ClassVar[dict[int, list[int]]] = {}
+    retry_after = "0"
+    open_requests: ClassVar[list[int]] = [0, 0]
+    lock = threading.Lock()
+
+    def do_POST(self: Self) -> None:
+        """Handle the request."""
+        with self.lock:
+            self.requests.append((time.monotonic(), self.client_address[1]))
+            self.open_requests[0] += 1
+            self.open_requests[1] = max(self.open_requests)
+        query = self.rfile.read(int(self.headers["Content-Length"] or 0)).decode()
+        self.queries.append(query)
+        body: dict[str, object] | list[dict[str, object]]
+        status = HTTPStatus.OK
+
+        if self.path.startswith("/oauth"):
+            body = {"access_token": "token", "expires_in": 3600, "token_type": "bearer"}
+        else:
+            time.sleep(self.RESPONSE_DELAY)
+            limit = int(re.search(r"limit (\d+);", query).group(1))  # type: ignore[union-attr]
+            offset = int(re.search(r"offset (\d+);", query).group(1))  # type: ignore[union-attr]
+            after_id = int(match.group(1)) if (match := re.search(r"id > (\d+)", query)) else 0
+            first_id = after_id + offset + 1
+            body = [
+                {"id": genre_id, "updated_at": 0, "name": f"Genre {genre_id}"}
+                for genre_id in range(first_id, min(first_id + limit, self.GENRES_COUNT + 1))
+            ]
+            # The page starting with the given ID fails with the given statuses first.
+            with self.lock:
+                if failures := self.failures.get(first_id):
+                    status = HTTPStatus(failures.pop(0))
+                    body = {"message": status.phrase}
+
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.send_header("Retry-After", self.retry_after)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        with self.lock:
+            self.open_requests[0] -= 1
+
+    def log_message(self: Self, *args: object) -> None:
+        """Do not log the requests."""
+
+
+@pytest.fixture
+def igdb_wrapper() -> Generator[IGDBWrapper]:
+    """Get the IGDB wrapper sending the requests to the stub server."""
+    StubIGDBHandler.requests.clear()
+    StubIGDBHandler.queries.clear()
+    StubIGDBHandler.failures.clear()
+    StubIGDBHandler.retry_after = "0"
+    StubIGDBHandler.open_requests[:] = [0, 0]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubIGDBHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}"
+
+    with (
+        patch.object(IGDBWrapper, "IGDB_AUTHENTICATION_URL", f"{url}/oauth"),
+        patch.object(IGDBWrapper, "IGDB_BASE_URL", f"{url}/v4/"),
+        patch.object(IGDBWrapper, "QUERY_ITEM_LIMIT", 10),
+        patch.object(IGDBWrapper, "MAX_RETRIES", 2),
+        patch.object(IGDBWrapper, "BACKOFF_BASE", 0.01),
+    ):
+        wrapper = IGDBWrapper()
+        yield wrapper
+        wrapper.close()
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_token_bucket_spaces_requests_evenly() -> None:
+    """With a single token every request waits for the interval of the rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        bucket.acquire()
+
+    assert clock.waits == pytest.approx([0.25] * 4)
+
+
+def test_token_bucket_allows_burst_up_to_capacity() -> None:
+    """The full bucket lets a burst of its capacity through, then the requests follow the rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, capacity=4, clock=clock, sleep=clock.sleep)
+
+    for _ in range(6):
+        bucket.acquire()
+
+    assert clock.waits == pytest.approx([0.25, 0.25])
+
+    clock.now += 10
+    for _ in range(4):
+        bucket.acquire()
+    assert len(clock.waits) == 2  # noqa: PLR2004
+
+
+def test_token_bucket_pause_delays_next_request() -> None:
+    """The paused bucket makes the next request wait for the pause and its own token."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(2)
+    bucket.acquire()
+
+    assert clock.waits == pytest.approx([2.25])
+
+
+def get_metric(name: str, **labels: str) -> float:
+    """Get the current value of the IGDB metric."""
+    return REGISTRY.get_sample_value(name, {"endpoint": IGDBEndpoints.GENRES.value, **labels}) or 0.0
+
+
+def test_get_retry_after_in_seconds_and_as_date() -> None:
+    """The Retry-After header is read in seconds or as an HTTP date."""
+    retry_at = datetime.now(tz=UTC) + timedelta(seconds=30)
+
+    assert IGDBWrapper._get_retry_after(Mock(headers={"Retry-After": "3"})) == 3  # noqa: PLR2004, SLF001
+    assert 25 < IGDBWrapper._get_retry_after(Mock(headers={"Retry-After": format_datetime(retry_at)})) <= 30  # type: ignore[operator]  # noqa: PLR2004, SLF001
+    assert IGDBWrapper._get_retry_after(Mock(headers={"Retry-After": "soon"})) is None  # noqa: SLF001
+    assert IGDBWrapper._get_retry_after(Mock(headers={})) is None  # noqa: SLF001
+
+
+def test_iter_all_objects_retries_transient_errors(igdb_wrapper: IGDBWrapper) -> None:
+    """The rate limited and failed pages are retried, so all the objects are fetched."""
+    retries_count = get_metric("igdb_request_retries_total")
+    rate_limited_count = get_metric("igdb_requests_total", status="429")
+    StubIGDBHandler.failures.update({11: [HTTPStatus.TOO_MANY_REQUESTS], 31: [HTTPStatus.SERVICE_UNAVAILABLE] * 2})
+
+    batches = list(igdb_wrapper.iter_all_objects(IGDBEndpoints.GENRES, "fields name, updated_at;"))
+
+    assert [genre.id for batch in batches for genre in batch] == list(range(1, StubIGDBHandler.GENRES_COUNT + 1))
+    assert igdb_wrapper.dead_letters == []
+    assert get_metric("igdb_request_retries_total") - retries_count == 3  # noqa: PLR2004
+    assert get_metric("igdb_requests_total", status="429") - rate_limited_count == 1
+
+
+def test_iter_all_objects_moves_failed_page_to_dead_letters(igdb_wrapper: IGDBWrapper) -> None:
+    """The page failing after all the retries does not end the paging and is replayed from the dead-letter list."""
+    dead_letters_count = get_metric("igdb_dead_letters_total")
+    StubIGDBHandler.failures.update({21: [HTTPStatus.BAD_GATEWAY] * 3})
+
+    batches = list(igdb_wrapper.iter_all_objects(IGDBEndpoints.GENRES, "fields name, updated_at;"))
+
+    assert [genre.id for batch in batches for genre in batch] == [*range(1, 21), *range(31, 46)]
+    assert get_metric("igdb_dead_letters_total") - dead_letters_count == 1
+    (dead_letter,) = igdb_wrapper.take_dead_letters(IGDBEndpoints.GENRES.value)
+    assert (dead_letter.endpoint, dead_letter.query) == (
+        IGDBEndpoints.GENRES.value,
+        "fields name, updated_at;where id > 0;limit 10;offset 20;sort id;",
+    )
+    assert "502 Bad Gateway" in dead_letter.error
+    assert igdb_wrapper.dead_letters == []
+
+    assert [genre.id for genre in igdb_wrapper.replay_dead_letter(dead_letter)] == list(range(21, 31))
+    assert get_metric("igdb_dead_letters_replayed_total", result="succeeded") >= 1
+
+
+def test_api_request_does_not_retry_permanent_errors(igdb_wrapper: IGDBWrapper) -> None:
+    """The client errors other than the rate limit fail at once."""
+    StubIGDBHandler.failures.update({1: [HTTPStatus.BAD_REQUEST]})
+
+    with pytest.raises(IGDBPermanentError, match="400 Bad Request"):
+        igdb_wrapper.api_request(IGDBEndpoints.GENRES, "fields name, updated_at;limit 3;offset 0;")
+
+    assert len(StubIGDBHandler.queries) == 2  # noqa: PLR2004
+
+
+def test_iter_all_objects_fails_on_permanent_errors(igdb_wrapper: IGDBWrapper) -> None:
+    """The page failing with a permanent error ends the paging instead of being moved to the dead-letter list."""
+    StubIGDBHandler.failures.update({21: [HTTPStatus.UNAUTHORIZED]})
+
+    with pytest.raises(IGDBPermanentError, match="401 Unauthorized"):
+        list(igdb_wrapper.iter_all_objects(IGDBEndpoints.GENRES, "fields name, updated_at;"))
+
+    assert igdb_wrapper.dead_letters == []
+
+
+def test_iter_all_objects_does_not_wait_for_long_retry_after(igdb_wrapper: IGDBWrapper) -> None:
+    """The page asked to wait longer than the cap is moved to the dead-letter list without holding the import."""
+    StubIGDBHandler.retry_after = "3600"
+    StubIGDBHandler.failures.update({21: [HTTPStatus.TOO_MANY_REQUESTS]})
+    started_at = time.monotonic()
+
+    batches = list(igdb_wrapper.iter_all_objects(IGDBEndpoints.GENRES, "fields name, updated_at;"))
+
+    assert time.monotonic() - started_at < IGDBWrapper.RETRY_AFTER_MAX
+    assert [genre.id for batch in batches for genre in batch] == [*range(1, 21), *range(31, 46)]
+    (dead_letter,) = igdb_wrapper.take_dead_letters(IGDBEndpoints.GENRES.value)
+    assert "retry after 3600 seconds" in dead_letter.error
+
+
+def test_iter_all_objects_holds_rate_limit(igdb_wrapper: IGDBWrapper) -> None:
+    """All the pages are fetched over the pooled connections without exceeding the rate of IGDB."""
+    batches = list(igdb_wrapper.iter_all_objects(IGDBEndpoints.GENRES, "fields name, updated_at;"))
+
+    assert [genre.id for batch in batches for genre in batch] == list(range(1, StubIGDBHandler.GENRES_COUNT + 1))
+    # The access token and two batches of four pages, the second batch starts after the last ID of the first one.
+    page_requests = StubIGDBHandler.requests[1:]
+    assert len(page_requests) == 8  # noqa: PLR2004
+    assert all(query.startswith("fields name, updated_at;where id > 40;") for query in StubIGDBHandler.queries[-4:])
+    request_times = [request_time for request_time, _ in page_requests]
+    for first_time, fifth_time in zip(request_times, request_times[IGDBWrapper.REQUESTS_PER_SECOND :], strict=False):
+        # The tolerance covers the scheduling of the threads of the stub server.
+        assert fifth_time - first_time >= 0.9  # noqa: PLR2004
+    # The responses are slower than the rate, so the requests overlap, but on a bounded number of connections.
+    assert 1 < StubIGDBHandler.open_requests[1] <= IGDBWrapper.MAX_CONCURRENT_REQUESTS
+    assert len({port for _, port in page_requests}) < len(page_requests)
+
+
+def test_api_request_uses_session(igdb_wrapper: IGDBWrapper) -> None:
+    """The single request is rate limited and sent over the session as well."""
+    genres = igdb_wrapper.api_request(IGDBEndpoints.GENRES, "fields name, updated_at;limit 3;offset 0;")
+
+    assert [genre.id for genre in genres] == [1, 2, 3]
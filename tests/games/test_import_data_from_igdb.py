@@ -0,0 +1,169 @@
+"""Tests for the checkpoints of the IGDB import."""
+
+import itertools
+from datetime import UTC, datetime
+from io import StringIO
+from typing import TYPE_CHECKING, Self
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from model_bakery import baker
+
+from my_game_list.games.management.commands._igdb_wrapper import (
+    IGDBDeadLetter,
+    IGDBEndpoints,
+    IGDBGenreResponse,
+    IGDBInteractionError,
+)
+from my_game_list.games.models import Genre, IGDBImportCheckpoint, IGDBImportStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+
+class FakeIGDBWrapper:
+    """Serve the genres in batches of two, in the order of their IDs, failing after the given number of batches.
+
+    The genres with the IDs in the queries of the dead letters are skipped, as their pages failed.
+    """
+
+    def __init__(self: Self) -> None:
+        """Initialize the fake wrapper."""
+        self.genres = [
+            IGDBGenreResponse(id=genre_id, updated_at=1_700_000_000 + genre_id, name=f"Genre {genre_id}")
+            for genre_id in range(1, 7)
+        ]
+        self.fail_after_batches: int | None = None
+        self.calls: list[tuple[str, int]] = []
+        self.dead_letters: list[IGDBDeadLetter] = []
+        self.failing_replays = 0
+        self.closed = False
+
+    def close(self: Self) -> None:
+        """Close the fake wrapper."""
+        self.closed = True
+
+    def take_dead_letters(self: Self, endpoint: str) -> list[IGDBDeadLetter]:
+        """Take the dead letters."""
+        assert endpoint == IGDBEndpoints.GENRES.value
+        dead_letters, self.dead_letters = self.dead_letters, []
+        return dead_letters
+
+    def replay_dead_letter(self: Self, dead_letter: IGDBDeadLetter) -> list[IGDBGenreResponse]:
+        """Get the genres of the page with the IDs given as the query."""
+        if self.failing_replays:
+            self.failing_replays -= 1
+            message = "IGDB is still unavailable."
+            raise IGDBInteractionError(message)
+        genre_ids = {int(genre_id) for genre_id in dead_letter.query.split(",")}
+        return [genre for genre in self.genres if genre.id in genre_ids]
+
+    def iter_all_objects(
+        self: Self,
+        endpoint: IGDBEndpoints,
+        query: str,  # noqa: ARG002
+        where: str = "",
+        after_id: int = 0,
+    ) -> Iterator[list[IGDBGenreResponse]]:
+        """Get the genres after the given ID."""
+        assert endpoint == IGDBEndpoints.GENRES
+        self.calls.append((where, after_id))
+        dead_letter_ids = {int(genre_id) for letter in self.dead_letters for genre_id in letter.query.split(",")}
+        remaining_genres = [genre for genre in self.genres if genre.id > after_id and genre.id not in dead_letter_ids]
+        for index, batch in enumerate(itertools.batched(remaining_genres, 2, strict=False)):
+            if index == self.fail_after_batches:
+                message = "IGDB is unavailable."
+                raise IGDBInteractionError(message)
+            yield list(batch)
+
+
+@pytest.fixture
+def igdb_wrapper() -> Generator[FakeIGDBWrapper]:
+    """Replace the IGDB wrapper of the import command."""
+    wrapper = FakeIGDBWrapper()
+    with patch("my_game_list.games.management.commands.import_data_from_igdb.IGDBWrapper", return_value=wrapper):
+        yield wrapper
+
+
+@pytest.mark.django_db()
+def test_import_records_finished_checkpoint(igdb_wrapper: FakeIGDBWrapper) -> None:
+    """The checkpoint records the window and the progress of the import."""
+    call_command("import_data_from_igdb", "genres", stdout=StringIO())
+
+    assert Genre.objects.count() == len(igdb_wrapper.genres)
+    checkpoint = IGDBImportCheckpoint.objects.get()
+    assert (checkpoint.endpoint, checkpoint.status) == (IGDBEndpoints.GENRES.value, IGDBImportStatus.FINISHED)
+    assert (checkpoint.last_igdb_id, checkpoint.imported_count) == (6, 6)
+    assert checkpoint.updated_after is None
+    assert checkpoint.updated_before is not None
+    assert igdb_wrapper.calls == [(f"updated_at <= {int(checkpoint.updated_before.timestamp())}", 0)]
+    assert igdb_wrapper.closed is True
+
+
+@pytest.mark.django_db()
+def test_interrupted_import_is_resumed(igdb_wrapper: FakeIGDBWrapper) -> None:
+    """The failed import fails the command and is resumed after its last imported ID, with the same window."""
+    igdb_wrapper.fail_after_batches = 1
+
+    with pytest.raises(CommandError, match="Failed to import: genres"):
+        call_command("import_data_from_igdb", "genres", stdout=StringIO())
+
+    checkpoint = IGDBImportCheckpoint.objects.get()
+    assert (checkpoint.status, checkpoint.last_igdb_id, checkpoint.imported_count) == (IGDBImportStatus.FAILED, 2, 2)
+    assert checkpoint.error == "IGDB is unavailable."
+    assert Genre.objects.count() == 2  # noqa: PLR2004
+
+    igdb_wrapper.fail_after_batches = None
+    call_command("import_data_from_igdb", "genres", "--resume", stdout=StringIO())
+
+    checkpoint.refresh_from_db()
+    assert (checkpoint.status, checkpoint.last_igdb_id, checkpoint.imported_count) == (IGDBImportStatus.FINISHED, 6, 6)
+    assert IGDBImportCheckpoint.objects.count() == 1
+    assert Genre.objects.count() == len(igdb_wrapper.genres)
+    assert igdb_wrapper.calls[1] == (igdb_wrapper.calls[0][0], 2)
+
+
+@pytest.mark.django_db()
+def test_new_import_starts_after_last_finished_window(igdb_wrapper: FakeIGDBWrapper) -> None:
+    """The finished import is not resumed, the new import starts where the window of the last finished one ended."""
+    window_end = datetime(2026, 10, 1, tzinfo=UTC)
+    baker.make(
+        IGDBImportCheckpoint,
+        endpoint=IGDBEndpoints.GENRES.value,
+        status=IGDBImportStatus.FINISHED,
+        last_igdb_id=100,
+        updated_before=window_end,
+    )
+    # The objects of an interrupted import are imported in the order of their IDs, not their update times.
+    baker.make(Genre, igdb_id=100, igdb_updated_at=datetime(2026, 10, 10, tzinfo=UTC))
+
+    call_command("import_data_from_igdb", "genres", "--resume", stdout=StringIO())
+
+    where, after_id = igdb_wrapper.calls[0]
+    assert where.startswith(f"updated_at > {int(window_end.timestamp())} & updated_at <= ")
+    assert after_id == 0
+    assert IGDBImportCheckpoint.objects.filter(status=IGDBImportStatus.FINISHED).count() == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_failed_pages_are_replayed(igdb_wrapper: FakeIGDBWrapper) -> None:
+    """The failed pages are replayed at the end, the pages failing again are kept for the resumed import."""
+    igdb_wrapper.dead_letters = [IGDBDeadLetter(IGDBEndpoints.GENRES.value, "3,4", "502 Bad Gateway")]
+    igdb_wrapper.failing_replays = 1
+
+    with pytest.raises(CommandError):
+        call_command("import_data_from_igdb", "genres", stdout=StringIO())
+
+    checkpoint = IGDBImportCheckpoint.objects.get()
+    assert (checkpoint.status, checkpoint.last_igdb_id, checkpoint.imported_count) == (IGDBImportStatus.FAILED, 6, 4)
+    assert checkpoint.dead_letters == [
+        {"endpoint": IGDBEndpoints.GENRES.value, "query": "3,4", "error": "IGDB is still unavailable."},
+    ]
+    assert set(Genre.objects.values_list("igdb_id", flat=True)) == {1, 2, 5, 6}
+
+    call_command("import_data_from_igdb", "genres", "--resume", stdout=StringIO())
+
+    checkpoint.refresh_from_db()
+    assert (checkpoint.status, checkpoint.imported_count, checkpoint.dead_letters) == (IGDBImportStatus.FINISHED, 6, [])
+    assert Genre.objects.count() == len(igdb_wrapper.genres)
@@ -0,0 +1,75 @@
+"""Tests for the pipeline of the IGDB import."""
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from my_game_list.games.management.commands._import_pipeline import PipelineStats, iter_pipelined
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def test_pipeline_keeps_order_of_batches() -> None:
+    """The batches are yielded in their original order, with the statistics of the stages."""
+    batches = [[index] * index for index in range(1, 11)]
+    stats = PipelineStats()
+
+    assert list(iter_pipelined(iter(batches), stats)) == batches
+    assert (stats.batches, stats.objects) == (10, 55)
+    assert "55 objects in 10 batches" in stats.report("genres")
+
+
+def test_pipeline_overlaps_fetching_with_writing() -> None:
+    """The next batch is fetched while the previous one is written, the queue limits how far the fetcher runs ahead."""
+    fetched: list[int] = []
+
+    def fetch_batches() -> Iterator[list[int]]:
+        for index in range(6):
+            fetched.append(index)
+            yield [index]
+
+    stats = PipelineStats()
+    pipeline = iter_pipelined(fetch_batches(), stats, queue_size=2)
+
+    assert next(pipeline) == [0]
+    time.sleep(0.3)
+    # The batch being written, two batches in the queue and one waiting for room in the queue.
+    assert fetched == [0, 1, 2, 3]
+    assert list(pipeline) == [[1], [2], [3], [4], [5]]
+    assert stats.fetcher_blocked_time >= 0.2  # noqa: PLR2004
+    assert stats.write_time >= 0.2  # noqa: PLR2004
+
+
+def test_pipeline_reraises_fetcher_errors() -> None:
+    """The error of the fetcher is raised in the writer after the batches fetched before it."""
+
+    def fetch_batches() -> Iterator[list[int]]:
+        yield [1]
+        message = "IGDB is unavailable."
+        raise ConnectionError(message)
+
+    pipeline = iter_pipelined(fetch_batches(), PipelineStats())
+
+    assert next(pipeline) == [1]
+    with pytest.raises(ConnectionError, match="IGDB is unavailable"):
+        next(pipeline)
+
+
+def test_pipeline_stops_fetcher_when_writer_stops() -> None:
+    """The fetcher blocked on the full queue is stopped when the writer stops consuming the batches."""
+
+    def fetch_batches() -> Iterator[list[int]]:
+        index = 0
+        while True:
+            yield [index]
+            index += 1
+
+    pipeline = iter_pipelined(fetch_batches(), PipelineStats(), queue_size=1)
+    assert next(pipeline) == [0]
+
+    pipeline.close()
+
+    assert not any(thread.name == "igdb-import-fetcher" for thread in threading.enumerate())
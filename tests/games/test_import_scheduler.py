@@ -0,0 +1,90 @@
+"""Tests for the scheduler of the IGDB imports."""
+
+import functools
+import threading
+from graphlib import CycleError, TopologicalSorter
+
+import pytest
+
+from my_game_list.games.management.commands._igdb_wrapper import IGDBEndpoints
+from my_game_list.games.management.commands._import_scheduler import run_in_dependency_order
+from my_game_list.games.management.commands.import_data_from_igdb import Command
+
+
+def test_independent_tasks_run_concurrently() -> None:
+    """The independent tasks run at the same time, the dependent task starts once all its dependencies finished."""
+    barrier = threading.Barrier(2, timeout=5)
+    finished: list[str] = []
+
+    def independent_task(name: str) -> None:
+        barrier.wait()
+        finished.append(name)
+
+    def dependent_task() -> None:
+        assert sorted(finished) == ["genres", "platforms"]
+        finished.append("games")
+
+    errors = run_in_dependency_order(
+        {
+            "games": dependent_task,
+            "genres": lambda: independent_task("genres"),
+            "platforms": lambda: independent_task("platforms"),
+        },
+        {"games": ("genres", "platforms", "companies")},
+        max_workers=2,
+    )
+
+    assert errors == {}
+    assert finished[-1] == "games"
+
+
+def test_failed_dependency_does_not_block_dependent_tasks() -> None:
+    """The dependent task is run after its failed dependency, the error of the dependency is returned."""
+    finished: list[str] = []
+
+    def failing_task() -> None:
+        message = "IGDB is unavailable."
+        raise ConnectionError(message)
+
+    errors = run_in_dependency_order(
+        {"external_games": lambda: finished.append("external_games"), "external_game_sources": failing_task},
+        {"external_games": ("external_game_sources",)},
+        max_workers=2,
+    )
+
+    assert list(errors) == ["external_game_sources"]
+    assert isinstance(errors["external_game_sources"], ConnectionError)
+    assert finished == ["external_games"]
+
+
+def test_single_worker_runs_tasks_in_order_in_current_thread() -> None:
+    """A single worker runs the independent tasks in their given order, after their dependencies."""
+    finished: list[tuple[str, threading.Thread]] = []
+    names = ["games", "genres", "platforms", "companies"]
+
+    def task(name: str) -> None:
+        finished.append((name, threading.current_thread()))
+
+    errors = run_in_dependency_order(
+        {name: functools.partial(task, name) for name in names},
+        {"games": ("genres", "platforms", "companies")},
+    )
+
+    assert errors == {}
+    assert [name for name, _ in finished] == ["genres", "platforms", "companies", "games"]
+    assert {thread for _, thread in finished} == {threading.current_thread()}
+
+
+def test_dependency_cycle_is_rejected() -> None:
+    """The tasks depending on each other cannot be scheduled."""
+    with pytest.raises(CycleError):
+        run_in_dependency_order({"a": lambda: None, "b": lambda: None}, {"a": ("b",), "b": ("a",)})
+
+
+def test_import_dependencies_are_known_imports() -> None:
+    """The dependencies of the imports are the imports of the command, without cycles."""
+    dependencies = Command.IMPORT_DEPENDENCIES
+    known_imports = {*dependencies, *(dependency for names in dependencies.values() for dependency in names)}
+
+    assert known_imports <= {endpoint.value for endpoint in IGDBEndpoints}
+    assert list(TopologicalSorter(dependencies).static_order())[-1] == "games"
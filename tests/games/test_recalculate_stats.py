@@ -0,0 +1,62 @@
+"""Tests for the recalculate_stats management command."""
+
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from model_bakery import baker
+
+from my_game_list.games.models import Game, GameList, GameStats
+
+
+@pytest.mark.parametrize("engine", ["batched", "sql"])
+@pytest.mark.django_db()
+def test_recalculate_stats_rebuilds_aggregates_and_missing_stats(engine: str) -> None:
+    """Both engines fix drifted aggregates, create missing stats and reset games without entries."""
+    scored_game = baker.make(Game)
+    empty_game = baker.make(Game)
+    game_without_stats = baker.make(Game)
+    baker.make(GameList, game=scored_game, score=7)
+    baker.make(GameList, game=scored_game, score=8)
+    baker.make(GameList, game=scored_game, score=None)
+    baker.make(GameList, game=game_without_stats, score=3)
+    GameStats.objects.filter(game=scored_game).update(score_sum=100, average_score=Decimal("1.11"))
+    GameStats.objects.filter(game=empty_game).update(score_sum=10, score_count=1, members_count=4)
+    GameStats.objects.filter(game=game_without_stats).delete()
+
+    output = StringIO()
+    call_command("recalculate_stats", f"--engine={engine}", stdout=output)
+
+    stats = {
+        game_id: values
+        for game_id, *values in GameStats.objects.values_list(
+            "game_id",
+            "score_sum",
+            "score_count",
+            "average_score",
+            "members_count",
+            "rank_position",
+        )
+    }
+    assert stats[scored_game.id] == [15, 2, Decimal("7.50"), 3, 1]
+    assert stats[empty_game.id][:4] == [0, 0, Decimal("0.00"), 0]
+    assert stats[game_without_stats.id][:4] == [3, 1, Decimal("3.00"), 1]
+    assert "Recalculating ranks took" in output.getvalue()
+
+
+@pytest.mark.django_db()
+def test_recalculate_stats_sql_engine_skips_unchanged_stats() -> None:
+    """The SQL engine only writes the statistics that differ from the recomputed values."""
+    game = baker.make(Game)
+    baker.make(Game)
+    baker.make(GameList, game=game, score=6)
+    GameStats.objects.filter(game=game).update(members_count=5)
+
+    output = StringIO()
+    call_command("recalculate_stats", "--engine=sql", stdout=output)
+    assert "Created or updated 1 GameStats." in output.getvalue()
+
+    output = StringIO()
+    call_command("recalculate_stats", "--engine=sql", stdout=output)
+    assert "Created or updated 0 GameStats." in output.getvalue()
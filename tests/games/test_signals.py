@@ -1,10 +1,23 @@
 """Tests for games signals."""
 
+from decimal import Decimal
+from io import StringIO
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
 import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
 from django_prometheus.testutils import assert_metric_diff, save_registry
 from model_bakery import baker
 
-from my_game_list.games.models import GameList, GameListStatus
+from my_game_list.games.models import Game, GameList, GameListStatus, GameStats
+from my_game_list.games.stats import defer_game_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
 
 
 @pytest.mark.django_db()
@@ -36,3 +49,138 @@ def test_deleting_game_list_entry_does_not_increment_game_lists_entries_created_
     registry = save_registry()
     game_list_fixture.delete()
     assert_metric_diff(registry, 0, "game_lists_entries_created_total")
+
+
+def _assert_game_stats(game: Game, score_sum: int, score_count: int, average_score: str, members_count: int) -> None:
+    """Assert the stored statistics of the game."""
+    stats = GameStats.objects.get(game=game)
+    assert stats.score_sum == score_sum
+    assert stats.score_count == score_count
+    assert stats.average_score == Decimal(average_score)
+    assert stats.members_count == members_count
+
+
+@pytest.mark.django_db()
+def test_creating_game_list_entries_updates_game_stats(game_list_fixture: GameList) -> None:
+    """Creating GameList entries adds their scores and members to the game stats."""
+    baker.make(GameList, game=game_list_fixture.game, score=8, status=GameListStatus.COMPLETED)
+    baker.make(GameList, game=game_list_fixture.game, score=None, status=GameListStatus.PLAYING)
+
+    _assert_game_stats(game_list_fixture.game, score_sum=13, score_count=2, average_score="6.50", members_count=3)
+
+
+@pytest.mark.django_db()
+def test_updating_game_list_entry_score_updates_game_stats(game_list_fixture: GameList) -> None:
+    """Changing and removing the score of a GameList entry applies the difference to the game stats."""
+    entry = GameList.objects.get(pk=game_list_fixture.pk)
+    entry.score = 9
+    entry.save()
+    _assert_game_stats(game_list_fixture.game, score_sum=9, score_count=1, average_score="9.00", members_count=1)
+
+    entry.score = None
+    entry.save()
+    _assert_game_stats(game_list_fixture.game, score_sum=0, score_count=0, average_score="0.00", members_count=1)
+
+
+@pytest.mark.django_db()
+def test_moving_game_list_entry_to_other_game_updates_both_game_stats(game_list_fixture: GameList) -> None:
+    """Changing the game of a GameList entry moves its score and membership between the games."""
+    other_game = baker.make(Game)
+    entry = GameList.objects.get(pk=game_list_fixture.pk)
+    entry.game = other_game
+    entry.save()
+
+    _assert_game_stats(game_list_fixture.game, score_sum=0, score_count=0, average_score="0.00", members_count=0)
+    _assert_game_stats(other_game, score_sum=5, score_count=1, average_score="5.00", members_count=1)
+
+
+@pytest.mark.django_db()
+def test_deleting_game_list_entry_updates_game_stats(game_list_fixture: GameList) -> None:
+    """Deleting a GameList entry removes its score and membership from the game stats."""
+    baker.make(GameList, game=game_list_fixture.game, score=6, status=GameListStatus.COMPLETED)
+    GameList.objects.get(pk=game_list_fixture.pk).delete()
+
+    _assert_game_stats(game_list_fixture.game, score_sum=6, score_count=1, average_score="6.00", members_count=1)
+
+
+@pytest.mark.django_db()
+def test_saving_partially_loaded_game_list_entry_recalculates_game_stats(game_list_fixture: GameList) -> None:
+    """Saving an entry loaded without its score falls back to a full recompute of the game stats."""
+    GameStats.objects.filter(game=game_list_fixture.game).update(score_sum=100, score_count=10, members_count=10)
+    entry = GameList.objects.only("id", "status").get(pk=game_list_fixture.pk)
+    entry.status = GameListStatus.PLAYING
+    entry.save()
+
+    _assert_game_stats(game_list_fixture.game, score_sum=5, score_count=1, average_score="5.00", members_count=1)
+
+
+@pytest.mark.django_db()
+def test_loading_deferred_game_keeps_unsaved_score_out_of_snapshot(game_list_fixture: GameList) -> None:
+    """Loading the deferred game of an entry with a changed score does not take the unsaved score as persisted."""
+    entry = GameList.objects.only("id", "score").get(pk=game_list_fixture.pk)
+    entry.score = 9
+    assert entry.game_id == game_list_fixture.game_id
+    entry.save()
+
+    _assert_game_stats(game_list_fixture.game, score_sum=9, score_count=1, average_score="9.00", members_count=1)
+
+
+@pytest.mark.django_db()
+def test_recalculate_stats_check_drift_passes_for_incremental_stats(game_list_fixture: GameList) -> None:
+    """The drift check finds no difference between the incremental stats and a full recompute."""
+    baker.make(GameList, game=game_list_fixture.game, score=4, status=GameListStatus.COMPLETED)
+    entry = GameList.objects.get(pk=game_list_fixture.pk)
+    entry.score = 7
+    entry.save()
+
+    output = StringIO()
+    call_command("recalculate_stats", "--check-drift", stdout=output)
+
+    assert "No drift found" in output.getvalue()
+
+
+@pytest.mark.django_db()
+def test_recalculate_stats_check_drift_reports_drifted_stats(game_list_fixture: GameList) -> None:
+    """The drift check fails when the stored stats differ from a full recompute."""
+    GameStats.objects.filter(game=game_list_fixture.game).update(score_sum=42)
+
+    with pytest.raises(CommandError, match="Found 1 drifted GameStats"):
+        call_command("recalculate_stats", "--check-drift", stdout=StringIO())
+
+
+@pytest.mark.django_db()
+def test_deferred_game_stats_are_recalculated_once_on_commit(
+    game_list_fixture: GameList,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """Inside defer_game_stats the stats are only updated by a single recalculation on commit."""
+    game = game_list_fixture.game
+    with django_capture_on_commit_callbacks() as callbacks, defer_game_stats():
+        baker.make(GameList, game=game, score=9, status=GameListStatus.COMPLETED, _quantity=3)
+        with defer_game_stats():
+            GameList.objects.get(pk=game_list_fixture.pk).delete()
+
+        _assert_game_stats(game, score_sum=5, score_count=1, average_score="5.00", members_count=1)
+
+    assert len(callbacks) == 1
+    callbacks[0]()
+    _assert_game_stats(game, score_sum=27, score_count=3, average_score="9.00", members_count=3)
+
+
+@pytest.mark.django_db()
+@override_settings(GAME_STATS_FLUSH_ASYNC=True)
+def test_deferred_game_stats_are_flushed_in_celery_task(
+    game_list_fixture: GameList,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """With GAME_STATS_FLUSH_ASYNC the deferred games are recalculated in one Celery task."""
+    other_game = baker.make(Game)
+    with (
+        patch("my_game_list.games.tasks.recalculate_games_stats.delay") as delay_mock,
+        django_capture_on_commit_callbacks(execute=True),
+        defer_game_stats(),
+    ):
+        baker.make(GameList, game=game_list_fixture.game, score=9)
+        baker.make(GameList, game=other_game, score=3)
+
+    delay_mock.assert_called_once_with(sorted([game_list_fixture.game.id, other_game.id]))
@@ -250,6 +250,7 @@ def test_unauthorized_access_detail(viewname: str, api_client: APIClient) -> Non
             "game_list_fixture",
             {
                 "count": 1,
+                "count_is_exact": True,
                 "next": None,
                 "previous": None,
                 "results": [
@@ -300,6 +301,7 @@ def test_unauthorized_access_detail(viewname: str, api_client: APIClient) -> Non
             "game_fixture",
             {
                 "count": 1,
+                "count_is_exact": True,
                 "next": None,
                 "previous": None,
                 "results": [
@@ -0,0 +1,93 @@
+"""Tests for the cached responses of the dictionary endpoints."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.cache import invalidate_dictionaries_caches
+from my_game_list.games.models import GameMedia, Genre
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db()
+def test_list_response_is_cached(api_client: APIClient, django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """The second request of the same list is served from the cache with the same ETag."""
+    baker.make(Genre, name_en="Action", name_pl="Akcja")
+    url = reverse("games:genres-list")
+
+    first_response = api_client.get(url)
+    assert first_response.status_code == status.HTTP_200_OK
+    assert first_response.json()["count"] == 1
+
+    with django_assert_num_queries(0):
+        second_response = api_client.get(url)
+
+    assert second_response.status_code == status.HTTP_200_OK
+    assert second_response.content == first_response.content
+    assert second_response["ETag"] == first_response["ETag"]
+    assert second_response["Content-Type"] == "application/json"
+
+
+@pytest.mark.django_db()
+def test_matching_if_none_match_returns_not_modified(api_client: APIClient) -> None:
+    """A request with the current ETag gets an empty 304 response."""
+    genre = baker.make(Genre, name_en="Action", name_pl="Akcja")
+    url = reverse("games:genres-detail", kwargs={"pk": genre.pk})
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response["ETag"] == etag
+    assert api_client.get(url, headers={"If-None-Match": '"outdated"'}).status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db()
+def test_responses_are_cached_per_query_and_language(api_client: APIClient) -> None:
+    """The responses differ for other query parameters and languages."""
+    baker.make(Genre, name_en="Action", name_pl="Akcja")
+    baker.make(Genre, name_en="Shooter", name_pl="Strzelanka")
+    url = reverse("games:genres-list")
+
+    assert api_client.get(url).json()["count"] == 2  # noqa: PLR2004
+    assert api_client.get(url, {"name": "Shoot"}).json()["count"] == 1
+
+    english_names = [genre["name"] for genre in api_client.get(url).json()["results"]]
+    polish_response = api_client.get(url, headers={"Accept-Language": "pl"})
+    assert [genre["name"] for genre in polish_response.json()["results"]] == ["Akcja", "Strzelanka"]
+    assert english_names == ["Action", "Shooter"]
+    assert "Accept-Language" in polish_response["Vary"]
+
+
+@pytest.mark.django_db()
+def test_write_invalidates_cached_responses(admin_authenticated_api_client: APIClient) -> None:
+    """Writing to the dictionary through the API changes the cached responses and their ETag."""
+    url = reverse("games:game-medias-list")
+    first_response = admin_authenticated_api_client.get(url)
+
+    response = admin_authenticated_api_client.post(url, {"name": "Steam Deck"})
+    assert response.status_code == status.HTTP_201_CREATED
+
+    second_response = admin_authenticated_api_client.get(url)
+    assert second_response.json()["count"] == first_response.json()["count"] + 1
+    assert second_response["ETag"] != first_response["ETag"]
+
+
+@pytest.mark.django_db()
+def test_import_invalidates_cached_responses(api_client: APIClient) -> None:
+    """Writes bypassing the signals, like the IGDB import, are visible after invalidating the dictionaries."""
+    url = reverse("games:game-medias-list")
+    count = api_client.get(url).json()["count"]
+
+    GameMedia.objects.bulk_create([GameMedia(name="Cartridge")])
+    assert api_client.get(url).json()["count"] == count
+
+    invalidate_dictionaries_caches()
+    assert api_client.get(url).json()["count"] == count + 1
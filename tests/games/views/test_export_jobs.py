@@ -0,0 +1,237 @@
+"""Tests for the background export jobs."""
+
+import gzip
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.collections.models import Collection, CollectionItem
+from my_game_list.games.models import ExportJob, ExportJobKind, ExportJobStatus, GameList, GameReview
+from my_game_list.games.serializers import GameListSerializer
+from my_game_list.games.tasks import cleanup_old_export_jobs, run_export_job
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from contextlib import AbstractContextManager
+
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+    from my_game_list.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _media_root(tmp_path: Path) -> Generator[None]:
+    """Write the export artifacts to a temporary directory."""
+    with override_settings(MEDIA_ROOT=tmp_path):
+        yield
+
+
+def read_artifact(job: ExportJob) -> list[dict[str, Any]]:
+    """Read the entries from the gzip compressed JSON Lines artifact of the job."""
+    with job.file.open("rb") as artifact:
+        return [json.loads(line) for line in gzip.decompress(artifact.read()).splitlines()]
+
+
+def read_download(response: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    """Read the entries from the downloaded artifact."""
+    content = gzip.decompress(b"".join(response.streaming_content))
+    return [json.loads(line) for line in content.splitlines()]
+
+
+@pytest.mark.django_db()
+def test_export_job_is_run_and_downloaded(
+    authenticated_api_client: APIClient,
+    user_fixture: User,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """The job is run in a task once committed, then its status is polled and the artifact is downloaded."""
+    entries = baker.make(GameList, user=user_fixture, _quantity=3)
+    baker.make(GameList)
+
+    with (
+        patch("my_game_list.games.tasks.run_export_job.delay", side_effect=run_export_job) as delay_mock,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        response = authenticated_api_client.post(reverse("games:export-jobs-list"), {"kind": ExportJobKind.GAME_LIST})
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["status"] == ExportJobStatus.PENDING
+    assert response.json()["download_url"] is None
+    job_id = response.json()["id"]
+    delay_mock.assert_called_once_with(job_id)
+
+    response = authenticated_api_client.get(reverse("games:export-jobs-detail", kwargs={"pk": job_id}))
+    assert response.json()["status"] == ExportJobStatus.FINISHED
+    assert response.json()["entries_count"] == len(entries)
+
+    response = authenticated_api_client.get(response.json()["download_url"])
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/gzip"
+    assert response["Content-Disposition"] == 'attachment; filename="game_list.jsonl.gz"'
+    assert read_download(response) == json.loads(json.dumps(GameListSerializer(entries, many=True).data))
+
+
+@pytest.mark.django_db()
+def test_export_job_is_not_duplicated(
+    authenticated_api_client: APIClient,
+    user_fixture: User,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """Starting an export while the same data is being exported returns the active job."""
+    job = baker.make(ExportJob, user=user_fixture, kind=ExportJobKind.REVIEWS, status=ExportJobStatus.RUNNING)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = authenticated_api_client.post(reverse("games:export-jobs-list"), {"kind": ExportJobKind.REVIEWS})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == job.id
+    assert callbacks == []
+
+
+@pytest.mark.django_db()
+def test_stale_export_job_is_not_returned(
+    authenticated_api_client: APIClient,
+    user_fixture: User,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """The running job older than the timeout is not returned, a new job is started instead."""
+    job = baker.make(ExportJob, user=user_fixture, kind=ExportJobKind.REVIEWS, status=ExportJobStatus.RUNNING)
+    ExportJob.objects.filter(pk=job.pk).update(created_at=timezone.now() - timedelta(hours=2))
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = authenticated_api_client.post(reverse("games:export-jobs-list"), {"kind": ExportJobKind.REVIEWS})
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["id"] != job.pk
+    assert len(callbacks) == 1
+
+
+@pytest.mark.django_db()
+def test_export_job_is_only_downloaded_by_its_user_when_finished(
+    authenticated_api_client: APIClient,
+    user_fixture: User,
+) -> None:
+    """The unfinished job cannot be downloaded and the jobs of other users are not visible."""
+    job = baker.make(ExportJob, user=user_fixture, kind=ExportJobKind.GAME_LIST)
+    other_job = baker.make(ExportJob, kind=ExportJobKind.GAME_LIST)
+
+    response = authenticated_api_client.get(reverse("games:export-jobs-download", kwargs={"pk": job.pk}))
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    response = authenticated_api_client.get(reverse("games:export-jobs-download", kwargs={"pk": other_job.pk}))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = authenticated_api_client.get(reverse("games:export-jobs-list"))
+    assert [listed_job["id"] for listed_job in response.json()["results"]] == [job.pk]
+
+
+@pytest.mark.django_db()
+def test_export_job_writes_reviews_with_scores(
+    user_fixture: User,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The reviews are exported with the scores from the game list, without a query per review."""
+    reviews = baker.make(GameReview, user=user_fixture, _quantity=3)
+    baker.make(GameList, user=user_fixture, game=reviews[0].game, score=8)
+    job = baker.make(ExportJob, user=user_fixture, kind=ExportJobKind.REVIEWS, language="en")
+
+    # Claiming, loading the job, the reviews and saving the job.
+    with django_assert_num_queries(4):
+        run_export_job(job.pk)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FINISHED
+    assert job.entries_count == len(reviews)
+    assert [(review["id"], review["score"]) for review in read_artifact(job)] == [
+        (reviews[0].id, 8),
+        (reviews[1].id, None),
+        (reviews[2].id, None),
+    ]
+
+
+@pytest.mark.django_db()
+def test_export_job_writes_collections_with_items(user_fixture: User) -> None:
+    """The collections of the user are exported with their ordered items."""
+    collection = baker.make(Collection, user=user_fixture)
+    items = [
+        baker.make(CollectionItem, collection=collection, order=2),
+        baker.make(CollectionItem, collection=collection, order=1),
+    ]
+    baker.make(Collection)
+    job = baker.make(ExportJob, user=user_fixture, kind=ExportJobKind.COLLECTIONS, language="en")
+
+    run_export_job(job.pk)
+
+    job.refresh_from_db()
+    exported_collections = read_artifact(job)
+    assert [exported_collection["id"] for exported_collection in exported_collections] == [collection.id]
+    assert exported_collections[0]["items_count"] == len(items)
+    assert [item["id"] for item in exported_collections[0]["items"]] == [items[1].id, items[0].id]
+
+
+@pytest.mark.django_db()
+def test_export_job_failure_is_recorded(user_fixture: User) -> None:
+    """The failed job is marked as failed and is not run again."""
+    job = baker.make(ExportJob, user=user_fixture, kind=ExportJobKind.GAME_LIST, language="en")
+
+    with patch("my_game_list.games.tasks.write_export_job_artifact", side_effect=OSError):
+        run_export_job(job.pk)
+        run_export_job(job.pk)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FAILED
+    assert job.error
+    assert job.finished_at is not None
+    assert not job.file
+
+
+@pytest.mark.django_db()
+def test_cleanup_deletes_old_export_jobs_with_artifacts(user_fixture: User) -> None:
+    """The jobs older than the retention period are deleted with their artifacts."""
+    old_job, new_job = baker.make(
+        ExportJob,
+        user=user_fixture,
+        kind=ExportJobKind.GAME_LIST,
+        language="en",
+        _quantity=2,
+    )
+    run_export_job(old_job.pk)
+    old_job.refresh_from_db()
+    artifact_path = Path(old_job.file.path)
+    ExportJob.objects.filter(pk=old_job.pk).update(created_at=timezone.now() - timedelta(days=30))
+
+    cleanup_old_export_jobs()
+
+    assert list(ExportJob.objects.values_list("id", flat=True)) == [new_job.pk]
+    assert artifact_path.exists() is False
+
+
+@pytest.mark.django_db()
+def test_cleanup_marks_stale_export_jobs_as_failed(user_fixture: User) -> None:
+    """The pending and running jobs older than the timeout are marked as failed, the recent ones are kept."""
+    stale_job, running_job = baker.make(
+        ExportJob,
+        user=user_fixture,
+        kind=ExportJobKind.GAME_LIST,
+        status=ExportJobStatus.RUNNING,
+        _quantity=2,
+    )
+    ExportJob.objects.filter(pk=stale_job.pk).update(created_at=timezone.now() - timedelta(hours=2))
+
+    cleanup_old_export_jobs()
+
+    stale_job.refresh_from_db()
+    assert stale_job.status == ExportJobStatus.FAILED
+    assert stale_job.error
+    assert stale_job.finished_at is not None
+    running_job.refresh_from_db()
+    assert running_job.status == ExportJobStatus.RUNNING
@@ -0,0 +1,84 @@
+"""Tests for the game autocomplete endpoint."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.models import Game
+
+if TYPE_CHECKING:
+    from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db()
+def test_autocomplete_returns_prefix_matches_first(api_client: APIClient) -> None:
+    """Titles starting with the text come first in index order, then titles with a word starting with it."""
+    word_match = baker.make(Game, title_en="Black Mesa", title_pl="Black Mesa")
+    sequel = baker.make(Game, title_en="Mesa 2", title_pl="Mesa 2")
+    original = baker.make(Game, title_en="Mesa", title_pl="Mesa")
+    baker.make(Game, title_en="Half-Life", title_pl="Half-Life")
+
+    response = api_client.get(reverse("games:games-autocomplete"), {"title": "Mesa"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [game["id"] for game in response.json()] == [original.id, sequel.id, word_match.id]
+    assert set(response.json()[0]) == {"id", "title", "slug", "cover_image_id"}
+
+
+@pytest.mark.django_db()
+def test_autocomplete_ignores_case_and_diacritics(api_client: APIClient) -> None:
+    """The typed text is normalized like the search titles."""
+    game = baker.make(Game, title_en="The Witcher", title_pl="Wiedźmin")
+
+    response = api_client.get(reverse("games:games-autocomplete"), {"title": "WIEDŹ"})
+
+    assert [result["id"] for result in response.json()] == [game.id]
+
+
+@pytest.mark.django_db()
+def test_autocomplete_respects_limit(api_client: APIClient) -> None:
+    """No more suggestions than the limit are returned."""
+    baker.make(Game, title_en="Portal", title_pl="Portal")
+    baker.make(Game, title_en="Portal 2", title_pl="Portal 2")
+    baker.make(Game, title_en="Bridge Portal", title_pl="Bridge Portal")
+
+    response = api_client.get(reverse("games:games-autocomplete"), {"title": "port", "limit": "2"})
+
+    assert [result["title"] for result in response.json()] == ["Portal", "Portal 2"]
+
+
+@pytest.mark.django_db()
+def test_autocomplete_does_not_count_or_join_stats(api_client: APIClient) -> None:
+    """The suggestions are loaded without a count query and without the stats join."""
+    baker.make(Game, title_en="Portal", title_pl="Portal")
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(reverse("games:games-autocomplete"), {"title": "port"})
+
+    assert response.status_code == status.HTTP_200_OK
+    game_queries = [query["sql"] for query in context.captured_queries if "games_game" in query["sql"]]
+    assert game_queries
+    assert not any("COUNT(" in sql or "games_gamestats" in sql for sql in game_queries)
+
+
+@pytest.mark.django_db()
+def test_autocomplete_without_title_returns_400(api_client: APIClient) -> None:
+    """The title is required."""
+    response = api_client.get(reverse("games:games-autocomplete"))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db()
+def test_autocomplete_with_only_special_characters_returns_empty_list(api_client: APIClient) -> None:
+    """A text without any searchable characters has no suggestions."""
+    baker.make(Game, title_en="Portal", title_pl="Portal")
+
+    response = api_client.get(reverse("games:games-autocomplete"), {"title": "!!"})
+
+    assert response.json() == []
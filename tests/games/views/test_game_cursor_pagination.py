@@ -0,0 +1,125 @@
+"""Tests for the cursor pagination of the games endpoint."""
+
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.cards import refresh_game_cards
+from my_game_list.games.models import Game, GameStats
+from my_game_list.my_game_list.pagination import KeysetPagination
+
+if TYPE_CHECKING:
+    from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def small_page_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use pages of two games, so a few games span several pages."""
+    monkeypatch.setattr(KeysetPagination, "page_size", 2)
+
+
+def _collect_pages(api_client: APIClient, params: dict[str, str]) -> list[int]:
+    """Follow the next links and collect the IDs of all the returned games."""
+    response = api_client.get(reverse("games:games-list"), {**params, "pagination": "cursor"})
+    game_ids: list[int] = []
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        data: dict[str, Any] = response.json()
+        assert "count" not in data
+        game_ids.extend(game["id"] for game in data["results"])
+        if data["next"] is None:
+            return game_ids
+        response = api_client.get(data["next"])
+
+
+@pytest.mark.usefixtures("small_page_size")
+@pytest.mark.django_db()
+def test_cursor_pagination_follows_default_ordering(api_client: APIClient) -> None:
+    """Without an ordering all the games are returned once, ordered by ID."""
+    games = baker.make(Game, _quantity=5)
+
+    assert _collect_pages(api_client, {}) == sorted(game.id for game in games)
+
+
+@pytest.mark.usefixtures("small_page_size")
+@pytest.mark.parametrize("ordering", ["rank_position", "-rank_position", "release_date", "-release_date"])
+@pytest.mark.django_db()
+def test_cursor_pagination_handles_ties_and_nulls(api_client: APIClient, ordering: str) -> None:
+    """Ties are broken by ID and nulls are placed like in the page number pagination."""
+    release_dates = ["2020-01-01", "2020-01-01", None, "2021-05-05", None, "2019-03-03", "2020-01-01"]
+    rank_positions = [1, 1, None, 2, None, 3, 1]
+    for release_date, rank_position in zip(release_dates, rank_positions, strict=True):
+        game = baker.make(Game, release_date=release_date)
+        GameStats.objects.filter(game=game).update(rank_position=rank_position)
+    refresh_game_cards()
+
+    page_number_response = api_client.get(reverse("games:games-list"), {"ordering": ordering})
+    expected_ids = [game["id"] for game in page_number_response.json()["results"]]
+
+    game_ids = _collect_pages(api_client, {"ordering": ordering})
+
+    assert sorted(game_ids) == sorted(expected_ids)
+    assert len(set(game_ids)) == len(release_dates)
+    key = ordering.removeprefix("-")
+    values: dict[int, Any] = {
+        game.id: (getattr(game.stats, key) if key == "rank_position" else game.release_date)
+        for game in Game.objects.select_related("stats")
+    }
+    non_null_ids = [game_id for game_id in game_ids if values[game_id] is not None]
+    assert [values[game_id] for game_id in non_null_ids] == sorted(
+        (values[game_id] for game_id in non_null_ids),
+        reverse=ordering.startswith("-"),
+    )
+    null_positions = [index for index, game_id in enumerate(game_ids) if values[game_id] is None]
+    expected_null_positions = [0, 1] if ordering.startswith("-") else [5, 6]
+    assert null_positions == expected_null_positions
+
+
+@pytest.mark.usefixtures("small_page_size")
+@pytest.mark.django_db()
+def test_cursor_pagination_keeps_title_filter_ranking(api_client: APIClient) -> None:
+    """The title search is paginated in the order of its rank."""
+    baker.make(Game, title_en="Portal", title_pl="Portal")
+    baker.make(Game, title_en="Portal 2", title_pl="Portal 2")
+    baker.make(Game, title_en="Portal Stories", title_pl="Portal Stories")
+    baker.make(Game, title_en="Half-Life", title_pl="Half-Life")
+
+    page_number_response = api_client.get(reverse("games:games-list"), {"title": "portal"})
+    expected_ids = [game["id"] for game in page_number_response.json()["results"]]
+
+    assert _collect_pages(api_client, {"title": "portal"}) == expected_ids
+
+
+@pytest.mark.django_db()
+def test_cursor_pagination_rejects_invalid_cursor(api_client: APIClient) -> None:
+    """A malformed cursor returns 404."""
+    response = api_client.get(reverse("games:games-list"), {"cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.usefixtures("small_page_size")
+@pytest.mark.django_db()
+def test_cursor_pagination_rejects_cursor_of_other_ordering(api_client: APIClient) -> None:
+    """A cursor created for one ordering cannot be used with another one."""
+    baker.make(Game, _quantity=3)
+    response = api_client.get(reverse("games:games-list"), {"pagination": "cursor", "ordering": "release_date"})
+    cursor = parse_qs(urlparse(response.json()["next"]).query)["cursor"][0]
+
+    response = api_client.get(reverse("games:games-list"), {"cursor": cursor, "ordering": "popularity"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_page_number_pagination_stays_the_default(api_client: APIClient) -> None:
+    """Without the cursor parameters the games are paginated with page numbers."""
+    baker.make(Game, _quantity=2)
+
+    response = api_client.get(reverse("games:games-list"))
+
+    assert response.json()["count"] == 2  # noqa: PLR2004
@@ -0,0 +1,101 @@
+"""Tests for the game detail endpoint."""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.utils import translation
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.models import (
+    Company,
+    ExternalGame,
+    Game,
+    GameEngine,
+    GameMode,
+    GameStatus,
+    GameType,
+    Genre,
+    Platform,
+    PlayerPerspective,
+)
+from my_game_list.games.querysets import GAME_DETAIL_RELATIONS
+from my_game_list.games.serializers import GameSerializer
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+
+def make_game_with_relations() -> Game:
+    """Make a game with every relation shown in the details."""
+    related_games: dict[str, Any] = {
+        name: baker.make(Game, _quantity=2)
+        for name, field_names in GAME_DETAIL_RELATIONS.items()
+        if field_names is not None
+    }
+    game: Game = baker.make(
+        Game,
+        title_en="The Witcher",
+        title_pl="Wiedźmin",
+        publisher=baker.make(Company),
+        developer=baker.make(Company),
+        game_status=baker.make(GameStatus, status_en="Released", status_pl="Wydana"),
+        game_type=baker.make(GameType),
+        parent_game=baker.make(Game),
+        genres=[
+            baker.make(Genre, name_en="Shooter", name_pl="Strzelanka"),
+            baker.make(Genre, name_en="Action", name_pl="Akcja"),
+        ],
+        platforms=baker.make(Platform, _quantity=2),
+        game_engines=baker.make(GameEngine, _quantity=2),
+        game_modes=baker.make(GameMode, _quantity=2),
+        player_perspectives=baker.make(PlayerPerspective, _quantity=2),
+        external_games=baker.make(ExternalGame, _quantity=2),
+        **related_games,
+    )
+    return game
+
+
+@pytest.mark.django_db()
+def test_game_detail_is_loaded_in_a_single_query(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The game with all the related objects is loaded with one query."""
+    game = make_game_with_relations()
+
+    with django_assert_num_queries(1):
+        response = api_client.get(reverse("games:games-detail", kwargs={"pk": game.pk}))
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [genre["name"] for genre in data["genres"]] == ["Shooter", "Action"]
+    assert len(data["external_games"]) == 2  # noqa: PLR2004
+    assert all(external_game["external_game_source"] for external_game in data["external_games"])
+
+
+@pytest.mark.django_db()
+def test_game_details_match_prefetched_game() -> None:
+    """The details loaded from the aggregated JSON are the same as the details of the prefetched game."""
+    game = make_game_with_relations()
+    empty_game = baker.make(Game)
+
+    for language in ("en", "pl"):
+        with translation.override(language):
+            for game_id in (game.pk, empty_game.pk):
+                prefetched_game = (
+                    Game.objects.select_related(
+                        "stats",
+                        "publisher",
+                        "developer",
+                        "game_status",
+                        "game_type",
+                        "parent_game",
+                    )
+                    .prefetch_related(*GAME_DETAIL_RELATIONS, "external_games__external_game_source")
+                    .get(pk=game_id)
+                )
+                loaded_game = Game.objects.with_details().get(pk=game_id)
+                assert GameSerializer(loaded_game).data == GameSerializer(prefetched_game).data
@@ -0,0 +1,98 @@
+"""Tests for the cached responses of the game detail endpoint."""
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.cache import invalidate_game_details
+from my_game_list.games.models import Game, GameList, Genre
+from my_game_list.games.tasks import recalculate_ranks
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db()
+def test_game_detail_is_cached(api_client: APIClient, django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """The second request gets the same response without querying the database."""
+    game = baker.make(Game, genres=baker.make(Genre, _quantity=2))
+    url = reverse("games:games-detail", kwargs={"pk": game.pk})
+    first_response = api_client.get(url)
+
+    with django_assert_num_queries(0):
+        second_response = api_client.get(url)
+
+    assert second_response.status_code == status.HTTP_200_OK
+    assert second_response.content == first_response.content
+    assert second_response["ETag"] == first_response["ETag"]
+    assert api_client.get(url, headers={"If-None-Match": first_response["ETag"]}).status_code == (
+        status.HTTP_304_NOT_MODIFIED
+    )
+    assert api_client.get(reverse("games:games-detail", kwargs={"pk": 0})).status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_game_detail_cache_follows_game_and_stats_changes(api_client: APIClient) -> None:
+    """Saving the game, changing its game list entries and recalculating the ranks change the response."""
+    game = baker.make(Game, title_en="The Witcher", title_pl="Wiedźmin")
+    url = reverse("games:games-detail", kwargs={"pk": game.pk})
+    assert api_client.get(url).json()["title"] == "The Witcher"
+    assert api_client.get(url, headers={"Accept-Language": "pl"}).json()["title"] == "Wiedźmin"
+
+    game.title_en = "The Witcher: Enhanced Edition"
+    game.save()
+    assert api_client.get(url).json()["title"] == "The Witcher: Enhanced Edition"
+
+    baker.make(GameList, game=game, score=8)
+    assert api_client.get(url).json()["members_count"] == 1
+
+    recalculate_ranks()
+    assert api_client.get(url).json()["rank_position"] == 1
+
+
+@pytest.mark.django_db()
+def test_game_detail_cache_is_invalidated_after_import(api_client: APIClient) -> None:
+    """Writes bypassing the signals, like the IGDB import, are visible after invalidating the game details."""
+    game = baker.make(Game, title_en="The Witcher")
+    url = reverse("games:games-detail", kwargs={"pk": game.pk})
+    api_client.get(url)
+
+    Game.objects.filter(pk=game.pk).update(title_en="Wiedźmin")
+    assert api_client.get(url).json()["title"] == "The Witcher"
+
+    invalidate_game_details()
+    assert api_client.get(url).json()["title"] == "Wiedźmin"
+
+
+@pytest.mark.django_db()
+def test_warm_up_caches_the_most_popular_games(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The command caches the same responses as the endpoint for the most popular games only."""
+    popular_game, other_game = baker.make(Game, _quantity=2)
+    baker.make(GameList, game=popular_game)
+    recalculate_ranks()
+
+    output = StringIO()
+    call_command("warm_game_details_cache", "--top=1", stdout=output)
+    assert "details of 1 games" in output.getvalue()
+
+    for language in ("en", "pl"):
+        url = reverse("games:games-detail", kwargs={"pk": popular_game.pk})
+        with django_assert_num_queries(0):
+            warm_response = api_client.get(url, headers={"Accept-Language": language})
+
+        cache.clear()
+        assert api_client.get(url, headers={"Accept-Language": language}).content == warm_response.content
+        call_command("warm_game_details_cache", "--top=1", stdout=StringIO())
+
+    with django_assert_num_queries(1):
+        api_client.get(reverse("games:games-detail", kwargs={"pk": other_game.pk}))
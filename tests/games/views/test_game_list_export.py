@@ -0,0 +1,105 @@
+"""Tests for the streaming export of the game list."""
+
+import csv
+import io
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.exports import get_game_list_export_queryset, iter_game_list_export
+from my_game_list.games.models import GameList, GameListExportFormat, GameMedia
+from my_game_list.games.serializers import GameListSerializer
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+    from my_game_list.users.models import User
+
+
+def get_content(response: Any) -> str:  # noqa: ANN401
+    """Consume the streamed content of the response."""
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db()
+def test_export_streams_json_array(
+    authenticated_api_client: APIClient,
+    user_fixture: User,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The default export is a JSON array of the entries of the user, with a constant number of queries."""
+    media = baker.make(GameMedia, _quantity=2)
+    entries = baker.make(GameList, user=user_fixture, owned_on=media, _quantity=30)
+    baker.make(GameList)
+
+    response = authenticated_api_client.get(reverse("games:game-lists-export"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    assert response["Content-Disposition"] == 'attachment; filename="game-list.json"'
+    # The entries with their games and the owned on media.
+    with django_assert_num_queries(2):
+        content = get_content(response)
+    assert json.loads(content) == json.loads(json.dumps(GameListSerializer(entries, many=True).data))
+
+
+@pytest.mark.django_db()
+def test_export_streams_json_lines(authenticated_api_client: APIClient, user_fixture: User) -> None:
+    """The JSON Lines export has one entry per line."""
+    entries = baker.make(GameList, user=user_fixture, _quantity=3)
+
+    response = authenticated_api_client.get(reverse("games:game-lists-export"), {"export_format": "ndjson"})
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = get_content(response).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [entry.id for entry in entries]
+
+
+@pytest.mark.django_db()
+def test_export_streams_csv(authenticated_api_client: APIClient, user_fixture: User) -> None:
+    """The CSV export has a header and the owned on media joined into one column."""
+    entry = baker.make(
+        GameList,
+        user=user_fixture,
+        score=8,
+        owned_on=[baker.make(GameMedia, name="Steam"), baker.make(GameMedia, name="GOG")],
+    )
+
+    response = authenticated_api_client.get(reverse("games:game-lists-export"), {"export_format": "csv"})
+
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(get_content(response))))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(entry.id)
+    assert rows[0]["score"] == "8"
+    assert rows[0]["owned_on"] == "Steam, GOG"
+    assert list(rows[0]) == list(GameListSerializer.Meta.fields)
+
+
+@pytest.mark.django_db()
+def test_export_rejects_unknown_format(authenticated_api_client: APIClient) -> None:
+    """An unknown export format is rejected."""
+    response = authenticated_api_client.get(reverse("games:game-lists-export"), {"export_format": "xml"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db()
+def test_export_is_written_in_chunks(user_fixture: User, django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """Every chunk of entries is fetched and written separately."""
+    baker.make(GameList, user=user_fixture, _quantity=5)
+    queryset = get_game_list_export_queryset(user_fixture.pk)
+
+    # The entries are read with one cursor, the owned on media are prefetched for each of the two chunks.
+    with django_assert_num_queries(3):
+        chunks = list(iter_game_list_export(queryset, GameListExportFormat.JSON, "en", chunk_size=3))
+
+    # The opening bracket with two entries, three entries and the closing bracket.
+    assert len(chunks) == 3  # noqa: PLR2004
+    assert len(json.loads("".join(chunks))) == 5  # noqa: PLR2004
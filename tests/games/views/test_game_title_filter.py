@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 import pytest
+from django.test import override_settings
 from model_bakery import baker
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -93,3 +94,60 @@ def test_filter_by_title_returns_empty_for_unrelated_query(api_client: APIClient
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["count"] == 0
+
+
+@pytest.mark.django_db()
+def test_filter_by_title_serves_repeated_search_from_cache(api_client: APIClient) -> None:
+    """A repeated search returns the cached ranked IDs without matching the titles again."""
+    game = baker.make(Game, title_en="Half-Life", title_pl="Half-Life")
+    baker.make(Game, title_en="Half-Life 2", title_pl="Half-Life 2")
+    api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    # A queryset update does not invalidate the cache, so the stale match proves the cache was used.
+    Game.objects.filter(pk=game.pk).update(search_title="unrelated")
+    response = api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["count"] == 2  # noqa: PLR2004
+    assert response.json()["results"][0]["id"] == game.id
+
+
+@pytest.mark.django_db()
+def test_filter_by_title_cache_is_invalidated_on_game_change(api_client: APIClient) -> None:
+    """Saving a game invalidates the cached title searches."""
+    baker.make(Game, title_en="Half-Life", title_pl="Half-Life")
+    api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    baker.make(Game, title_en="Half-Life 2", title_pl="Half-Life 2")
+    response = api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    assert response.json()["count"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_filter_by_title_cache_key_includes_other_filters(api_client: APIClient) -> None:
+    """Searches with the same title but different filters are cached separately."""
+    game = baker.make(Game, title_en="Half-Life", title_pl="Half-Life", release_date="1998-11-19")
+    baker.make(Game, title_en="Half-Life 2", title_pl="Half-Life 2", release_date="2004-11-16")
+    api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    response = api_client.get(
+        reverse("games:games-list"),
+        {"title": "half life", "release_date_before": "2000-01-01"},
+    )
+
+    assert [result["id"] for result in response.json()["results"]] == [game.id]
+
+
+@pytest.mark.django_db()
+@override_settings(GAME_TITLE_SEARCH_CACHE_MAX_RESULTS=1)
+def test_filter_by_title_does_not_cache_broad_searches(api_client: APIClient) -> None:
+    """Searches matching more games than the limit are always matched against the titles."""
+    game = baker.make(Game, title_en="Half-Life", title_pl="Half-Life")
+    baker.make(Game, title_en="Half-Life 2", title_pl="Half-Life 2")
+    api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    Game.objects.filter(pk=game.pk).update(search_title="unrelated")
+    response = api_client.get(reverse("games:games-list"), {"title": "half life"})
+
+    assert response.json()["count"] == 1
@@ -1,15 +1,20 @@
 """Test the bulk-create endpoint on GameListViewSet."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from rest_framework import status
 from rest_framework.reverse import reverse
 
-from my_game_list.games.models import Game, GameList, GameListStatus
+from my_game_list.games.models import Game, GameList, GameListStatus, GameMedia
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+
     from rest_framework.test import APIClient
 
     from my_game_list.users.models import User as UserModel
@@ -74,3 +79,72 @@ def test_bulk_create_invalid_entry_rolls_back_all(api_client: APIClient, user_fi
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     # Only the pre-existing entry remains — the valid game2 entry was rolled back
     assert GameList.objects.filter(user=user_fixture).count() == 1
+
+
+@pytest.mark.django_db()
+def test_bulk_create_recalculates_game_stats_on_commit(
+    api_client: APIClient,
+    user_fixture: UserModel,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """The stats of the touched games are recalculated once the entries are committed."""
+    game1: Game = baker.make("games.Game")
+    game2: Game = baker.make("games.Game")
+    api_client.force_authenticate(user=user_fixture)
+    payload = [
+        {"game": game1.id, "status": GameListStatus.COMPLETED, "score": 8},
+        {"game": game2.id, "status": GameListStatus.PLAN_TO_PLAY},
+    ]
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        response = api_client.post(reverse("games:game-lists-bulk-create"), payload, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(callbacks) == 1
+    game1.stats.refresh_from_db()
+    game2.stats.refresh_from_db()
+    assert (game1.stats.score_sum, game1.stats.score_count, game1.stats.members_count) == (8, 1, 1)
+    assert (game2.stats.score_sum, game2.stats.score_count, game2.stats.members_count) == (0, 0, 1)
+
+
+@pytest.mark.django_db()
+def test_bulk_create_uses_constant_number_of_queries(api_client: APIClient, user_fixture: UserModel) -> None:
+    """The entries are validated and inserted with the same number of queries regardless of their number."""
+    media = baker.make(GameMedia, _quantity=2)
+    api_client.force_authenticate(user=user_fixture)
+    query_counts = []
+    for games_count in (1, 10):
+        payload = [
+            {"game": game.id, "status": GameListStatus.PLAYING, "owned_on": [medium.id for medium in media]}
+            for game in baker.make(Game, _quantity=games_count)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(reverse("games:game-lists-bulk-create"), payload, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [len(entry["owned_on"]) for entry in response.json()] == [2] * games_count
+        query_counts.append(len(queries))
+
+    assert query_counts[0] == query_counts[1]
+    assert GameList.objects.filter(user=user_fixture, owned_on=media[0]).count() == 11  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_bulk_create_reports_errors_per_entry(api_client: APIClient, user_fixture: UserModel) -> None:
+    """Unknown related objects and repeated games are reported for the entries they occur in."""
+    game: Game = baker.make("games.Game")
+    api_client.force_authenticate(user=user_fixture)
+    payload = [
+        {"game": game.id, "status": GameListStatus.PLAN_TO_PLAY},
+        {"game": game.id, "status": GameListStatus.COMPLETED},
+        {"game": 0, "status": GameListStatus.COMPLETED, "owned_on": [0]},
+    ]
+    response = api_client.post(reverse("games:game-lists-bulk-create"), payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()[0] == {}
+    assert set(response.json()[2]) == {"game", "owned_on"}
+    assert not GameList.objects.exists()
+
+    response = api_client.post(reverse("games:game-lists-bulk-create"), payload[:2], format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == [{}, {"non_field_errors": ["The fields game, user must make a unique set."]}]
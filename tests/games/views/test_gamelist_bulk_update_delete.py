@@ -0,0 +1,157 @@
+"""Test the bulk-update and bulk-delete endpoints on GameListViewSet."""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.models import Game, GameList, GameListStatus, GameMedia
+from my_game_list.games.stats import recalculate_game_stats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+    from my_game_list.users.models import User as UserModel
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize("url_name", ["games:game-lists-bulk-update", "games:game-lists-bulk-delete"])
+def test_bulk_change_unauthenticated(api_client: APIClient, url_name: str) -> None:
+    """Unauthenticated request returns 401."""
+    response = api_client.post(reverse(url_name), {"ids": [1]}, format="json")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db()
+def test_bulk_update_changes_entries_and_stats(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """The status of the entries is changed and their scores are cleared, the stats are recalculated on commit."""
+    game: Game = baker.make(Game)
+    entries = baker.make(GameList, user=user_fixture, status=GameListStatus.PLAN_TO_PLAY, score=7, _quantity=3)
+    other_entry = baker.make(GameList, game=game, user=user_fixture, status=GameListStatus.PLAN_TO_PLAY, score=5)
+    recalculate_game_stats([entry.game_id for entry in entries])
+    payload = {"ids": [entry.id for entry in entries], "status": GameListStatus.DROPPED, "score": None}
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        response = authenticated_api_client.post(reverse("games:game-lists-bulk-update"), payload, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [(entry["id"], entry["status_code"], entry["score"]) for entry in response.json()] == [
+        (entry.id, GameListStatus.DROPPED, None) for entry in entries
+    ]
+    assert len(callbacks) == 1
+    for entry in entries:
+        entry.game.stats.refresh_from_db()
+        assert (entry.game.stats.score_count, entry.game.stats.members_count) == (0, 1)
+    other_entry.refresh_from_db()
+    assert (other_entry.status, other_entry.score) == (GameListStatus.PLAN_TO_PLAY, 5)
+
+
+@pytest.mark.django_db()
+def test_bulk_update_of_status_keeps_stats(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Changing only the status does not touch the stats, the entries are updated with one statement."""
+    entries = baker.make(GameList, user=user_fixture, status=GameListStatus.PLAN_TO_PLAY, _quantity=5)
+    payload = {"ids": [entry.id for entry in entries], "status": GameListStatus.PLAYING}
+
+    # Validating the IDs, the savepoint, the update, the release and the updated entries with their media.
+    with django_assert_num_queries(6):
+        response = authenticated_api_client.post(reverse("games:game-lists-bulk-update"), payload, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(GameList.objects.values_list("status", flat=True)) == {GameListStatus.PLAYING}
+
+
+@pytest.mark.django_db()
+def test_bulk_update_reports_errors_per_entry(authenticated_api_client: APIClient, user_fixture: UserModel) -> None:
+    """The entries of other users and missing entries are reported under their index, and nothing is changed."""
+    entry = baker.make(GameList, user=user_fixture, status=GameListStatus.PLAN_TO_PLAY)
+    other_user_entry = baker.make(GameList, status=GameListStatus.PLAN_TO_PLAY)
+    payload = {"ids": [entry.id, other_user_entry.id, 0], "status": GameListStatus.DROPPED}
+
+    response = authenticated_api_client.post(reverse("games:game-lists-bulk-update"), payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "ids": {
+            "1": [f"Game list entry {other_user_entry.id} does not exist."],
+            "2": ["Game list entry 0 does not exist."],
+        },
+    }
+    assert set(GameList.objects.values_list("status", flat=True)) == {GameListStatus.PLAN_TO_PLAY}
+
+
+@pytest.mark.django_db()
+def test_bulk_update_requires_changes(authenticated_api_client: APIClient, user_fixture: UserModel) -> None:
+    """At least one field to change is required."""
+    entry = baker.make(GameList, user=user_fixture)
+
+    response = authenticated_api_client.post(
+        reverse("games:game-lists-bulk-update"),
+        {"ids": [entry.id]},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"non_field_errors": ["At least one field to change is required."]}
+
+
+@pytest.mark.django_db()
+def test_bulk_delete_removes_entries_and_updates_stats(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    django_capture_on_commit_callbacks: Callable[..., AbstractContextManager[list[Callable[[], Any]]]],
+) -> None:
+    """The entries with their owned on media are deleted and the stats of their games are recalculated."""
+    media = baker.make(GameMedia, _quantity=2)
+    entries = baker.make(GameList, user=user_fixture, score=8, owned_on=media, _quantity=3)
+    kept_entry = baker.make(GameList, user=user_fixture)
+    other_user_entry = baker.make(GameList, game=entries[0].game, score=6)
+    recalculate_game_stats([entry.game_id for entry in entries])
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        response = authenticated_api_client.post(
+            reverse("games:game-lists-bulk-delete"),
+            {"ids": [entry.id for entry in entries]},
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert len(callbacks) == 1
+    assert set(GameList.objects.values_list("id", flat=True)) == {kept_entry.id, other_user_entry.id}
+    assert not GameList.owned_on.through.objects.exists()
+    stats = entries[0].game.stats
+    stats.refresh_from_db()
+    assert (stats.score_sum, stats.score_count, stats.members_count) == (6, 1, 1)
+    stats = entries[1].game.stats
+    stats.refresh_from_db()
+    assert stats.members_count == 0
+
+
+@pytest.mark.django_db()
+def test_bulk_delete_reports_errors_per_entry(authenticated_api_client: APIClient, user_fixture: UserModel) -> None:
+    """Nothing is deleted when any entry does not belong to the user."""
+    entry = baker.make(GameList, user=user_fixture)
+    other_user_entry = baker.make(GameList)
+
+    response = authenticated_api_client.post(
+        reverse("games:game-lists-bulk-delete"),
+        {"ids": [other_user_entry.id, entry.id]},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"ids": {"0": [f"Game list entry {other_user_entry.id} does not exist."]}}
+    assert GameList.objects.count() == 2  # noqa: PLR2004
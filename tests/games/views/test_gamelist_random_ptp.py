@@ -1,9 +1,10 @@
 """Test the random ptp endpoint for GameList."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from django.contrib.auth import get_user_model
+from drf_spectacular.generators import SchemaGenerator
 from model_bakery import baker
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -11,6 +12,7 @@
 from my_game_list.games.models import GameList, GameListStatus
 
 if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
     from rest_framework.test import APIClient
 
     from my_game_list.users.models import User as UserModel
@@ -47,3 +49,60 @@ def test_random_ptp_not_found(
     response = api_client.get(reverse("games:game-lists-random-ptp"))
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_random_ptp_count_returns_distinct_suggestions(
+    api_client: APIClient,
+    user_fixture: UserModel,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The count mode returns distinct Plan to Play entries of the user, with a constant number of queries."""
+    api_client.force_authenticate(user=user_fixture)
+    ptp_entries: list[GameList] = baker.make(
+        "games.GameList",
+        user=user_fixture,
+        status=GameListStatus.PLAN_TO_PLAY,
+        _quantity=5,
+    )
+    baker.make("games.GameList", user=user_fixture, status=GameListStatus.COMPLETED)
+    baker.make("games.GameList", status=GameListStatus.PLAN_TO_PLAY)
+    ptp_ids = {entry.id for entry in ptp_entries}
+
+    # The count, the entries at the sampled offsets with their games and their owned on media.
+    with django_assert_num_queries(3):
+        response = api_client.get(reverse("games:game-lists-random-ptp"), {"count": 3})
+
+    assert response.status_code == status.HTTP_200_OK
+    suggested_ids = [entry["id"] for entry in response.json()]
+    assert len(suggested_ids) == len(set(suggested_ids)) == 3  # noqa: PLR2004
+    assert set(suggested_ids) <= ptp_ids
+
+    response = api_client.get(reverse("games:game-lists-random-ptp"), {"count": 25})
+
+    assert {entry["id"] for entry in response.json()} == ptp_ids
+
+
+@pytest.mark.django_db()
+def test_random_ptp_rejects_invalid_count(api_client: APIClient, user_fixture: UserModel) -> None:
+    """The count must be between 1 and 25."""
+    api_client.force_authenticate(user=user_fixture)
+
+    for count in (0, 26, "many"):
+        response = api_client.get(reverse("games:game-lists-random-ptp"), {"count": count})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_random_ptp_schema_documents_single_entry_and_list() -> None:
+    """The schema of the response is a single entry or a list of the entries requested with `count`."""
+    schema: dict[str, Any] = SchemaGenerator().get_schema(request=None, public=True)  # type: ignore[no-untyped-call]
+
+    responses = schema["paths"][reverse("games:game-lists-random-ptp")]["get"]["responses"]
+    assert responses["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/RandomPlanToPlay",
+    }
+    assert schema["components"]["schemas"]["RandomPlanToPlay"]["oneOf"] == [
+        {"$ref": "#/components/schemas/GameList"},
+        {"type": "array", "items": {"$ref": "#/components/schemas/GameList"}},
+    ]
+    assert "404" in responses
@@ -0,0 +1,86 @@
+"""Tests for the base filters of dictionary models."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django import forms as django_forms
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.cache import invalidate_dictionaries_caches
+from my_game_list.games.models import Game, Genre
+from my_game_list.my_game_list.filters import BilingualModelMultipleChoiceField
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db()
+def test_bilingual_field_resolves_names_without_queries(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """The English and Polish names are resolved case-insensitively from the cached lookup."""
+    action = baker.make(Genre, name_en="Action", name_pl="Akcja")
+    shooter = baker.make(Genre, name_en="Shooter", name_pl="Strzelanka")
+    field = BilingualModelMultipleChoiceField(queryset=Genre.objects.all())
+
+    assert list(field.clean(["action"])) == [action.pk]
+
+    with django_assert_num_queries(0):
+        assert list(field.clean(["AKCJA", "Strzelanka"])) == [action.pk, shooter.pk]
+
+
+@pytest.mark.django_db()
+def test_bilingual_field_rejects_unknown_names() -> None:
+    """An unknown name is an invalid choice."""
+    baker.make(Genre, name_en="Action", name_pl="Akcja")
+    field = BilingualModelMultipleChoiceField(queryset=Genre.objects.all())
+
+    with pytest.raises(django_forms.ValidationError):
+        field.clean(["Racing"])
+
+
+@pytest.mark.django_db()
+def test_bilingual_field_lookup_is_invalidated_by_changes() -> None:
+    """Saving or deleting a dictionary object invalidates the cached lookup."""
+    genre = baker.make(Genre, name_en="Action", name_pl="Akcja")
+    field = BilingualModelMultipleChoiceField(queryset=Genre.objects.all())
+    assert list(field.clean(["Action"])) == [genre.pk]
+
+    genre.name = "Adventure"
+    genre.save()
+    assert list(field.clean(["Adventure"])) == [genre.pk]
+
+    genre.delete()
+    with pytest.raises(django_forms.ValidationError):
+        field.clean(["Adventure"])
+
+
+@pytest.mark.django_db()
+def test_bilingual_field_lookup_is_invalidated_after_import() -> None:
+    """Writes bypassing the signals, like the IGDB import, are visible after invalidating the dictionaries."""
+    genre = baker.make(Genre, name_en="Action", name_pl="Akcja")
+    field = BilingualModelMultipleChoiceField(queryset=Genre.objects.all())
+    assert list(field.clean(["Action"])) == [genre.pk]
+
+    Genre.objects.filter(pk=genre.pk).update(name_en="Adventure")
+    with pytest.raises(django_forms.ValidationError):
+        field.clean(["Adventure"])
+
+    invalidate_dictionaries_caches()
+    assert list(field.clean(["Adventure"])) == [genre.pk]
+
+
+@pytest.mark.django_db()
+def test_games_are_filtered_by_dictionary_names(api_client: APIClient) -> None:
+    """The games list is filtered by the English or Polish names of the genres."""
+    action = baker.make(Genre, name_en="Action", name_pl="Akcja")
+    shooter = baker.make(Genre, name_en="Shooter", name_pl="Strzelanka")
+    action_game = baker.make(Game, genres=[action])
+    shooter_game = baker.make(Game, genres=[shooter])
+    baker.make(Game)
+
+    response = api_client.get(reverse("games:games-list"), {"genres": ["akcja", "Shooter"]})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {game["id"] for game in response.json()["results"]} == {action_game.id, shooter_game.id}
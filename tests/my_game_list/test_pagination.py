@@ -0,0 +1,208 @@
+"""Tests for the cached count pagination."""
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from my_game_list.games.cards import refresh_game_cards
+from my_game_list.games.models import Game, GameCard, GameList
+from my_game_list.my_game_list.pagination import CachedCountPagination
+from my_game_list.notifications.utils import notify_send
+
+if TYPE_CHECKING:
+    from rest_framework.test import APIClient
+
+    from my_game_list.users.models import User as UserModel
+
+
+def _get_list(api_client: APIClient, url: str, params: dict[str, str] | None = None) -> dict[str, Any]:
+    """Get a list endpoint and return its payload."""
+    response = api_client.get(url, params or {})
+    assert response.status_code == status.HTTP_200_OK
+    data: dict[str, Any] = response.json()
+    return data
+
+
+@pytest.mark.django_db()
+def test_count_is_served_from_cache(api_client: APIClient) -> None:
+    """The count is cached, the writes bypassing the signals are visible with the exact count."""
+    baker.make(Game, _quantity=2)
+    url = reverse("games:games-list")
+
+    assert _get_list(api_client, url)["count"] == 2  # noqa: PLR2004
+
+    # The bulk create does not send the signals invalidating the cached counts, nor does the refresh of the cards.
+    Game.objects.bulk_create([baker.prepare(Game)])
+    refresh_game_cards()
+
+    data = _get_list(api_client, url)
+    assert data["count"] == 2  # noqa: PLR2004
+    assert data["count_is_exact"] is True
+    assert _get_list(api_client, url, {"exact_count": "true"})["count"] == 3  # noqa: PLR2004
+    # The exact count refreshes the cached count.
+    assert _get_list(api_client, url)["count"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_count_is_cached_per_filters(api_client: APIClient) -> None:
+    """The lists with other filters have their own cached counts, the page does not matter."""
+    baker.make(Game, title="Zelda", _quantity=2)
+    baker.make(Game, title="Mario")
+    url = reverse("games:games-list")
+
+    assert _get_list(api_client, url)["count"] == 3  # noqa: PLR2004
+    assert _get_list(api_client, url, {"title": "Zelda"})["count"] == 2  # noqa: PLR2004
+    assert _get_list(api_client, url, {"page": "1"})["count"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_count_is_invalidated_by_changes(authenticated_api_client: APIClient, user_fixture: UserModel) -> None:
+    """Creating and deleting entries invalidates the cached counts."""
+    url = reverse("games:game-lists-list")
+    baker.make(GameList, user=user_fixture)
+
+    assert _get_list(authenticated_api_client, url)["count"] == 1
+
+    entry = baker.make(GameList, user=user_fixture)
+    assert _get_list(authenticated_api_client, url)["count"] == 2  # noqa: PLR2004
+
+    entry.delete()
+    assert _get_list(authenticated_api_client, url)["count"] == 1
+
+
+@pytest.mark.django_db()
+def test_count_is_scoped_to_owner(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    admin_user_fixture: UserModel,
+) -> None:
+    """The changes of the entries of a user keep the cached counts of the lists of the other users."""
+    url = reverse("games:game-lists-list")
+    user_params = {"user": str(user_fixture.pk)}
+    baker.make(GameList, user=user_fixture)
+    assert _get_list(authenticated_api_client, url, user_params)["count"] == 1
+    assert _get_list(authenticated_api_client, url)["count"] == 1
+
+    # The bulk create does not send the signals invalidating the cached counts.
+    GameList.objects.bulk_create([baker.prepare(GameList, user=user_fixture, _save_related=True)])
+    baker.make(GameList, user=admin_user_fixture)
+
+    assert _get_list(authenticated_api_client, url, user_params)["count"] == 1
+    assert _get_list(authenticated_api_client, url)["count"] == 3  # noqa: PLR2004
+
+    baker.make(GameList, user=user_fixture)
+    assert _get_list(authenticated_api_client, url, user_params)["count"] == 3  # noqa: PLR2004
+
+
+@override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=0)
+@pytest.mark.django_db()
+def test_count_of_owner_list_is_not_estimated(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    admin_user_fixture: UserModel,
+) -> None:
+    """The lists scoped to an owner are counted exactly, without asking the planner."""
+    notify_send(sender=admin_user_fixture, recipient=user_fixture, verb="first")
+
+    with patch.object(CachedCountPagination, "estimate_count") as estimate_count:
+        data = _get_list(authenticated_api_client, reverse("notification-list"))
+
+    assert (data["count"], data["count_is_exact"]) == (1, True)
+    estimate_count.assert_not_called()
+
+
+@pytest.mark.django_db()
+def test_count_of_public_list_is_shared_by_users(api_client: APIClient, user_fixture: UserModel) -> None:
+    """The count of a list showing the same objects to every user is cached once for all the users."""
+    baker.make(Game, _quantity=2)
+    url = reverse("games:games-list")
+    assert _get_list(api_client, url)["count"] == 2  # noqa: PLR2004
+
+    # The bulk create and the refresh of the cards do not invalidate the cached counts.
+    Game.objects.bulk_create([baker.prepare(Game)])
+    refresh_game_cards()
+    api_client.force_authenticate(user_fixture)
+
+    assert _get_list(api_client, url)["count"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_count_is_invalidated_by_mark_all_as_read(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    admin_user_fixture: UserModel,
+) -> None:
+    """Marking all the notifications as read invalidates the counts of the unread notifications."""
+    notify_send(sender=admin_user_fixture, recipient=user_fixture, verb="first")
+    notify_send(sender=admin_user_fixture, recipient=user_fixture, verb="second")
+    url = reverse("notification-list")
+
+    assert _get_list(authenticated_api_client, url, {"unread": "true"})["count"] == 2  # noqa: PLR2004
+
+    response = authenticated_api_client.post(reverse("notification-mark-all-as-read"))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    assert _get_list(authenticated_api_client, url, {"unread": "true"})["count"] == 0
+
+
+@override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=0)
+@pytest.mark.django_db()
+def test_unfiltered_count_is_estimated_from_table_statistics(api_client: APIClient) -> None:
+    """The count of an unfiltered list is the number of tuples of the table in the statistics."""
+    baker.make(Game, _quantity=3)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {GameCard._meta.db_table}")  # noqa: SLF001
+
+    data = _get_list(api_client, reverse("games:games-list"))
+
+    assert data["count"] == 3  # noqa: PLR2004
+    assert data["count_is_exact"] is False
+
+
+@override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=0)
+@pytest.mark.django_db()
+def test_filtered_count_is_estimated_by_planner(api_client: APIClient) -> None:
+    """The count of a filtered list is the row estimate of the planner, unless the exact count is requested."""
+    baker.make(Game, title="Zelda", _quantity=2)
+    url = reverse("games:games-list")
+
+    estimate = CachedCountPagination.estimate_count(GameCard.objects.filter(title="Zelda"))
+    assert estimate is not None
+
+    data = _get_list(api_client, url, {"title": "Zelda"})
+    assert data["count_is_exact"] is False
+    assert isinstance(data["count"], int)
+
+    data = _get_list(api_client, url, {"title": "Zelda", "exact_count": "true"})
+    assert data["count"] == 2  # noqa: PLR2004
+    assert data["count_is_exact"] is True
+
+
+@override_settings(PAGINATION_ESTIMATED_COUNT_THRESHOLD=0)
+@pytest.mark.django_db()
+@pytest.mark.parametrize("estimate", [1, 100])
+def test_stale_estimate_does_not_decide_pages(api_client: APIClient, estimate: int) -> None:
+    """The estimated count is only reported, the pages and the next links come from the fetched games."""
+    baker.make(Game, _quantity=5)
+    url = reverse("games:games-list")
+
+    with (
+        patch.object(CachedCountPagination, "page_size", 2),
+        patch.object(CachedCountPagination, "estimate_count", return_value=estimate),
+    ):
+        second_page = _get_list(api_client, url, {"page": "2"})
+        last_page = _get_list(api_client, url, {"page": "3"})
+        response = api_client.get(url, {"page": "4"})
+
+    assert (second_page["count"], second_page["count_is_exact"]) == (estimate, False)
+    assert second_page["next"] is not None
+    assert len(last_page["results"]) == 1
+    assert last_page["next"] is None
+    assert last_page["previous"] is not None
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,51 @@
+"""Tests for the command reporting the usage of the database indexes."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from my_game_list.games.models import GameList
+
+
+@pytest.mark.django_db()
+def test_report_index_usage_of_model() -> None:
+    """The composite indexes of the game list are reported with their usage."""
+    output = StringIO()
+
+    call_command("report_index_usage", "games.GameList", stdout=output)
+
+    report = output.getvalue()
+    for index in GameList._meta.indexes:  # noqa: SLF001
+        assert f"games_gamelist.{index.name}: " in report
+    assert "unique_game_user_in_game_list" in report
+    assert "of 1 tables." in report
+
+
+@pytest.mark.django_db()
+def test_report_unused_indexes_skips_unique_indexes() -> None:
+    """The unique indexes enforce the constraints, so they are not reported as unused."""
+    output = StringIO()
+
+    call_command("report_index_usage", "games.GameList", "--unused", stdout=output)
+
+    report = output.getvalue()
+    assert "unique_game_user_in_game_list" not in report
+    assert "games_gamelist_pkey" not in report
+
+
+@pytest.mark.django_db()
+def test_report_index_usage_of_all_models() -> None:
+    """All the tables of the project are reported by default."""
+    output = StringIO()
+
+    call_command("report_index_usage", stdout=output)
+
+    assert "games_gamelist.games_gamelist_user_status_idx" in output.getvalue()
+    assert "users_user" in output.getvalue()
+
+
+def test_report_index_usage_of_unknown_model() -> None:
+    """An unknown model is rejected."""
+    with pytest.raises(CommandError, match=r"Unknown model: games\.Unknown\."):
+        call_command("report_index_usage", "games.Unknown")